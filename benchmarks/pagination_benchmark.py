@@ -0,0 +1,100 @@
+"""
+Measures the per-item cost of paging through a large EoX result set.
+
+The session is replaced with an in-memory stand in serving synthetic
+pages, so only the SDK's pagination overhead is measured.  The time per
+item for the first and the last pages of the pull should be about the
+same, no matter how many pages are requested.
+
+    python benchmarks/pagination_benchmark.py [pages] [records per page]
+"""
+
+import sys
+import time
+
+from ciscosupportsdk.api.eox import EoxApi
+from ciscosupportsdk.retry import RetryPolicy
+
+
+class SyntheticSession(object):
+    page_workers = 0
+    ordered_pages = True
+    prefetch_pages = 0
+    retry_policy = RetryPolicy()
+
+    def __init__(self, pages: int, page_records: int) -> None:
+        self.pages = pages
+        self.page_records = page_records
+
+    def _get(
+        self,
+        path: str,
+        params: dict,
+        deadline: float = None,
+        use_cache: bool = True,
+    ) -> dict:
+        page_index = int(path.split("/")[6])
+        date = {"value": "2022-01-01", "dateFormat": "YYYY-MM-DD"}
+        record = {
+            "EOLProductID": "PID",
+            "ProductIDDescription": "",
+            "ProductBulletinNumber": "",
+            "LinkToProductBulletinURL": "",
+            "EOXExternalAnnouncementDate": date,
+            "EndOfSaleDate": date,
+            "EndOfSWMaintenanceReleases": date,
+            "EndOfRoutineFailureAnalysisDate": date,
+            "EndOfServiceContractRenewal": date,
+            "LastDateOfSupport": date,
+            "EndOfSvcAttachDate": date,
+            "UpdatedTimeStamp": date,
+            "EOXMigrationDetails": {
+                "PIDActiveFlag": "Y",
+                "MigrationInformation": "",
+                "MigrationOption": "",
+                "MigrationProductId": "",
+                "MigrationProductName": "",
+                "MigrationStrategy": "",
+                "MigrationProductInfoURL": "",
+            },
+            "EOXInputType": "ShowEOXByDates",
+            "EOXInputValue": "",
+        }
+        return {
+            "PaginationResponseRecord": {
+                "PageIndex": page_index,
+                "LastIndex": self.pages,
+                "TotalRecords": self.pages * self.page_records,
+                "PageRecords": self.page_records,
+            },
+            "EOXRecord": [record] * self.page_records,
+        }
+
+
+def run(pages: int, page_records: int) -> None:
+    eox = EoxApi(SyntheticSession(pages, page_records))
+    timings = []
+    start = last = time.perf_counter()
+    for count, _ in enumerate(
+        eox.get_by_dates("2000-01-01", "2030-01-01", []), 1
+    ):
+        if count % page_records == 0:
+            now = time.perf_counter()
+            timings.append(now - last)
+            last = now
+    total = time.perf_counter() - start
+
+    window = max(1, pages // 10)
+    first = sum(timings[:window]) / (window * page_records)
+    final = sum(timings[-window:]) / (window * page_records)
+    print(f"pages: {pages}, records: {pages * page_records}")
+    print(f"total: {total:.3f}s")
+    print(f"first {window} pages: {first * 1e6:.2f}us per item")
+    print(f"last {window} pages: {final * 1e6:.2f}us per item")
+    print(f"ratio last/first: {final / first:.2f}")
+
+
+if __name__ == "__main__":
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    page_records = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    run(pages, page_records)
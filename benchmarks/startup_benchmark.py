@@ -0,0 +1,64 @@
+"""
+Measures the cold start cost of the SDK.
+
+Times importing the package in a fresh interpreter, then constructing a
+CiscoSupportAPI and touching each of its APIs.  No request is sent, so
+constructing the client should take well under a millisecond and make no
+calls to the OAuth token endpoint.
+
+    python benchmarks/startup_benchmark.py [rounds]
+"""
+
+import subprocess
+import sys
+import time
+
+IMPORT = (
+    "import time; start = time.perf_counter(); "
+    "import ciscosupportsdk.api; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_time(rounds: int) -> float:
+    timings = [
+        float(subprocess.check_output([sys.executable, "-c", IMPORT]))
+        for _ in range(rounds)
+    ]
+    return min(timings)
+
+
+def construction_time(rounds: int) -> tuple[float, float]:
+    from ciscosupportsdk.api import CiscoSupportAPI
+
+    construct = access = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        api = CiscoSupportAPI("DUMMY", "DUMMY")
+        construct += time.perf_counter() - start
+        start = time.perf_counter()
+        for name in (
+            "asd",
+            "bug",
+            "case",
+            "eox",
+            "product_information",
+            "serial_information",
+            "suggestion",
+            "rma",
+        ):
+            getattr(api, name)
+        access += time.perf_counter() - start
+    return construct / rounds, access / rounds
+
+
+def run(rounds: int) -> None:
+    print(f"import: {import_time(min(rounds, 10)) * 1e3:.1f}ms (best)")
+    construct, access = construction_time(rounds)
+    print(f"construct CiscoSupportAPI: {construct * 1e6:.1f}us")
+    print(f"first access of every API: {access * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    run(rounds)
@@ -0,0 +1,73 @@
+from functools import cached_property
+
+from .apisession import AsyncApiSession
+from .bug import AsyncBugApi
+from .case import AsyncCaseApi
+from .eox import AsyncEoxApi
+from .productinformation import AsyncProductInformationApi
+from .serialnumbertoinformation import AsyncSerialNumberToInformationAPI
+from .serviceorderreturn import AsyncServiceOrderReturnApi
+from .softwaresuggestion import AsyncSoftwareSuggestionApi
+
+
+class AsyncCiscoSupportAPI(object):
+    """Cisco Support API wrapper for asyncio.
+
+    Mirrors :class:`ciscosupportsdk.api.CiscoSupportAPI`, every list
+    returning method is an async generator yielding the same pydantic
+    models.  Use it as an async context manager so the connection pool
+    is closed when you are done::
+
+        async with AsyncCiscoSupportAPI(key, secret) as api:
+            async for item in api.eox.get_by_product_ids(["WS-C3850-48XS-E"]):
+                print(item.eol_product_id)
+    """
+
+    def __init__(self, client_id: str, client_secret: str, **session_kwargs):
+        self._session = AsyncApiSession(
+            client_id, client_secret, **session_kwargs
+        )
+
+    # the rest of the APIs are set up on first use
+    @cached_property
+    def bug(self) -> AsyncBugApi:
+        return AsyncBugApi(self._session)
+
+    @cached_property
+    def case(self) -> AsyncCaseApi:
+        return AsyncCaseApi(self._session)
+
+    @cached_property
+    def eox(self) -> AsyncEoxApi:
+        return AsyncEoxApi(self._session)
+
+    @cached_property
+    def product_information(self) -> AsyncProductInformationApi:
+        return AsyncProductInformationApi(self._session)
+
+    @cached_property
+    def serial_information(self) -> AsyncSerialNumberToInformationAPI:
+        return AsyncSerialNumberToInformationAPI(self._session)
+
+    @cached_property
+    def suggestion(self) -> AsyncSoftwareSuggestionApi:
+        return AsyncSoftwareSuggestionApi(self._session)
+
+    @cached_property
+    def rma(self) -> AsyncServiceOrderReturnApi:
+        return AsyncServiceOrderReturnApi(self._session)
+
+    @property
+    def service_order_return(self) -> AsyncServiceOrderReturnApi:
+        # just in case
+        return self.rma
+
+    async def __aenter__(self) -> "AsyncCiscoSupportAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the underlying session."""
+        await self._session.close()
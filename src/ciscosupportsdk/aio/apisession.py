@@ -0,0 +1,201 @@
+import asyncio
+from typing import AsyncIterator, Type
+
+from pydantic import BaseModel
+
+from ciscosupportsdk.apisession import (
+    BASE_URL,
+    OAUTH2_URL,
+    ApiError,
+    ResponseType,
+)
+from ciscosupportsdk.cache import ResponseCache, cache_key
+from ciscosupportsdk.models.common import CamelCaseApi
+from ciscosupportsdk.pagination import Page
+from ciscosupportsdk.ratelimit import RateLimiter, parse_retry_after
+
+try:
+    from authlib.integrations.httpx_client import AsyncOAuth2Client
+except ImportError:  # pragma: nocover
+    AsyncOAuth2Client = None
+
+
+class AsyncApiSession(object):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        base_url: str = BASE_URL,
+        token_url: str = OAUTH2_URL,
+        token: dict = None,
+        rate_limiter: RateLimiter = None,
+        throttle_retries: int = 3,
+        cache: ResponseCache = None,
+        **client_kwargs,
+    ) -> None:
+        """Instances created help manage your asyncio API Session.
+
+        Requires the optional ``httpx`` dependency, install it with
+        ``pip install ciscosupportsdk[async]``.  The OAuth token is fetched
+        on the first request made through the session.
+
+        Args:
+            client_id(basestring): your client id to access the API
+            client_secret(basestring): your client secret to access the API
+            base_url(basestring): root of the support API service
+            token_url(basestring): OAuth2 token endpoint
+            rate_limiter(RateLimiter): paces requests per API family, can
+                be shared with other sessions
+            throttle_retries(int): times a request throttled with a 429 is
+                retried after waiting out its Retry-After
+            cache(ResponseCache): caches responses for the TTL of their API
+                family, can be shared with other sessions
+            client_kwargs: passed through to the ``httpx.AsyncClient``
+        """
+        if AsyncOAuth2Client is None:
+            raise ImportError(
+                "AsyncApiSession requires httpx, install it with "
+                "'pip install ciscosupportsdk[async]'."
+            )
+        self.base_url = base_url
+        self.token_url = token_url
+        self.rate_limiter = rate_limiter
+        self.throttle_retries = throttle_retries
+        self.cache = cache
+        self.client = AsyncOAuth2Client(
+            client_id, client_secret, token=token, **client_kwargs
+        )
+        self._token_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncApiSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the underlying connection pool."""
+        await self.client.aclose()
+
+    async def _check_token(self):
+        # only one coroutine fetches the token, the rest wait for it
+        async with self._token_lock:
+            token = self.client.token
+            if not token or token.is_expired():
+                await self.client.fetch_token(
+                    self.token_url, grant_type="client_credentials"
+                )
+
+    async def _get(self, path: str, params: dict) -> dict:
+        """Gets a response from the cache, or from the service endpoint."""
+        ttl = self.cache.ttl(path) if self.cache is not None else None
+        if ttl:
+            key = cache_key(path, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        response = await self._send(path, params)
+        if ttl:
+            self.cache.set(key, response, ttl)
+        return response
+
+    async def _send(self, path: str, params: dict) -> dict:
+        """Sends an HTTP get request to the service endpoint."""
+        request_url = f"{self.base_url}{path}"
+        # unlike requests, httpx sends empty values for None
+        params = {k: v for k, v in params.items() if v is not None}
+        throttled = 0
+        while True:
+            # check and refresh the token if needed
+            await self._check_token()
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve(path))
+            response = await self.client.get(request_url, params=params)
+            if response.status_code == 200:
+                return response.json()
+            if (
+                response.status_code == 429
+                and throttled < self.throttle_retries
+            ):
+                throttled += 1
+                retry_after = parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+                if (
+                    self.rate_limiter is not None
+                    and self.rate_limiter.bucket(path) is not None
+                ):
+                    self.rate_limiter.throttled(path, retry_after)
+                else:
+                    await asyncio.sleep(retry_after)
+                continue
+            msg: str = f"{response.status_code}: {response.content}"
+            raise ApiError(
+                msg,
+                response.status_code,
+                throttled + 1,
+                throttled=response.status_code == 429,
+            )
+
+    async def get_result(
+        self,
+        response_type: Type[ResponseType],
+        path: str,
+        query_params: dict = {},
+    ) -> BaseModel:
+        """
+        Used when an API response returns a single object and there is
+        no need to use a generator.
+        """
+        json = await self._get(path, query_params)
+        response = response_type(**json)
+        return response.items
+
+    async def enumerate_results(
+        self,
+        response_type: Type[ResponseType],
+        path: str,
+        query_params: dict = {},
+        page_index: int = 1,
+        paging: bool = True,
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Used when an API response returns a list of objects.
+
+        This method is an async generator in support pagination of
+        potentially large amounts of data to process.
+        """
+        while page_index is not None:
+            page = await self.get_page(
+                response_type, path, query_params, page_index, paging
+            )
+            for item in page.items:
+                yield item
+            page_index = page.next_index()
+
+    async def get_page(
+        self,
+        response_type: Type[ResponseType],
+        path: str,
+        query_params: dict = {},
+        page_index: int = 1,
+        paging: bool = True,
+    ) -> Page:
+        """Fetches and parses a single page of a list response."""
+        query_params = {**query_params}
+        if issubclass(response_type, CamelCaseApi):
+            query_params["pageIndex"] = page_index
+        else:
+            query_params["page_index"] = page_index
+
+        json = await self._get(path, query_params)
+        if "APIError" in json:  # houston, we have a problem!
+            raise ApiError(json)
+
+        response = response_type(**json)
+        if not paging:
+            return Page(response.items)
+        return Page.from_record(
+            response.items,
+            getattr(response, "pagination_response_record", None),
+        )
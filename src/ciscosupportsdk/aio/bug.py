@@ -0,0 +1,214 @@
+from typing import AsyncIterator
+
+from ciscosupportsdk.aio.apisession import AsyncApiSession
+from ciscosupportsdk.api.bug import SERVICE_BASE_URL
+from ciscosupportsdk.models.bug import (
+    Bug,
+    DateModified,
+    ListOfBugs,
+    Severity,
+    SortBy,
+    Status,
+)
+from ciscosupportsdk.validate import CheckSize
+
+
+class AsyncBugApi(object):
+    """
+    Asyncio version of :class:`ciscosupportsdk.api.bug.BugApi`.
+    """
+
+    def __init__(self, session: AsyncApiSession) -> None:
+        self._session = session
+
+    def _params(
+        self,
+        status: Status,
+        modified_date: DateModified,
+        severity: Severity,
+        sort_by: SortBy,
+    ) -> dict:
+        return {
+            "status": status,
+            "modified_date": modified_date,
+            "severity": severity,
+            "sort_by": sort_by,
+        }
+
+    @CheckSize("bug_ids", 5)
+    async def get_bug_details(self, bug_ids: list[str]) -> AsyncIterator[Bug]:
+        """
+        Returns detailed information for the specified bug ID or IDs.
+
+        See :meth:`ciscosupportsdk.api.bug.BugApi.get_bug_details`.
+        """
+        path = f"{SERVICE_BASE_URL}/bug_ids/" f"{','.join(bug_ids)}"
+        async for item in self._session.enumerate_results(
+            ListOfBugs, path, paging=False
+        ):
+            yield item
+
+    async def get_bugs_by_product_id(
+        self,
+        base_pid: str,
+        status: Status = None,
+        modified_date: DateModified = None,
+        severity: Severity = None,
+        sort_by: SortBy = None,
+    ) -> AsyncIterator[Bug]:
+        """
+        Returns detailed information for the bugs associated with the
+        specified base product ID.
+
+        See :meth:`ciscosupportsdk.api.bug.BugApi.get_bugs_by_product_id`.
+        """
+        path = f"{SERVICE_BASE_URL}/products/product_id/{base_pid}"
+        params = self._params(status, modified_date, severity, sort_by)
+        async for item in self._session.enumerate_results(
+            ListOfBugs, path, params
+        ):
+            yield item
+
+    @CheckSize("software_releases", 75)
+    async def get_bugs_by_product_id_and_release(
+        self,
+        base_pid: str,
+        software_releases: list[str],
+        status: Status = None,
+        modified_date: DateModified = None,
+        severity: Severity = None,
+        sort_by: SortBy = None,
+    ) -> AsyncIterator[Bug]:
+        """
+        Returns detailed information for the bugs associated with the
+        specified base product ID and software releases.
+
+        See
+        :meth:`ciscosupportsdk.api.bug.BugApi.get_bugs_by_product_id_and_release`.
+        """  # noqa: E501
+        path = (
+            f"{SERVICE_BASE_URL}/products/product_id/{base_pid}"
+            f"/software_releases/{','.join(software_releases)}"
+        )
+        params = self._params(status, modified_date, severity, sort_by)
+        async for item in self._session.enumerate_results(
+            ListOfBugs, path, params
+        ):
+            yield item
+
+    async def get_bugs_by_keyword(
+        self,
+        keyword: str,
+        status: Status = None,
+        modified_date: DateModified = None,
+        severity: Severity = None,
+        sort_by: SortBy = None,
+    ) -> AsyncIterator[Bug]:
+        """
+        Returns detailed information for the bugs associated with the
+        specified keyword.
+
+        See :meth:`ciscosupportsdk.api.bug.BugApi.get_bugs_by_keyword`.
+        """
+        path = f"{SERVICE_BASE_URL}/keyword/{keyword}"
+        params = self._params(status, modified_date, severity, sort_by)
+        async for item in self._session.enumerate_results(
+            ListOfBugs, path, params
+        ):
+            yield item
+
+    @CheckSize("affected_releases", 75)
+    async def get_bugs_by_product_and_affected_release(
+        self,
+        product_series: str,
+        affected_releases: list[str],
+        status: Status = None,
+        modified_date: DateModified = None,
+        severity: Severity = None,
+        sort_by: SortBy = None,
+    ) -> AsyncIterator[Bug]:
+        """
+        Returns detailed information for the bugs associated with the specified
+        hardware product series and affected software release or releases.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/product_series/{product_series}"
+            f"/affected_releases/{','.join(affected_releases)}"
+        )
+        params = self._params(status, modified_date, severity, sort_by)
+        async for item in self._session.enumerate_results(
+            ListOfBugs, path, params
+        ):
+            yield item
+
+    @CheckSize("fixed_in_releases", 75)
+    async def get_bugs_by_product_and_fixed_release(
+        self,
+        product_series: str,
+        fixed_in_releases: list[str],
+        status: Status = None,
+        modified_date: DateModified = None,
+        severity: Severity = None,
+        sort_by: SortBy = None,
+    ) -> AsyncIterator[Bug]:
+        """
+        Returns detailed information for the bugs associated with the specified
+        hardware product series and fixed software release or releases.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/product_series/{product_series}"
+            f"/fixed_in_releases/{','.join(fixed_in_releases)}"
+        )
+        params = self._params(status, modified_date, severity, sort_by)
+        async for item in self._session.enumerate_results(
+            ListOfBugs, path, params
+        ):
+            yield item
+
+    @CheckSize("affected_releases", 75)
+    async def get_bugs_by_product_name_and_affected_release(
+        self,
+        product_name: str,
+        affected_releases: list[str],
+        status: Status = None,
+        modified_date: DateModified = None,
+        severity: Severity = None,
+        sort_by: SortBy = None,
+    ) -> AsyncIterator[Bug]:
+        """
+        Returns detailed information for the bugs associated with the
+        specified product name and affected software release or releases.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/product_name/{product_name}"
+            f"/affected_releases/{','.join(affected_releases)}"
+        )
+        params = self._params(status, modified_date, severity, sort_by)
+        async for item in self._session.enumerate_results(
+            ListOfBugs, path, params
+        ):
+            yield item
+
+    @CheckSize("fixed_in_releases", 75)
+    async def get_bugs_by_product_name_and_fixed_release(
+        self,
+        product_name: str,
+        fixed_in_releases: list[str],
+        status: Status = None,
+        modified_date: DateModified = None,
+        severity: Severity = None,
+        sort_by: SortBy = None,
+    ) -> AsyncIterator[Bug]:
+        """
+        Returns detailed information for the bugs associated with the
+        specified product name and fixed software release or releases.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/product_name/{product_name}"
+            f"/fixed_in_releases/{','.join(fixed_in_releases)}"
+        )
+        params = self._params(status, modified_date, severity, sort_by)
+        async for item in self._session.enumerate_results(
+            ListOfBugs, path, params
+        ):
+            yield item
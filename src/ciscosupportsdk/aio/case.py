@@ -0,0 +1,103 @@
+from typing import AsyncIterator
+
+from ciscosupportsdk.aio.apisession import AsyncApiSession
+from ciscosupportsdk.api.case import SERVICE_BASE_URL
+from ciscosupportsdk.models.case import (
+    Case,
+    CaseDetail,
+    CaseDetailResponse,
+    CaseResponse,
+    CaseStatusFlag,
+    CaseSummaryResponse,
+    SortCaseBy,
+)
+from ciscosupportsdk.validate import CheckSize
+
+
+class AsyncCaseApi(object):
+    """
+    Asyncio version of :class:`ciscosupportsdk.api.case.CaseApi`.
+    """
+
+    def __init__(self, session: AsyncApiSession) -> None:
+        self._session = session
+
+    @CheckSize("case_ids", 30)
+    async def get_case_summary(
+        self,
+        case_ids: list[str],
+        sort_by: SortCaseBy = SortCaseBy.UPDATED_DATE,
+    ) -> AsyncIterator[Case]:
+        """
+        Returns brief information for the specified case or cases.
+
+        See :meth:`ciscosupportsdk.api.case.CaseApi.get_case_summary`.
+        """
+        path = f"{SERVICE_BASE_URL}/case_ids/" f"{','.join(case_ids)}"
+        params = {"sort_by": sort_by}
+        async for item in self._session.enumerate_results(
+            CaseSummaryResponse, path, query_params=params
+        ):
+            yield item
+
+    async def get_case_details(self, case_id: str) -> CaseDetail:
+        """
+        Returns detailed information for the specified case.
+
+        See :meth:`ciscosupportsdk.api.case.CaseApi.get_case_details`.
+        """
+        path = f"{SERVICE_BASE_URL}/details/case_id/{case_id}"
+        return await self._session.get_result(CaseDetailResponse, path)
+
+    @CheckSize("contract_ids", 10)
+    async def get_cases_by_contract_id(
+        self,
+        contract_ids: list[str],
+        date_created_from: str = None,
+        date_created_to: str = None,
+        status_flag: CaseStatusFlag = CaseStatusFlag.OPEN,
+    ) -> AsyncIterator[Case]:
+        """
+        Returns summary information for cases associated with the specified
+        contract or contracts.
+
+        See :meth:`ciscosupportsdk.api.case.CaseApi.get_cases_by_contract_id`.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/contracts/contract_ids/"
+            f"{','.join(contract_ids)}"
+        )
+        params = {
+            "date_created_from": date_created_from,
+            "date_created_to": date_created_to,
+            "status_flag": status_flag,
+        }
+        async for item in self._session.enumerate_results(
+            CaseResponse, path, query_params=params
+        ):
+            yield item
+
+    @CheckSize("user_ids", 10)
+    async def get_cases_by_user_id(
+        self,
+        user_ids: list[str],
+        date_created_from: str = None,
+        date_created_to: str = None,
+        status_flag: CaseStatusFlag = CaseStatusFlag.OPEN,
+    ) -> AsyncIterator[Case]:
+        """
+        Returns summary information for cases associated with the specified
+        user or users.
+
+        See :meth:`ciscosupportsdk.api.case.CaseApi.get_cases_by_user_id`.
+        """
+        path = f"{SERVICE_BASE_URL}/users/user_ids/" f"{','.join(user_ids)}"
+        params = {
+            "date_created_from": date_created_from,
+            "date_created_to": date_created_to,
+            "status_flag": status_flag,
+        }
+        async for item in self._session.enumerate_results(
+            CaseResponse, path, query_params=params
+        ):
+            yield item
@@ -0,0 +1,137 @@
+from datetime import date
+from typing import AsyncIterator, Union
+
+from ciscosupportsdk.aio.apisession import AsyncApiSession
+from ciscosupportsdk.api.eox import SERVICE_BASE_URL, EoxError
+from ciscosupportsdk.models.eox import (
+    EoxAttrib,
+    EoxRecord,
+    EoxResponse,
+    SoftwareRelease,
+)
+from ciscosupportsdk.pagination import Page
+from ciscosupportsdk.validate import CheckSize
+
+
+class AsyncEoxApi(object):
+    """
+    Asyncio version of :class:`ciscosupportsdk.api.eox.EoxApi`.
+    """
+
+    _default_params = {"responseencoding": "json"}
+
+    def __init__(self, session: AsyncApiSession) -> None:
+        self._session = session
+
+    @CheckSize("eox_attribs", 20)
+    async def get_by_dates(
+        self,
+        start_date: Union[str, date],
+        end_date: Union[str, date],
+        eox_attribs: list[EoxAttrib],
+    ) -> AsyncIterator[EoxRecord]:
+        """
+        Get EoX notices for all products by date.
+
+        See :meth:`ciscosupportsdk.api.eox.EoxApi.get_by_dates`.
+        """
+        params = {"eoxAttrib": ",".join(eox_attribs)}
+        async for record in self._enumerate_results(
+            "EOXByDates",
+            [self._get_date(start_date), self._get_date(end_date)],
+            params,
+        ):
+            yield record
+
+    @CheckSize("product_ids", 20)
+    async def get_by_product_ids(
+        self, product_ids: list[str]
+    ) -> AsyncIterator[EoxRecord]:
+        """
+        Get EoX records by product ID.
+
+        See :meth:`ciscosupportsdk.api.eox.EoxApi.get_by_product_ids`.
+        """
+        async for record in self._enumerate_results(
+            "EOXByProductID", [",".join(product_ids)]
+        ):
+            yield record
+
+    @CheckSize("serial_numbers", 20)
+    async def get_by_serial_number(
+        self, serial_numbers: list[str]
+    ) -> AsyncIterator[EoxRecord]:
+        """
+        Returns the EoX record for products with the specified serial numbers.
+
+        See :meth:`ciscosupportsdk.api.eox.EoxApi.get_by_serial_number`.
+        """
+        async for record in self._enumerate_results(
+            "EOXBySerialNumber", [",".join(serial_numbers)]
+        ):
+            yield record
+
+    @CheckSize("software_releases", 20)
+    async def get_by_software_release(
+        self, software_releases: list[SoftwareRelease]
+    ) -> AsyncIterator[EoxRecord]:
+        """
+        Returns the EoX record for products associated with the specified
+        software release and (optionally) the specified operating system.
+
+        See :meth:`ciscosupportsdk.api.eox.EoxApi.get_by_software_release`.
+        """
+        _software_releases = {}
+        for count, value in enumerate(software_releases):
+            _software_releases[f"input{count + 1}"] = str(value)
+
+        async for record in self._enumerate_results(
+            "EOXBySWReleaseString", [], _software_releases
+        ):
+            yield record
+
+    async def _enumerate_results(
+        self,
+        endpoint: str,
+        path_params: list,
+        params: dict = {},
+        page_index: int = 1,
+    ) -> AsyncIterator[EoxRecord]:
+        """
+        Overload the default method for pagination.
+
+        The EoX API behaves differently.  Pagination responses, urls,
+        and errors.
+        """
+        while page_index is not None:
+            page = await self._get_page(
+                endpoint, path_params, params, page_index
+            )
+            for record in page.items:
+                yield record
+            page_index = page.next_index()
+
+    async def _get_page(
+        self,
+        endpoint: str,
+        path_params: list,
+        params: dict = {},
+        page_index: int = 1,
+    ) -> Page:
+        """Fetches and parses a single page of EoX records."""
+        path = (
+            f"{SERVICE_BASE_URL}/{endpoint}/{page_index}/"
+            f"{'/'.join(x for x in path_params)}"
+        )
+        json = await self._session._get(
+            path, {**self._default_params, **params}
+        )
+        if "EOXError" in json:  # check for errors
+            raise EoxError(json["EOXError"])
+        response = EoxResponse(**json)
+        return Page.from_record(
+            response.eox_record, response.pagination_response_record
+        )
+
+    def _get_date(self, d: Union[str, date]) -> str:
+        return d.strftime("%Y-%m-%d") if isinstance(d, date) else d
@@ -0,0 +1,67 @@
+from typing import AsyncIterator
+
+from ciscosupportsdk.aio.apisession import AsyncApiSession
+from ciscosupportsdk.api.productinformation import SERVICE_BASE_URL
+from ciscosupportsdk.models.productinformation import (
+    ProductInformationRecord,
+    ProductInformationResponse,
+    ProductMDFRecord,
+    ProductMDFResponse,
+)
+from ciscosupportsdk.validate import CheckSize
+
+
+class AsyncProductInformationApi(object):
+    """
+    Asyncio version of
+    :class:`ciscosupportsdk.api.productinformation.ProductInformationApi`.
+    """
+
+    def __init__(self, session: AsyncApiSession) -> None:
+        self._session = session
+
+    @CheckSize("serial_numbers", 5)
+    async def get_info_by_serial(
+        self, serial_numbers: list[str]
+    ) -> AsyncIterator[ProductInformationRecord]:
+        """
+        Returns product information associated with the specified serial
+        number or numbers.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/serial_numbers/" f"{','.join(serial_numbers)}"
+        )
+        async for item in self._session.enumerate_results(
+            ProductInformationResponse, path
+        ):
+            yield item
+
+    @CheckSize("product_ids", 5)
+    async def get_info_by_product_id(
+        self, product_ids: list[str]
+    ) -> AsyncIterator[ProductInformationRecord]:
+        """
+        Returns product information associated with the specified product
+        identifier or identifiers.
+        """
+        path = f"{SERVICE_BASE_URL}/product_ids/" f"{','.join(product_ids)}"
+        async for item in self._session.enumerate_results(
+            ProductInformationResponse, path
+        ):
+            yield item
+
+    @CheckSize("product_ids", 5)
+    async def get_mdf_by_product_id(
+        self, product_ids: list[str]
+    ) -> AsyncIterator[ProductMDFRecord]:
+        """
+        Returns metadata framework (MDF) identifiers associated with
+        the specified product identifier or identifiers.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/product_ids_mdf/" f"{','.join(product_ids)}"
+        )
+        async for item in self._session.enumerate_results(
+            ProductMDFResponse, path
+        ):
+            yield item
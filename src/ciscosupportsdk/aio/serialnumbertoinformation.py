@@ -0,0 +1,110 @@
+from typing import AsyncIterator
+
+from ciscosupportsdk.aio.apisession import AsyncApiSession
+from ciscosupportsdk.api.serialnumbertoinformation import SERVICE_BASE_URL
+from ciscosupportsdk.models.serialnumbertoinformation import (
+    CoverageOwnerStatus,
+    CoverageOwnerStatusResponse,
+    CoverageStatus,
+    CoverageStatusResponse,
+    CoverageSummary,
+    CoverageSummaryByInstance,
+    CoverageSummaryByInstanceResponse,
+    CoverageSummaryResponse,
+    OrderableProductList,
+    OrderableProductListResponse,
+)
+from ciscosupportsdk.validate import CheckSize
+
+
+class AsyncSerialNumberToInformationAPI(object):
+    """
+    Asyncio version of
+    :class:`ciscosupportsdk.api.serialnumbertoinformation.SerialNumberToInformationAPI`.
+    """  # noqa: E501
+
+    def __init__(self, session: AsyncApiSession) -> None:
+        self._session = session
+
+    @CheckSize("serial_numbers", 75)
+    async def get_coverage_status(
+        self, serial_numbers: list[str]
+    ) -> AsyncIterator[CoverageStatus]:
+        """
+        Returns coverage status for a set of serial numbers.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/coverage/status/serial_numbers/"
+            f"{','.join(serial_numbers)}"
+        )
+        async for item in self._session.enumerate_results(
+            CoverageStatusResponse, path, paging=False
+        ):
+            yield item
+
+    @CheckSize("serial_numbers", 75)
+    async def get_coverage_summary_by_serial(
+        self, serial_numbers: list[str]
+    ) -> AsyncIterator[CoverageSummary]:
+        """
+        Returns coverage status, warranty, and product identifier details for
+        a set of serial numbers.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/coverage/summary/serial_numbers/"
+            f"{','.join(serial_numbers)}"
+        )
+        async for item in self._session.enumerate_results(
+            CoverageSummaryResponse, path
+        ):
+            yield item
+
+    @CheckSize("instance_numbers", 75)
+    async def get_coverage_summary_by_instance(
+        self, instance_numbers: list[str]
+    ) -> AsyncIterator[CoverageSummaryByInstance]:
+        """
+        Returns coverage status, warranty, and product identifier details for
+        a set of instance numbers.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/coverage/summary/instance_numbers/"
+            f"{','.join(instance_numbers)}"
+        )
+        async for item in self._session.enumerate_results(
+            CoverageSummaryByInstanceResponse, path
+        ):
+            yield item
+
+    @CheckSize("serial_numbers", 75)
+    async def get_orderable_pids(
+        self, serial_numbers: list[str]
+    ) -> AsyncIterator[OrderableProductList]:
+        """
+        Returns the orderable PID for the specified device serial number.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/identifiers/orderable/serial_numbers/"
+            f"{','.join(serial_numbers)}"
+        )
+        async for item in self._session.enumerate_results(
+            OrderableProductListResponse, path, paging=False
+        ):
+            yield item
+
+    @CheckSize("serial_numbers", 75)
+    async def get_coverage_owner_status(
+        self, serial_numbers: list[str]
+    ) -> AsyncIterator[CoverageOwnerStatus]:
+        """
+        Returns the coverage and ownership status for the specified device
+        serial numbers.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/coverage/owner_status/serial_numbers/"
+            f"{','.join(serial_numbers)}"
+        )
+        async for item in self._session.enumerate_results(
+            CoverageOwnerStatusResponse, path, paging=False
+        ):
+            yield item
@@ -0,0 +1,75 @@
+from typing import AsyncIterator
+
+from ciscosupportsdk.aio.apisession import AsyncApiSession
+from ciscosupportsdk.api.serviceorderreturn import SERVICE_BASE_URL
+from ciscosupportsdk.apisession import ApiError
+from ciscosupportsdk.models.serviceorderreturn import (
+    Rma,
+    RmaByUserResponse,
+    RmaResponse,
+    User,
+)
+from ciscosupportsdk.pagination import Page
+
+
+class AsyncServiceOrderReturnApi(object):
+    """
+    Asyncio version of
+    :class:`ciscosupportsdk.api.serviceorderreturn.ServiceOrderReturnApi`.
+    """
+
+    def __init__(self, session: AsyncApiSession) -> None:
+        self._session = session
+
+    async def get_rma_details_by_rma_number(
+        self, rma_number: str
+    ) -> AsyncIterator[Rma]:
+        """
+        Returns detailed information about the specified RMA.
+        """
+        path = f"{SERVICE_BASE_URL}/rma_numbers/{rma_number}"
+        async for _, rmas in self._session.enumerate_results(
+            RmaResponse, path
+        ):
+            for rma in rmas:
+                yield rma
+
+    async def get_rma_details_by_user_id(
+        self,
+        user_id: str,
+        from_date: str = None,
+        to_date: str = None,
+        status: str = None,
+        sort_by: str = None,
+    ) -> AsyncIterator[User]:
+        """
+        Returns a list of RMAs associated with the specified user.
+        By default, the last 30 days of RMAs for a user is returned.
+        """
+        path = f"{SERVICE_BASE_URL}/users/user_ids/{user_id}"
+        params = {
+            "fromDate": from_date,
+            "toDate": to_date,
+            "status": status,
+            "sortBy": sort_by,
+        }
+        page_index = 1
+        while page_index is not None:
+            page = await self._get_users_page(path, params, page_index)
+            for user in page.items:
+                yield user
+            page_index = page.next_index()
+
+    async def _get_users_page(
+        self, path: str, params: dict, page_index: int = 1
+    ) -> Page:
+        """Fetches and parses a single page of RMAs by user."""
+        json = await self._session._get(
+            path, {**params, "pageIndex": page_index}
+        )
+        if "APIError" in json["OrderList"]:
+            raise ApiError(json["OrderList"]["APIError"])
+        order_list = RmaByUserResponse(**json).order_list
+        return Page.from_record(
+            order_list.users, order_list.pagination_response_record
+        )
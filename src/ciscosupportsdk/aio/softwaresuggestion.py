@@ -0,0 +1,131 @@
+from typing import AsyncIterator
+
+from ciscosupportsdk.aio.apisession import AsyncApiSession
+from ciscosupportsdk.api.softwaresuggestion import SERVICE_BASE_URL
+from ciscosupportsdk.models.softwaresuggestion import (
+    CompatableSoftwareResponse,
+    Suggestion,
+    Suggestions,
+    SuggestionsByProductResponse,
+)
+from ciscosupportsdk.validate import CheckSize
+
+
+class AsyncSoftwareSuggestionApi(object):
+    """
+    Asyncio version of
+    :class:`ciscosupportsdk.api.softwaresuggestion.SoftwareSuggestionApi`.
+    """
+
+    def __init__(self, session: AsyncApiSession) -> None:
+        self._session = session
+
+    @CheckSize("product_ids", 10)
+    async def get_suggestions_and_image_by_product_ids(
+        self, product_ids: list[str]
+    ) -> AsyncIterator[Suggestions]:
+        """
+        Returns a list of Cisco suggested software releases and images for a
+        list of product IDs.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/software/productIds/"
+            f"{','.join(product_ids)}"
+        )
+        async for item in self._session.enumerate_results(
+            SuggestionsByProductResponse, path
+        ):
+            yield item
+
+    @CheckSize("product_ids", 10)
+    async def get_suggestions_by_product_ids(
+        self, product_ids: list[str]
+    ) -> AsyncIterator[Suggestions]:
+        """
+        Returns a list of Cisco suggested software releases (without images)
+        for a list of product IDs.
+        """
+        path = (
+            f"{SERVICE_BASE_URL}/releases/productIds/"
+            f"{','.join(product_ids)}"
+        )
+        async for item in self._session.enumerate_results(
+            SuggestionsByProductResponse, path
+        ):
+            yield item
+
+    async def get_compatible_by_product_id(
+        self,
+        product_id: str,
+        current_image: str = None,
+        current_release: str = None,
+        supported_features: list[str] = None,
+        supported_hardware: list[str] = None,
+    ) -> AsyncIterator[Suggestion]:
+        """
+        Returns compatible and suggested software releases for a product given
+        its product identifier (PID) and specific software attributes.
+        """
+        path = f"{SERVICE_BASE_URL}/compatible/productId/{product_id}"
+        params = {
+            "currentImage": current_image,
+            "currentRelease": current_release,
+            "supportedFeatures": supported_features,
+            "supportedHardware": supported_hardware,
+        }
+        async for item in self._session.enumerate_results(
+            CompatableSoftwareResponse, path, query_params=params
+        ):
+            yield item
+
+    @CheckSize("mdf_ids", 10)
+    async def get_suggestions_and_image_by_mdf_ids(
+        self, mdf_ids: list[str]
+    ) -> AsyncIterator[Suggestions]:
+        """
+        Returns a list of Cisco suggested software releases and images for
+        a list of mdf IDs.
+        """
+        path = f"{SERVICE_BASE_URL}/software/mdfIds/" f"{','.join(mdf_ids)}"
+        async for item in self._session.enumerate_results(
+            SuggestionsByProductResponse, path
+        ):
+            yield item
+
+    @CheckSize("mdf_ids", 10)
+    async def get_suggestions_by_mdf_ids(
+        self, mdf_ids: list[str]
+    ) -> AsyncIterator[Suggestions]:
+        """
+        Returns a list of Cisco suggested software releases and NO images for
+        a list of mdf IDs.
+        """
+        path = f"{SERVICE_BASE_URL}/releases/mdfIds/" f"{','.join(mdf_ids)}"
+        async for item in self._session.enumerate_results(
+            SuggestionsByProductResponse, path
+        ):
+            yield item
+
+    async def get_compatible_by_mdf_id(
+        self,
+        mdf_id: str,
+        current_image: str = None,
+        current_release: str = None,
+        supported_features: list[str] = None,
+        supported_hardware: list[str] = None,
+    ) -> AsyncIterator[Suggestion]:
+        """
+        Returns compatible and suggested software releases for a product given
+        its mdf identifier (mdfId) and specific software attributes.
+        """
+        path = f"{SERVICE_BASE_URL}/compatible/mdfId/{mdf_id}"
+        params = {
+            "currentImage": current_image,
+            "currentRelease": current_release,
+            "supportedFeatures": supported_features,
+            "supportedHardware": supported_hardware,
+        }
+        async for item in self._session.enumerate_results(
+            CompatableSoftwareResponse, path, query_params=params
+        ):
+            yield item
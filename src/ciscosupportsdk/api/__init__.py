@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from ciscosupportsdk.apisession import ApiSession
 
 from .asd import AutomatedSoftwareDistributionApi
@@ -17,19 +19,50 @@ class CiscoSupportAPI(object):
     object.  The 'session' handles authentication and communication
     to the API.  Each of the support APIs are added to this object
     in a hierarchical structure.
+
+    Nothing is sent to the API until the first call, the OAuth token is
+    fetched then and each of the APIs is created on first access.  Extra
+    keyword arguments are passed to :class:`ApiSession`.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
-        self._session = ApiSession(client_id, client_secret)
-
-        # setup the rest of the APIs
-        self.asd = AutomatedSoftwareDistributionApi(self._session)
-        self.bug = BugApi(self._session)
-        self.case = CaseApi(self._session)
-        self.eox = EoxApi(self._session)
-        self.product_information = ProductInformationApi(self._session)
-        self.serial_information = SerialNumberToInformationAPI(self._session)
-        self.suggestion = SoftwareSuggestionApi(self._session)
-        self.rma = ServiceOrderReturnApi(self._session)
+    def __init__(self, client_id: str, client_secret: str, **session_kwargs):
+        # the session fetches its token on the first request, not here
+        self._session = ApiSession(client_id, client_secret, **session_kwargs)
+
+    # the rest of the APIs are set up on first use
+    @cached_property
+    def asd(self) -> AutomatedSoftwareDistributionApi:
+        return AutomatedSoftwareDistributionApi(self._session)
+
+    @cached_property
+    def bug(self) -> BugApi:
+        return BugApi(self._session)
+
+    @cached_property
+    def case(self) -> CaseApi:
+        return CaseApi(self._session)
+
+    @cached_property
+    def eox(self) -> EoxApi:
+        return EoxApi(self._session)
+
+    @cached_property
+    def product_information(self) -> ProductInformationApi:
+        return ProductInformationApi(self._session)
+
+    @cached_property
+    def serial_information(self) -> SerialNumberToInformationAPI:
+        return SerialNumberToInformationAPI(self._session)
+
+    @cached_property
+    def suggestion(self) -> SoftwareSuggestionApi:
+        return SoftwareSuggestionApi(self._session)
+
+    @cached_property
+    def rma(self) -> ServiceOrderReturnApi:
+        return ServiceOrderReturnApi(self._session)
+
+    @property
+    def service_order_return(self) -> ServiceOrderReturnApi:
         # just in case
-        self.service_order_return = self.rma
+        return self.rma
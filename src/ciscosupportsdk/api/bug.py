@@ -1,6 +1,14 @@
-from typing import Iterable
+import re
+from typing import Hashable, Iterable, Mapping, NamedTuple, Union
 
 from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.bulk import (
+    DEFAULT_BULK_WORKERS,
+    bulk_lookup,
+    chunked,
+    run_ahead,
+)
+from ciscosupportsdk.cache import cached_entities
 from ciscosupportsdk.models.bug import (
     Bug,
     DateModified,
@@ -12,6 +20,33 @@ from ciscosupportsdk.models.bug import (
 from ciscosupportsdk.validate import CheckSize
 
 SERVICE_BASE_URL = "/bug/v2.0/bugs"
+# most bug IDs a single request takes
+MAX_BUG_IDS = 5
+# most software releases a single request takes
+MAX_RELEASES = 75
+# leading zeros of release numbers, 15.2(03)E01 is 15.2(3)E1
+LEADING_ZEROS = re.compile(r"(?<!\d)0+(?=\d)")
+
+
+def normalize_release(release: str) -> str:
+    """A software release without zero padding, for comparing releases."""
+    return LEADING_ZEROS.sub("", release.strip())
+
+
+class FleetBugs(NamedTuple):
+    """
+    The bugs affecting a fleet of devices.
+
+    Attributes:
+        bugs: each bug found, keyed by bug ID
+        devices: the devices affected by each bug, keyed by bug ID
+        errors: the error of each (base PID, release) that could not be
+            looked up
+    """
+
+    bugs: dict[str, Bug]
+    devices: dict[str, list[Hashable]]
+    errors: dict[tuple[str, str], Exception]
 
 
 class BugApi(object):
@@ -36,10 +71,145 @@ class BugApi(object):
             be submitted separated by a comma.
         :rtype: Bug
         """
-        path = f"{SERVICE_BASE_URL}/bug_ids/" f"{','.join(bug_ids)}"
-        yield from self._session.enumerate_results(
-            ListOfBugs, path, paging=False
+        path = f"{SERVICE_BASE_URL}/bug_ids"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            bug_ids,
+            Bug,
+            lambda ids: self._session.enumerate_results(
+                ListOfBugs,
+                f"{path}/{','.join(ids)}",
+                paging=False,
+                use_cache=False,
+            ),
+            lambda bug: bug.bug_id,
+        )
+
+    def bulk_bug_details(
+        self,
+        bug_ids: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[Bug]:
+        """
+        Returns detailed information for any number of bug IDs.
+
+        Bug IDs are deduplicated and requested five at a time, with
+        max_workers requests in flight.  Bugs are yielded as their request
+        completes, or in the order of bug_ids when ordered.  With a cache
+        on the session, bugs are cached by ID and only those not cached
+        are requested.
+
+        :param: bug_ids: Iterable[str]: Identifiers of the bugs.
+        :param: max_workers: int: requests sent at the same time.
+        :param: ordered: bool: yield bugs in the order of bug_ids.
+        :rtype: Iterable[Bug]
+        """
+        results = bulk_lookup(
+            bug_ids,
+            lambda chunk: list(self.get_bug_details(chunk)),
+            lambda bug: bug.bug_id,
+            MAX_BUG_IDS,
+            max_workers,
+            ordered,
+            str.strip,
+        )
+        for result in results:
+            if result.error is not None:
+                raise result.error
+            yield from result.records
+
+    def get_bugs_for_fleet(
+        self,
+        devices: Union[
+            Mapping[Hashable, tuple[str, str]], Iterable[tuple[str, str]]
+        ],
+        status: Status = None,
+        modified_date: DateModified = None,
+        severity: Severity = None,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> FleetBugs:
+        """
+        Returns the bugs affecting a fleet of devices, and the devices each
+        bug affects.
+
+        Devices are grouped by base PID, each PID's distinct releases are
+        looked up 75 per request with max_workers requests (and their
+        pages) in flight, so a release shared by many devices is looked up
+        once.  A bug is matched to the devices running the releases it
+        lists as affected, or to every device of its request when it lists
+        none of them.
+
+        :param: devices: (base_pid, release) pairs, or a mapping of device
+            name to its (base_pid, release).  The index of affected
+            devices holds the pairs, or the names.
+        :param: status: Status: only bugs with this status are returned.
+        :param: modified_date: DateModified: only bugs modified within
+            this time are returned.
+        :param: severity: Severity: only bugs with this severity are
+            returned.
+        :param: max_workers: int: requests sent at the same time.
+        :rtype: FleetBugs
+        """
+        if isinstance(devices, Mapping):
+            named = devices.items()
+        else:
+            named = ((pair, pair) for pair in devices)
+
+        # base PID -> normalized release -> devices running it, and the
+        # ways each release is spelled, dicts are used as ordered sets
+        fleet: dict[str, dict[str, dict[Hashable, None]]] = {}
+        spellings: dict[tuple[str, str], dict[str, None]] = {}
+        for device, (base_pid, release) in named:
+            base_pid, release = base_pid.strip(), release.strip()
+            normalized = normalize_release(release)
+            releases = fleet.setdefault(base_pid, {})
+            releases.setdefault(normalized, {})[device] = None
+            spellings.setdefault((base_pid, normalized), {})[release] = None
+
+        def lookup(request: tuple[str, list[str]]):
+            base_pid, releases = request
+            # a release is sent once, as the first device spelled it
+            sent = [next(iter(spellings[(base_pid, r)])) for r in releases]
+            try:
+                found = self.get_bugs_by_product_id_and_release(
+                    base_pid, sent, status, modified_date, severity
+                )
+                return base_pid, releases, list(found), None
+            except Exception as error:
+                return base_pid, releases, [], error
+
+        requests = (
+            (base_pid, chunk)
+            for base_pid, releases in fleet.items()
+            for chunk in chunked(releases, MAX_RELEASES)
         )
+        result = FleetBugs({}, {}, {})
+        affected_devices: dict[str, dict[Hashable, None]] = {}
+        for base_pid, releases, found, error in run_ahead(
+            lookup, requests, max_workers
+        ):
+            if error is not None:
+                for release in releases:
+                    for spelling in spellings[(base_pid, release)]:
+                        result.errors[(base_pid, spelling)] = error
+                continue
+            requested = set(releases)
+            for bug in found:
+                result.bugs.setdefault(bug.bug_id, bug)
+                listed = re.split(r"[\s,]+", bug.known_affected_releases)
+                affected = [
+                    release
+                    for release in map(normalize_release, listed)
+                    if release in requested
+                ] or releases
+                bug_devices = affected_devices.setdefault(bug.bug_id, {})
+                for release in affected:
+                    bug_devices.update(fleet[base_pid][release])
+        for bug_id, bug_devices in affected_devices.items():
+            result.devices[bug_id] = list(bug_devices)
+        return result
 
     def get_bugs_by_product_id(
         self,
@@ -1,6 +1,17 @@
-from typing import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Mapping, Optional, Union
 
 from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.bulk import (
+    DEFAULT_BULK_WORKERS,
+    BulkResult,
+    bulk_lookup,
+    chunked,
+    date_windows,
+    run_ahead,
+    unique,
+)
+from ciscosupportsdk.cache import cached_entities
 from ciscosupportsdk.models.case import (
     Case,
     CaseDetail,
@@ -13,6 +24,24 @@ from ciscosupportsdk.models.case import (
 from ciscosupportsdk.validate import CheckSize
 
 SERVICE_BASE_URL = "/case/v3/cases"
+# most contract or user IDs a single request takes
+MAX_IDS = 10
+# longest range of creation dates a single request takes
+MAX_DATE_RANGE = timedelta(days=90)
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def parse_case_date(value: Union[str, datetime]) -> datetime:
+    """A case API date, like 2013-04-23T11:00:14Z, as a UTC datetime."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_case_date(value: datetime) -> str:
+    return value.strftime(DATE_FORMAT)
 
 
 class CaseApi(object):
@@ -30,22 +59,41 @@ class CaseApi(object):
     def get_case_summary(
         self,
         case_ids: list[str],
-        sort_by: SortCaseBy = SortCaseBy.UPDATED_DATE,
+        sort_by: Optional[SortCaseBy] = SortCaseBy.UPDATED_DATE,
     ) -> Iterable[Case]:
         """
         Returns brief information for the specified case or cases.
 
+        Summaries are only kept per case, when the session caches cases,
+        for an unsorted lookup: cached summaries cannot be put in the
+        service's order, so sorted lookups always go to the service.
+
         :param: case_ids: list[str]: Identifier of the case or cases for which
             to return results. Multiple values must be specified within a
             comma-separated list and cannot exceed 30 IDs.
         :param: sort_by: SortCaseBy: Order in which the results should be
-            sorted.
+            sorted, None for the order of case_ids.
         """
-        path = f"{SERVICE_BASE_URL}/case_ids/" f"{','.join(case_ids)}"
-        params = {"sort_by": sort_by}
+        path = f"{SERVICE_BASE_URL}/case_ids"
+        if sort_by is not None:
+            yield from self._session.enumerate_results(
+                CaseSummaryResponse,
+                f"{path}/{','.join(dict.fromkeys(case_ids))}",
+                query_params={"sort_by": sort_by},
+            )
+            return
 
-        yield from self._session.enumerate_results(
-            CaseSummaryResponse, path, query_params=params
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            case_ids,
+            Case,
+            lambda ids: self._session.enumerate_results(
+                CaseSummaryResponse,
+                f"{path}/{','.join(ids)}",
+                use_cache=False,
+            ),
+            lambda case: case.case_id,
         )
 
     def get_case_details(self, case_id: str) -> CaseDetail:
@@ -58,6 +106,56 @@ class CaseApi(object):
         path = f"{SERVICE_BASE_URL}/details/case_id/{case_id}"
         return self._session.get_result(CaseDetailResponse, path)
 
+    def bulk_case_details(
+        self,
+        cases: Iterable[Union[str, Case]],
+        last_updated: Mapping[str, str] = None,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[BulkResult[CaseDetail]]:
+        """
+        Returns detailed information for any number of cases.
+
+        Cases are fetched one per request, with max_workers requests in
+        flight and paced by the session's rate limiter.  A result is
+        yielded per case as it completes, or in the order of cases when
+        ordered, carrying the CaseDetail or the error fetching it.
+
+        Case summaries, as returned by :meth:`get_cases_by_contract_id`,
+        may be passed instead of IDs.  A summary whose updated_date is the
+        one recorded for its case in last_updated, from an earlier pull,
+        is skipped.
+
+        :param: cases: Iterable[Union[str, Case]]: Identifiers or summaries
+            of the cases.
+        :param: last_updated: Mapping[str, str]: updated_date of each case
+            when its details were last fetched, by case ID.
+        :param: max_workers: int: requests sent at the same time.
+        :param: ordered: bool: yield results in the order of cases.
+        :rtype: Iterable[BulkResult[CaseDetail]]
+        """
+        last_updated = last_updated or {}
+
+        def changed() -> Iterable[str]:
+            for case in cases:
+                if isinstance(case, str):
+                    yield case
+                elif (
+                    case.updated_date is None
+                    or last_updated.get(case.case_id) != case.updated_date
+                ):
+                    yield case.case_id
+
+        yield from bulk_lookup(
+            changed(),
+            lambda chunk: [self.get_case_details(chunk[0])],
+            lambda detail: detail.case_id,
+            1,
+            max_workers,
+            ordered,
+            str.strip,
+        )
+
     @CheckSize("contract_ids", 10)
     def get_cases_by_contract_id(
         self,
@@ -126,3 +224,108 @@ class CaseApi(object):
         yield from self._session.enumerate_results(
             CaseResponse, path, query_params=params
         )
+
+    def bulk_cases_by_contract_id(
+        self,
+        contract_ids: Iterable[str],
+        date_created_from: Union[str, datetime] = None,
+        date_created_to: Union[str, datetime] = None,
+        status_flag: CaseStatusFlag = CaseStatusFlag.OPEN,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Iterable[Case]:
+        """
+        Returns summary information for cases of any number of contracts,
+        created over any range of dates.
+
+        The contracts are looked up 10 at a time, and the range split in
+        windows of up to 90 days, the windows of every chunk of contracts
+        are fetched max_workers at a time.  Each case is yielded once.
+
+        :param: contract_ids: Iterable[str]: Identifiers of the contracts.
+        :param: date_created_from: Beginning of the range, as a datetime
+            or a string like 2013-04-23T11:00:14Z.
+        :param: date_created_to: End of the range, defaults to now.
+        :param: status_flag: CaseStatusFlag: Return only cases associated
+            with the specified status.
+        :param: max_workers: int: requests sent at the same time.
+        """
+        yield from self._bulk_cases(
+            self.get_cases_by_contract_id,
+            contract_ids,
+            date_created_from,
+            date_created_to,
+            status_flag,
+            max_workers,
+        )
+
+    def bulk_cases_by_user_id(
+        self,
+        user_ids: Iterable[str],
+        date_created_from: Union[str, datetime] = None,
+        date_created_to: Union[str, datetime] = None,
+        status_flag: CaseStatusFlag = CaseStatusFlag.OPEN,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Iterable[Case]:
+        """
+        Returns summary information for cases of any number of users,
+        created over any range of dates.
+
+        See :meth:`bulk_cases_by_contract_id`.
+
+        :param: user_ids: Iterable[str]: Identifiers of the users.
+        :param: date_created_from: Beginning of the range, as a datetime
+            or a string like 2013-04-23T11:00:14Z.
+        :param: date_created_to: End of the range, defaults to now.
+        :param: status_flag: CaseStatusFlag: Return only cases associated
+            with the specified status.
+        :param: max_workers: int: requests sent at the same time.
+        """
+        yield from self._bulk_cases(
+            self.get_cases_by_user_id,
+            user_ids,
+            date_created_from,
+            date_created_to,
+            status_flag,
+            max_workers,
+        )
+
+    def _bulk_cases(
+        self,
+        method,
+        ids: Iterable[str],
+        date_created_from: Optional[Union[str, datetime]],
+        date_created_to: Optional[Union[str, datetime]],
+        status_flag: CaseStatusFlag,
+        max_workers: int,
+    ) -> Iterable[Case]:
+        if date_created_from is None and date_created_to is None:
+            windows = [(None, None)]
+        elif date_created_from is None:
+            raise ValueError("date_created_to needs a date_created_from")
+        else:
+            start = parse_case_date(date_created_from)
+            end = (
+                parse_case_date(date_created_to)
+                if date_created_to is not None
+                else datetime.now(timezone.utc)
+            )
+            windows = [
+                (format_case_date(s), format_case_date(e))
+                for s, e in date_windows(start, end, MAX_DATE_RANGE)
+            ]
+
+        def fetch(request: tuple[list[str], tuple]) -> list[Case]:
+            chunk, (window_from, window_to) = request
+            return list(method(chunk, window_from, window_to, status_flag))
+
+        requests = (
+            (chunk, window)
+            for chunk in chunked(unique(ids, str.strip), MAX_IDS)
+            for window in windows
+        )
+        seen = set()
+        for cases in run_ahead(fetch, requests, max_workers):
+            for case in cases:
+                if case.case_id not in seen:
+                    seen.add(case.case_id)
+                    yield case
@@ -1,16 +1,34 @@
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import date, datetime
 from typing import Iterable, Union
 
+from ciscosupportsdk.api.serialnumbertoinformation import normalize_serial
 from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.bulk import (
+    DEFAULT_BULK_WORKERS,
+    BulkResult,
+    bulk_lookup,
+    split_dates,
+)
+from ciscosupportsdk.cache import cached_entities
 from ciscosupportsdk.models.eox import (
     EoxAttrib,
     EoxRecord,
     EoxResponse,
     SoftwareRelease,
 )
+from ciscosupportsdk.pagination import Page, paginate
 from ciscosupportsdk.validate import CheckSize
 
 SERVICE_BASE_URL = "/supporttools/eox/rest/5"
+# most inputs a single request takes
+MAX_INPUTS = 20
+# software release inputs come back as "input1=<version>,<os>"
+INPUT_NUMBER = re.compile(r"^input\d+=")
+# pages a date window may take before it is split in smaller windows
+DEFAULT_WINDOW_PAGES = 10
 
 
 class EoxError(Exception):
@@ -44,6 +62,8 @@ class EoxApi(object):
         start_date: Union[str, datetime.date],
         end_date: Union[str, datetime.date],
         eox_attribs: list[EoxAttrib],
+        max_workers: int = 0,
+        window_pages: int = DEFAULT_WINDOW_PAGES,
     ) -> Iterable[EoxRecord]:
         """
         Get EoX notices for all products by date.
@@ -67,6 +87,11 @@ class EoxApi(object):
                 For example: 2010-01-01
             end_date: End date of the date range of records to return
                 in the following format: YYYY-MM-DD. For example: 2010-01-01
+            max_workers: when more than one, split the range in windows
+                of days queried in parallel, records are then yielded
+                as they arrive, each once.
+            window_pages: split a window whose first page reports more
+                pages than this in smaller windows.
         Returns:
             Iterable[EoxRecord]
         Raises:
@@ -75,6 +100,16 @@ class EoxApi(object):
         """
         params = {"eoxAttrib": ",".join(eox_attribs)}
 
+        if max_workers > 1:
+            yield from self._by_date_windows(
+                date.fromisoformat(self._get_date(start_date)),
+                date.fromisoformat(self._get_date(end_date)),
+                params,
+                max_workers,
+                window_pages,
+            )
+            return
+
         yield from self._enumerate_results(
             "EOXByDates",
             [self._get_date(start_date), self._get_date(end_date)],
@@ -85,7 +120,6 @@ class EoxApi(object):
     def get_by_product_ids(
         self, product_ids: list[str]
     ) -> Iterable[EoxRecord]:
-        _product_ids = ",".join(product_ids)
         """
         Get EoX records by product ID.
 
@@ -109,7 +143,7 @@ class EoxApi(object):
         Raises:
             EoxError, ValueError
         """
-        yield from self._enumerate_results("EOXByProductID", [_product_ids])
+        yield from self._cached_records("EOXByProductID", product_ids)
 
     @CheckSize("serial_numbers", 20)
     def get_by_serial_number(
@@ -127,10 +161,7 @@ class EoxApi(object):
         Raises:
             EoxError, ValueError
         """
-        _serial_numbers = ",".join(serial_numbers)
-        yield from self._enumerate_results(
-            "EOXBySerialNumber", [_serial_numbers]
-        )
+        yield from self._cached_records("EOXBySerialNumber", serial_numbers)
 
     @CheckSize("software_releases", 20)
     def get_by_software_release(
@@ -157,42 +188,274 @@ class EoxApi(object):
             "EOXBySWReleaseString", [], _software_releases
         )
 
+    def bulk_by_product_ids(
+        self,
+        product_ids: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[BulkResult[EoxRecord]]:
+        """
+        Get EoX records for any number of product IDs.
+
+        Product IDs are deduplicated and looked up 20 at a time, with
+        several requests (and their pages) in flight.  A result is yielded
+        for each product ID with the records matching it, a request that
+        fails reports its error on the results of its product IDs rather
+        than ending the lookup.
+
+        Args:
+            product_ids: Product IDs, wildcards are allowed
+            max_workers: requests sent at the same time
+            ordered: yield results in the order of product_ids
+        Returns:
+            Iterable[BulkResult[EoxRecord]]
+        """
+        yield from self._bulk(
+            lambda chunk: self.get_by_product_ids(chunk),
+            product_ids,
+            str.strip,
+            max_workers,
+            ordered,
+        )
+
+    def bulk_by_serial_numbers(
+        self,
+        serial_numbers: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[BulkResult[EoxRecord]]:
+        """
+        Get EoX records for any number of serial numbers.
+
+        Serial numbers are upper cased, deduplicated and looked up 20 at a
+        time, see :meth:`bulk_by_product_ids`.
+
+        Args:
+            serial_numbers: Device serial numbers
+            max_workers: requests sent at the same time
+            ordered: yield results in the order of serial_numbers
+        Returns:
+            Iterable[BulkResult[EoxRecord]]
+        """
+        yield from self._bulk(
+            lambda chunk: self.get_by_serial_number(chunk),
+            serial_numbers,
+            normalize_serial,
+            max_workers,
+            ordered,
+        )
+
+    def bulk_by_software_releases(
+        self,
+        software_releases: Iterable[SoftwareRelease],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[BulkResult[EoxRecord]]:
+        """
+        Get EoX records for any number of software releases.
+
+        Releases are looked up 20 at a time, see
+        :meth:`bulk_by_product_ids`.  Results are keyed by the release as
+        a string, ``"<version>,<os>"``.
+
+        Args:
+            software_releases: combinations of release and operating system
+            max_workers: requests sent at the same time
+            ordered: yield results in the order of software_releases
+        Returns:
+            Iterable[BulkResult[EoxRecord]]
+        """
+
+        def fetch(chunk: list[str]) -> Iterable[EoxRecord]:
+            inputs = {
+                f"input{count}": release
+                for count, release in enumerate(chunk, 1)
+            }
+            return self._enumerate_results("EOXBySWReleaseString", [], inputs)
+
+        yield from self._bulk(
+            fetch, map(str, software_releases), None, max_workers, ordered
+        )
+
+    def _bulk(
+        self,
+        fetch,
+        inputs: Iterable[str],
+        normalize,
+        max_workers: int,
+        ordered: bool,
+    ) -> Iterable[BulkResult[EoxRecord]]:
+        """
+        Looks up inputs 20 at a time, keying records back to their input
+        by eox_input_value, and dropping records of the same product
+        returned more than once for an input.
+        """
+        results = bulk_lookup(
+            inputs,
+            lambda chunk: list(fetch(chunk)),
+            lambda record: INPUT_NUMBER.sub("", record.eox_input_value),
+            MAX_INPUTS,
+            max_workers,
+            ordered,
+            normalize,
+        )
+        for result in results:
+            products = {}
+            for record in result.records:
+                products.setdefault(record.eol_product_id, record)
+            yield result._replace(records=list(products.values()))
+
+    def _by_date_windows(
+        self,
+        start: date,
+        end: date,
+        params: dict,
+        max_workers: int,
+        window_pages: int,
+    ) -> Iterable[EoxRecord]:
+        """
+        Enumerates records by date over windows of the range, in parallel.
+
+        The range starts out split in one window per worker.  A window
+        whose first page reports more than window_pages pages is split
+        again, sized from that page count, and its first page dropped, so
+        no window has to be paged through a long way serially.  A record
+        matching dates in more than one window is yielded once.
+
+        As with parallel pagination, only twice max_workers pages are ever
+        in flight, further pages are requested as the consumer takes the
+        records of those fetched.
+        """
+        deadline = self._session.retry_policy.start_deadline()
+        pool = ThreadPoolExecutor(max_workers, "ciscosupportsdk-eox")
+        depth = max_workers * 2
+        # (window, page index) of the pages still to request
+        backlog = deque(
+            (window, 1) for window in split_dates(start, end, max_workers)
+        )
+        pending = {}
+
+        def submit() -> None:
+            while backlog and len(pending) < depth:
+                window, page_index = backlog.popleft()
+                future = pool.submit(
+                    self._get_page,
+                    "EOXByDates",
+                    [self._get_date(d) for d in window],
+                    params,
+                    page_index,
+                    deadline,
+                )
+                pending[future] = (window, page_index)
+
+        seen = set()
+        try:
+            submit()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window, page_index = pending.pop(future)
+                    page = future.result()
+                    if page_index == 1:
+                        first, last = window
+                        if page.last_index > window_pages and first < last:
+                            parts = -(-page.last_index // window_pages)
+                            backlog.extend(
+                                (smaller, 1)
+                                for smaller in split_dates(first, last, parts)
+                            )
+                            continue
+                        backlog.extend(
+                            (window, index)
+                            for index in range(2, page.last_index + 1)
+                        )
+                    for record in page.items:
+                        key = (
+                            record.eol_product_id,
+                            record.product_bulletin_number,
+                        )
+                        if key not in seen:
+                            seen.add(key)
+                            yield record
+                submit()
+        finally:
+            # an early exit or a failed page cancels what has not started
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _cached_records(
+        self, endpoint: str, identifiers: list[str]
+    ) -> Iterable[EoxRecord]:
+        """
+        Enumerates records by input value, caching them per input.  Inputs
+        the EoX database does not know get a record carrying an eox_error,
+        these are remembered for the shorter negative TTL.
+        """
+        yield from cached_entities(
+            self._session.cache,
+            f"{SERVICE_BASE_URL}/{endpoint}",
+            identifiers,
+            EoxRecord,
+            lambda ids: self._enumerate_results(
+                endpoint, [",".join(ids)], use_cache=False
+            ),
+            lambda record: record.eox_input_value,
+            lambda record: record.eox_error is not None,
+        )
+
     def _enumerate_results(
         self,
         endpoint: str,
         path_params: list,
         params: dict = {},
         page_index: int = 1,
+        max_workers: int = None,
+        ordered: bool = None,
+        prefetch: int = None,
+        use_cache: bool = True,
     ) -> Iterable[EoxRecord]:
         """
         Overload the default method for pagination.
 
         The EoX API behaves differently.  Pagination responses, urls,
-        and errors.
+        and errors.  Parallel pagination and prefetch default to the
+        session's page_workers, ordered_pages and prefetch_pages settings.
         """
+        session = self._session
+        deadline = session.retry_policy.start_deadline()
+        yield from paginate(
+            lambda index: self._get_page(
+                endpoint, path_params, params, index, deadline, use_cache
+            ),
+            page_index,
+            session.page_workers if max_workers is None else max_workers,
+            session.ordered_pages if ordered is None else ordered,
+            session.prefetch_pages if prefetch is None else prefetch,
+        )
+
+    def _get_page(
+        self,
+        endpoint: str,
+        path_params: list,
+        params: dict = {},
+        page_index: int = 1,
+        deadline: float = None,
+        use_cache: bool = True,
+    ) -> Page:
+        """Fetches and parses a single page of EoX records."""
         path = (
             f"{SERVICE_BASE_URL}/{endpoint}/{page_index}/"
             f"{'/'.join(x for x in path_params)}"
         )
-        json = self._session._get(path, {**self._default_params, **params})
+        json = self._session._get(
+            path, {**self._default_params, **params}, deadline, use_cache
+        )
 
         if "EOXError" in json:  # check for errors
             raise EoxError(json["EOXError"])
-        else:
-            response = EoxResponse(**json)
-            # break out the response into paging and EoX data
-            eox_records, pagination_response = (
-                response.eox_record,
-                response.pagination_response_record,
-            )
-            for record in eox_records:
-                yield record
-            # if there are more pages, iterate through the next one
-            if pagination_response.page_index < pagination_response.last_index:
-                page_index += 1
-                yield from self._enumerate_results(
-                    endpoint, path_params, params, page_index
-                )
+        response = EoxResponse(**json)
+        return Page.from_record(
+            response.eox_record, response.pagination_response_record
+        )
 
     def _get_date(self, d: Union[str, datetime.date]) -> str:
         return d.strftime("%Y-%m-%d") if isinstance(d, date) else d
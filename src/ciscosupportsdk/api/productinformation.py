@@ -1,6 +1,7 @@
 from typing import Iterable
 
 from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.cache import cached_entities
 from ciscosupportsdk.models.productinformation import (
     ProductInformationRecord,
     ProductInformationResponse,
@@ -10,6 +11,8 @@ from ciscosupportsdk.models.productinformation import (
 from ciscosupportsdk.validate import CheckSize
 
 SERVICE_BASE_URL = "/product/v1/information"
+# most product IDs a single request takes
+MAX_PRODUCT_IDS = 5
 
 
 class ProductInformationApi(object):
@@ -44,9 +47,18 @@ class ProductInformationApi(object):
         Returns product information associated with the specified product
         identifier or identifiers.
         """
-        path = f"{SERVICE_BASE_URL}/product_ids/" f"{','.join(product_ids)}"
-        yield from self._session.enumerate_results(
-            ProductInformationResponse, path
+        path = f"{SERVICE_BASE_URL}/product_ids"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            product_ids,
+            ProductInformationRecord,
+            lambda ids: self._session.enumerate_results(
+                ProductInformationResponse,
+                f"{path}/{','.join(ids)}",
+                use_cache=False,
+            ),
+            lambda record: record.product_id,
         )
 
     @CheckSize("product_ids", 5)
@@ -59,7 +71,14 @@ class ProductInformationApi(object):
         framework (MDF) identifiers associated with the specified product
         identifier or identifiers.
         """
-        path = (
-            f"{SERVICE_BASE_URL}/product_ids_mdf/" f"{','.join(product_ids)}"
+        path = f"{SERVICE_BASE_URL}/product_ids_mdf"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            product_ids,
+            ProductMDFRecord,
+            lambda ids: self._session.enumerate_results(
+                ProductMDFResponse, f"{path}/{','.join(ids)}", use_cache=False
+            ),
+            lambda record: record.product_id,
         )
-        yield from self._session.enumerate_results(ProductMDFResponse, path)
@@ -1,6 +1,8 @@
 from typing import Iterable
 
 from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.bulk import DEFAULT_BULK_WORKERS, BulkResult, bulk_lookup
+from ciscosupportsdk.cache import cached_entities
 from ciscosupportsdk.models.serialnumbertoinformation import (
     CoverageOwnerStatus,
     CoverageOwnerStatusResponse,
@@ -16,6 +18,13 @@ from ciscosupportsdk.models.serialnumbertoinformation import (
 from ciscosupportsdk.validate import CheckSize
 
 SERVICE_BASE_URL = "/sn2info/v2"
+# most serial numbers a single request takes
+MAX_SERIAL_NUMBERS = 75
+
+
+def normalize_serial(serial_number: str) -> str:
+    """Serial numbers are upper case, without surrounding white space."""
+    return serial_number.strip().upper()
 
 
 class SerialNumberToInformationAPI(object):
@@ -41,12 +50,20 @@ class SerialNumberToInformationAPI(object):
             by commas.
         :rtype: Iterable[CoverageStatus]
         """
-        path = (
-            f"{SERVICE_BASE_URL}/coverage/status/serial_numbers/"
-            f"{','.join(serial_numbers)}"
-        )
-        yield from self._session.enumerate_results(
-            CoverageStatusResponse, path, paging=False
+        path = f"{SERVICE_BASE_URL}/coverage/status/serial_numbers"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            serial_numbers,
+            CoverageStatus,
+            lambda ids: self._session.enumerate_results(
+                CoverageStatusResponse,
+                f"{path}/{','.join(ids)}",
+                paging=False,
+                use_cache=False,
+            ),
+            lambda record: record.serial_number,
+            lambda record: not record.is_covered,
         )
 
     @CheckSize("serial_numbers", 75)
@@ -63,24 +80,38 @@ class SerialNumberToInformationAPI(object):
             by commas.
         :rtype: Iterable[CoverageSummary]
         """
-        path = (
-            f"{SERVICE_BASE_URL}/coverage/summary/serial_numbers/"
-            f"{','.join(serial_numbers)}"
-        )
-        yield from self._session.enumerate_results(
-            CoverageSummaryResponse, path
+        path = f"{SERVICE_BASE_URL}/coverage/summary/serial_numbers"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            serial_numbers,
+            CoverageSummary,
+            lambda ids: self._session.enumerate_results(
+                CoverageSummaryResponse,
+                f"{path}/{','.join(ids)}",
+                use_cache=False,
+            ),
+            lambda record: record.sr_no,
+            lambda record: not record.is_covered,
         )
 
     @CheckSize("instance_numbers", 75)
     def get_coverage_summary_by_instance(
         self, instance_numbers: list[str]
     ) -> Iterable[CoverageSummaryByInstance]:
-        path = (
-            f"{SERVICE_BASE_URL}/coverage/summary/instance_numbers/"
-            f"{','.join(instance_numbers)}"
-        )
-        yield from self._session.enumerate_results(
-            CoverageSummaryByInstanceResponse, path
+        path = f"{SERVICE_BASE_URL}/coverage/summary/instance_numbers"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            instance_numbers,
+            CoverageSummaryByInstance,
+            lambda ids: self._session.enumerate_results(
+                CoverageSummaryByInstanceResponse,
+                f"{path}/{','.join(ids)}",
+                use_cache=False,
+            ),
+            lambda record: record.instance_number,
+            lambda record: not record.is_covered,
         )
 
     @CheckSize("serial_numbers", 75)
@@ -96,12 +127,20 @@ class SerialNumberToInformationAPI(object):
             by commas.
         :rtype: Iterable[OrderableProductList]
         """
-        path = (
-            f"{SERVICE_BASE_URL}/identifiers/orderable/serial_numbers/"
-            f"{','.join(serial_numbers)}"
-        )
-        yield from self._session.enumerate_results(
-            OrderableProductListResponse, path, paging=False
+        path = f"{SERVICE_BASE_URL}/identifiers/orderable/serial_numbers"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            serial_numbers,
+            OrderableProductList,
+            lambda ids: self._session.enumerate_results(
+                OrderableProductListResponse,
+                f"{path}/{','.join(ids)}",
+                paging=False,
+                use_cache=False,
+            ),
+            lambda record: record.sr_no,
+            lambda record: not record.orderable_pid_list,
         )
 
     @CheckSize("serial_numbers", 75)
@@ -117,10 +156,140 @@ class SerialNumberToInformationAPI(object):
             by commas.
         :rtype: Iterable[OrderableProductList]
         """
-        path = (
-            f"{SERVICE_BASE_URL}/coverage/owner_status/serial_numbers/"
-            f"{','.join(serial_numbers)}"
+        path = f"{SERVICE_BASE_URL}/coverage/owner_status/serial_numbers"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            serial_numbers,
+            CoverageOwnerStatus,
+            lambda ids: self._session.enumerate_results(
+                CoverageOwnerStatusResponse,
+                f"{path}/{','.join(ids)}",
+                paging=False,
+                use_cache=False,
+            ),
+            lambda record: record.serial_number,
+            lambda record: not record.is_covered,
+        )
+
+    def bulk_coverage_status(
+        self,
+        serial_numbers: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[BulkResult[CoverageStatus]]:
+        """
+        Returns coverage status for any number of serial numbers.
+
+        Serial numbers are upper cased and deduplicated, then looked up 75
+        at a time with several requests in flight.  A result is yielded
+        for each serial number as its request completes, a request that
+        fails reports its error on the results of its serial numbers
+        rather than ending the lookup.
+
+        :param: serial_numbers: Iterable[str]: Device serial numbers.
+        :param: max_workers: int: requests sent at the same time.
+        :param: ordered: bool: yield results in the order of serial_numbers.
+        :rtype: Iterable[BulkResult[CoverageStatus]]
+        """
+        yield from self._bulk(
+            self.get_coverage_status,
+            lambda record: record.serial_number,
+            serial_numbers,
+            max_workers,
+            ordered,
+        )
+
+    def bulk_coverage_summary_by_serial(
+        self,
+        serial_numbers: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[BulkResult[CoverageSummary]]:
+        """
+        Returns coverage status, warranty, and product identifier details for
+        any number of serial numbers.
+
+        :param: serial_numbers: Iterable[str]: Device serial numbers.
+        :param: max_workers: int: requests sent at the same time.
+        :param: ordered: bool: yield results in the order of serial_numbers.
+        :rtype: Iterable[BulkResult[CoverageSummary]]
+        """
+        yield from self._bulk(
+            self.get_coverage_summary_by_serial,
+            lambda record: record.sr_no,
+            serial_numbers,
+            max_workers,
+            ordered,
+        )
+
+    def bulk_orderable_pids(
+        self,
+        serial_numbers: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[BulkResult[OrderableProductList]]:
+        """
+        Returns the orderable PIDs for any number of serial numbers.
+
+        :param: serial_numbers: Iterable[str]: Device serial numbers.
+        :param: max_workers: int: requests sent at the same time.
+        :param: ordered: bool: yield results in the order of serial_numbers.
+        :rtype: Iterable[BulkResult[OrderableProductList]]
+        """
+        yield from self._bulk(
+            self.get_orderable_pids,
+            lambda record: record.sr_no,
+            serial_numbers,
+            max_workers,
+            ordered,
+        )
+
+    def bulk_coverage_owner_status(
+        self,
+        serial_numbers: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        ordered: bool = False,
+    ) -> Iterable[BulkResult[CoverageOwnerStatus]]:
+        """
+        Returns coverage and ownership status for any number of serial
+        numbers.
+
+        :param: serial_numbers: Iterable[str]: Device serial numbers.
+        :param: max_workers: int: requests sent at the same time.
+        :param: ordered: bool: yield results in the order of serial_numbers.
+        :rtype: Iterable[BulkResult[CoverageOwnerStatus]]
+        """
+        yield from self._bulk(
+            self.get_coverage_owner_status,
+            lambda record: record.serial_number,
+            serial_numbers,
+            max_workers,
+            ordered,
         )
-        yield from self._session.enumerate_results(
-            CoverageOwnerStatusResponse, path, paging=False
+
+    def _bulk(
+        self,
+        method,
+        key,
+        serial_numbers: Iterable[str],
+        max_workers: int,
+        ordered: bool,
+    ) -> Iterable[BulkResult]:
+        """
+        Looks up serial numbers with method, 75 at a time.
+
+        Serial numbers are upper cased, stripped and deduplicated, then
+        sent in chunks of 75, max_workers chunks at a time (and no faster
+        than the session's rate limiter allows).  A result is yielded for
+        each serial number, with the error of its chunk if that failed.
+        """
+        yield from bulk_lookup(
+            serial_numbers,
+            lambda chunk: list(method(chunk)),
+            key,
+            MAX_SERIAL_NUMBERS,
+            max_workers,
+            ordered,
+            normalize_serial,
         )
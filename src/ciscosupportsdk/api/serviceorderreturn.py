@@ -1,14 +1,38 @@
-from typing import Iterable
+from datetime import date, timedelta
+from typing import Iterable, Optional, Union
 
 from ciscosupportsdk.apisession import ApiError, ApiSession
+from ciscosupportsdk.bulk import DEFAULT_BULK_WORKERS, run_ahead, split_dates
 from ciscosupportsdk.models.serviceorderreturn import (
     Rma,
     RmaByUserResponse,
     RmaResponse,
     User,
 )
+from ciscosupportsdk.pagination import Page, paginate
 
 SERVICE_BASE_URL = "/return/v1.0/returns"
+# days of RMAs by user a single query covers, the service's default range
+MAX_DAYS = 30
+
+
+def rma_date(value: Union[str, date]) -> Optional[date]:
+    """The day of an RMA date, like an order_date, None if it has none."""
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+def latest_rma_date(rmas: Iterable[Rma]) -> Optional[date]:
+    """
+    The latest order date of the RMAs, to pass as since to the next
+    :meth:`ServiceOrderReturnApi.get_rma_history` pull.
+    """
+    dates = [rma_date(rma.order_date) for rma in rmas]
+    return max((d for d in dates if d is not None), default=None)
 
 
 class ServiceOrderReturnApi(object):
@@ -47,6 +71,7 @@ class ServiceOrderReturnApi(object):
         to_date: str = None,
         status: str = None,
         sort_by: str = None,
+        max_workers: int = None,
     ) -> Iterable[User]:
         """
         Returns a list of RMAs associated with the specified user.
@@ -55,6 +80,8 @@ class ServiceOrderReturnApi(object):
         :param: user_id: list[str]: Identifier of the user for which
             to return associated RMAs. Note: Only 1 user ID is accepted;
             currently, multiple user IDs are not supported.
+        :param: max_workers: int: pages fetched in parallel, defaults to
+            the session's page_workers.
         :rtype: Iterable[Rma]
         """
         # TODO: Input validation on query parameter fields.
@@ -65,20 +92,98 @@ class ServiceOrderReturnApi(object):
             "status": status,
             "sortBy": sort_by,
         }
-        json = self._session._get(path, params)
+        session = self._session
+        deadline = session.retry_policy.start_deadline()
+        yield from paginate(
+            lambda index: self._get_users_page(path, params, index, deadline),
+            max_workers=(
+                session.page_workers if max_workers is None else max_workers
+            ),
+            ordered=session.ordered_pages,
+            prefetch=session.prefetch_pages,
+        )
+
+    def get_rma_history(
+        self,
+        user_id: str,
+        from_date: Union[str, date] = None,
+        to_date: Union[str, date] = None,
+        status: str = None,
+        since: Union[str, date] = None,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        page_workers: int = None,
+    ) -> Iterable[Rma]:
+        """
+        Returns every RMA of a user ordered over a range of dates.
+
+        The range is split in windows of up to 30 days, max_workers
+        windows are queried at a time and the pages of each window are
+        fetched page_workers at a time.  RMAs are yielded window by
+        window, oldest first, each once.
+
+        For an incremental pull pass since, the latest RMA date already
+        seen, for instance from :func:`latest_rma_date`.  Only that day
+        onwards is queried, so RMAs of that day are returned again.
+
+        :param: user_id: str: Identifier of the user.
+        :param: from_date: First day of the range, as a date or a string
+            like 2021-06-14.  Defaults to since, or else 30 days before
+            to_date.
+        :param: to_date: Last day of the range, defaults to today.
+        :param: status: str: Return only RMAs with this status.
+        :param: since: Latest RMA date of an earlier pull.
+        :param: max_workers: int: windows queried at the same time.
+        :param: page_workers: int: pages of a window fetched in parallel,
+            defaults to the session's page_workers.
+        :rtype: Iterable[Rma]
+        """
+        end = rma_date(to_date) if to_date is not None else date.today()
+        if from_date is not None:
+            start = rma_date(from_date)
+            if since is not None:
+                start = max(start, rma_date(since))
+        elif since is not None:
+            start = rma_date(since)
+        else:
+            start = end - timedelta(days=MAX_DAYS - 1)
+        if start > end:
+            return
+        days = (end - start).days + 1
+        windows = split_dates(start, end, -(-days // MAX_DAYS))
+
+        def fetch(window: tuple[date, date]) -> list[User]:
+            return list(
+                self.get_rma_details_by_user_id(
+                    user_id,
+                    window[0].isoformat(),
+                    window[1].isoformat(),
+                    status,
+                    max_workers=page_workers,
+                )
+            )
+
+        seen = set()
+        for users in run_ahead(fetch, windows, max_workers, ordered=True):
+            for user in users:
+                for rma in user.returns:
+                    if rma.rma_no not in seen:
+                        seen.add(rma.rma_no)
+                        yield rma
+
+    def _get_users_page(
+        self,
+        path: str,
+        params: dict,
+        page_index: int = 1,
+        deadline: float = None,
+    ) -> Page:
+        """Fetches and parses a single page of RMAs by user."""
+        json = self._session._get(
+            path, {**params, "pageIndex": page_index}, deadline
+        )
         if "APIError" in json["OrderList"]:
             raise ApiError(json["OrderList"]["APIError"])
-        rma_user_resp = RmaByUserResponse(**json)
-
-        for user in rma_user_resp.order_list.users:
-            yield user
-        page_data = rma_user_resp.order_list.pagination_response_record
-        index = page_data.page_index
-
-        while page_data.page_index < page_data.page_records:
-            index += 1
-            params["pageIndex"] = index
-            json = self._session._get(path, params)
-            rma_user_resp = RmaByUserResponse(**json)
-            for user in rma_user_resp.order_list.users:
-                yield user
+        order_list = RmaByUserResponse(**json).order_list
+        return Page.from_record(
+            order_list.users, order_list.pagination_response_record
+        )
@@ -1,6 +1,8 @@
-from typing import Iterable
+from typing import Hashable, Iterable, Mapping, NamedTuple, Optional, Union
 
 from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.bulk import DEFAULT_BULK_WORKERS, bulk_lookup, run_ahead
+from ciscosupportsdk.cache import cached_entities
 from ciscosupportsdk.models.softwaresuggestion import (
     CompatableSoftwareResponse,
     Suggestion,
@@ -10,6 +12,78 @@ from ciscosupportsdk.models.softwaresuggestion import (
 from ciscosupportsdk.validate import CheckSize
 
 SERVICE_BASE_URL = "/software/suggestion/v2/suggestions"
+# most product or mdf IDs a single request takes
+MAX_IDS = 10
+
+
+class CompatibleQuery(NamedTuple):
+    """
+    The parameters of a compatible software lookup, in canonical form.
+
+    Build it with :meth:`canonical`, so queries that differ only in
+    whitespace or in the order of their features and hardware compare,
+    and hash, equal.
+    """
+
+    identifier: str
+    current_image: Optional[str] = None
+    current_release: Optional[str] = None
+    supported_features: tuple[str, ...] = ()
+    supported_hardware: tuple[str, ...] = ()
+
+    @classmethod
+    def canonical(
+        cls,
+        identifier: str,
+        current_image: str = None,
+        current_release: str = None,
+        supported_features: Iterable[str] = None,
+        supported_hardware: Iterable[str] = None,
+    ) -> "CompatibleQuery":
+        def strip(value: Optional[str]) -> Optional[str]:
+            return (value.strip() or None) if value is not None else None
+
+        def normalize(values: Optional[Iterable[str]]) -> tuple[str, ...]:
+            return tuple(sorted({v.strip() for v in values or () if v}))
+
+        return cls(
+            identifier.strip(),
+            strip(current_image),
+            strip(current_release),
+            normalize(supported_features),
+            normalize(supported_hardware),
+        )
+
+
+class FleetCompatible(NamedTuple):
+    """
+    The compatible software of a fleet of devices.
+
+    Attributes:
+        releases: the compatible releases of each distinct query
+        devices: the compatible releases of each device
+        errors: the error of each query that could not be looked up
+    """
+
+    releases: dict[CompatibleQuery, list[Suggestion]]
+    devices: dict[Hashable, list[Suggestion]]
+    errors: dict[CompatibleQuery, Exception]
+
+
+class FleetSuggestions(NamedTuple):
+    """
+    The suggested software of a fleet of devices.
+
+    Attributes:
+        suggestions: the suggestions of each distinct product (or mdf) ID,
+            one entry per software type
+        devices: the suggestions of each device
+        errors: the error of each ID that could not be looked up
+    """
+
+    suggestions: dict[str, list[Suggestions]]
+    devices: dict[Hashable, list[Suggestions]]
+    errors: dict[str, Exception]
 
 
 class SoftwareSuggestionApi(object):
@@ -34,12 +108,8 @@ class SoftwareSuggestionApi(object):
         :param: product_ids: list[str]: Base product IDs for which to return
             suggested software releases. A maximum of 10 PIDs are allowed.
         """
-        path = (
-            f"{SERVICE_BASE_URL}/software/productIds/"
-            f"{','.join(product_ids)}"
-        )
-        yield from self._session.enumerate_results(
-            SuggestionsByProductResponse, path
+        yield from self._cached_suggestions(
+            "software/productIds", product_ids, lambda s: s.product.base_pid
         )
 
     @CheckSize("product_ids", 10)
@@ -53,12 +123,8 @@ class SoftwareSuggestionApi(object):
         :param: product_ids: list[str]: Base product IDs for which to return
             suggested software releases. A maximum of 10 PIDs are allowed.
         """
-        path = (
-            f"{SERVICE_BASE_URL}/releases/productIds/"
-            f"{','.join(product_ids)}"
-        )
-        yield from self._session.enumerate_results(
-            SuggestionsByProductResponse, path
+        yield from self._cached_suggestions(
+            "releases/productIds", product_ids, lambda s: s.product.base_pid
         )
 
     def get_compatible_by_product_id(
@@ -76,15 +142,15 @@ class SoftwareSuggestionApi(object):
         :param: mdfIds: list[str]: Base mdf IDs for which to return suggested
             software releases. A maximum of 10 mdf Ids are allowed.
         """
-        path = f"{SERVICE_BASE_URL}/compatible/productId/{product_id}"
-        params = {
-            "currentImage": current_image,
-            "currentRelease": current_release,
-            "supportedFeatures": supported_features,
-            "supportedHardware": supported_hardware,
-        }
-        yield from self._session.enumerate_results(
-            CompatableSoftwareResponse, path, query_params=params
+        yield from self._compatible(
+            "productId",
+            CompatibleQuery.canonical(
+                product_id,
+                current_image,
+                current_release,
+                supported_features,
+                supported_hardware,
+            ),
         )
 
     @CheckSize("mdf_ids", 10)
@@ -98,9 +164,8 @@ class SoftwareSuggestionApi(object):
         :param: product_ids: list[str]: Base product IDs for which to return
             suggested software releases. A maximum of 10 PIDs are allowed.
         """
-        path = f"{SERVICE_BASE_URL}/software/mdfIds/" f"{','.join(mdf_ids)}"
-        yield from self._session.enumerate_results(
-            SuggestionsByProductResponse, path
+        yield from self._cached_suggestions(
+            "software/mdfIds", mdf_ids, lambda s: s.product.mdf_id
         )
 
     @CheckSize("mdf_ids", 10)
@@ -114,9 +179,8 @@ class SoftwareSuggestionApi(object):
         :param: product_ids: list[str]: Base product IDs for which to return
             suggested software releases. A maximum of 10 PIDs are allowed.
         """
-        path = f"{SERVICE_BASE_URL}/releases/mdfIds/" f"{','.join(mdf_ids)}"
-        yield from self._session.enumerate_results(
-            SuggestionsByProductResponse, path
+        yield from self._cached_suggestions(
+            "releases/mdfIds", mdf_ids, lambda s: s.product.mdf_id
         )
 
     def get_compatible_by_mdf_id(
@@ -134,13 +198,224 @@ class SoftwareSuggestionApi(object):
         :param: mdfIds: list[str]: Base mdf IDs for which to return suggested
             software releases. A maximum of 10 mdf Ids are allowed.
         """
-        path = f"{SERVICE_BASE_URL}/compatible/mdfId/{mdf_id}"
+        yield from self._compatible(
+            "mdfId",
+            CompatibleQuery.canonical(
+                mdf_id,
+                current_image,
+                current_release,
+                supported_features,
+                supported_hardware,
+            ),
+        )
+
+    def get_suggestions_for_fleet(
+        self,
+        devices: Union[Mapping[Hashable, str], Iterable[str]],
+        images: bool = False,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> FleetSuggestions:
+        """
+        Returns the suggested software releases of a fleet of devices.
+
+        Devices are collapsed to their distinct base PIDs, which are
+        looked up 10 per request with max_workers requests in flight.
+        With a cache on the session, suggestions are cached per PID for
+        the suggestion TTL and only PIDs not cached are requested.
+
+        :param: devices: base PIDs, or a mapping of device name to its
+            base PID.  The suggestions of each device are keyed by the
+            PID, or the name.
+        :param: images: bool: include the suggested images.
+        :param: max_workers: int: requests sent at the same time.
+        :rtype: FleetSuggestions
+        """
+        fetch = (
+            self.get_suggestions_and_image_by_product_ids
+            if images
+            else self.get_suggestions_by_product_ids
+        )
+        return self._fleet(
+            devices, fetch, lambda s: s.product.base_pid, max_workers
+        )
+
+    def get_suggestions_for_fleet_by_mdf_id(
+        self,
+        devices: Union[Mapping[Hashable, str], Iterable[str]],
+        images: bool = False,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> FleetSuggestions:
+        """
+        Returns the suggested software releases of a fleet of devices, by
+        their mdf IDs.
+
+        See :meth:`get_suggestions_for_fleet`.
+
+        :param: devices: mdf IDs, or a mapping of device name to its mdf
+            ID.
+        :param: images: bool: include the suggested images.
+        :param: max_workers: int: requests sent at the same time.
+        :rtype: FleetSuggestions
+        """
+        fetch = (
+            self.get_suggestions_and_image_by_mdf_ids
+            if images
+            else self.get_suggestions_by_mdf_ids
+        )
+        return self._fleet(
+            devices, fetch, lambda s: s.product.mdf_id, max_workers
+        )
+
+    def get_compatible_for_fleet(
+        self,
+        devices: Union[
+            Mapping[Hashable, Union[CompatibleQuery, tuple]],
+            Iterable[Union[CompatibleQuery, tuple]],
+        ],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> FleetCompatible:
+        """
+        Returns the compatible software releases of a fleet of devices.
+
+        Each device is described by the parameters of
+        :meth:`get_compatible_by_product_id`, a tuple of the product ID,
+        current image, current release, supported features and supported
+        hardware (trailing ones may be left out).  These are put in
+        canonical form, so devices sharing a query are looked up once,
+        with max_workers requests in flight.  With a cache on the session,
+        answers are also remembered across calls for the suggestion TTL.
+
+        :param: devices: queries, or a mapping of device name to its
+            query.  The releases of each device are keyed by the query, or
+            the name.
+        :param: max_workers: int: requests sent at the same time.
+        :rtype: FleetCompatible
+        """
+        return self._compatible_fleet("productId", devices, max_workers)
+
+    def get_compatible_for_fleet_by_mdf_id(
+        self,
+        devices: Union[
+            Mapping[Hashable, Union[CompatibleQuery, tuple]],
+            Iterable[Union[CompatibleQuery, tuple]],
+        ],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> FleetCompatible:
+        """
+        Returns the compatible software releases of a fleet of devices, by
+        their mdf IDs.
+
+        See :meth:`get_compatible_for_fleet`, queries start with the mdf ID
+        in place of the product ID.
+
+        :param: devices: queries, or a mapping of device name to its
+            query.
+        :param: max_workers: int: requests sent at the same time.
+        :rtype: FleetCompatible
+        """
+        return self._compatible_fleet("mdfId", devices, max_workers)
+
+    def _compatible_fleet(
+        self,
+        kind: str,
+        devices: Union[
+            Mapping[Hashable, Union[CompatibleQuery, tuple]],
+            Iterable[Union[CompatibleQuery, tuple]],
+        ],
+        max_workers: int,
+    ) -> FleetCompatible:
+        if isinstance(devices, Mapping):
+            named = devices.items()
+        else:
+            named = ((query, query) for query in devices)
+
+        # query -> devices asking it, dicts are used as ordered sets
+        fleet: dict[CompatibleQuery, dict[Hashable, None]] = {}
+        for device, query in named:
+            query = CompatibleQuery.canonical(*query)
+            fleet.setdefault(query, {})[device] = None
+
+        def lookup(query: CompatibleQuery):
+            try:
+                return query, list(self._compatible(kind, query)), None
+            except Exception as error:
+                return query, [], error
+
+        result = FleetCompatible({}, {}, {})
+        for query, releases, error in run_ahead(lookup, fleet, max_workers):
+            if error is not None:
+                result.errors[query] = error
+                continue
+            result.releases[query] = releases
+            for device in fleet[query]:
+                result.devices[device] = releases
+        return result
+
+    def _compatible(
+        self, kind: str, query: CompatibleQuery
+    ) -> Iterable[Suggestion]:
+        path = f"{SERVICE_BASE_URL}/compatible/{kind}/{query.identifier}"
         params = {
-            "currentImage": current_image,
-            "currentRelease": current_release,
-            "supportedFeatures": supported_features,
-            "supportedHardware": supported_hardware,
+            "currentImage": query.current_image,
+            "currentRelease": query.current_release,
+            "supportedFeatures": list(query.supported_features) or None,
+            "supportedHardware": list(query.supported_hardware) or None,
         }
         yield from self._session.enumerate_results(
             CompatableSoftwareResponse, path, query_params=params
         )
+
+    def _fleet(
+        self,
+        devices: Union[Mapping[Hashable, str], Iterable[str]],
+        fetch,
+        key,
+        max_workers: int,
+    ) -> FleetSuggestions:
+        if isinstance(devices, Mapping):
+            named = devices.items()
+        else:
+            named = ((identifier, identifier) for identifier in devices)
+
+        # ID -> devices with it, dicts are used as ordered sets
+        fleet: dict[str, dict[Hashable, None]] = {}
+        for device, identifier in named:
+            fleet.setdefault(identifier.strip(), {})[device] = None
+
+        result = FleetSuggestions({}, {}, {})
+        results = bulk_lookup(
+            fleet,
+            lambda chunk: list(fetch(chunk)),
+            key,
+            MAX_IDS,
+            max_workers,
+        )
+        for found in results:
+            if found.error is not None:
+                result.errors[found.identifier] = found.error
+                continue
+            result.suggestions[found.identifier] = found.records
+            for device in fleet.get(found.identifier, ()):
+                result.devices[device] = found.records
+        return result
+
+    def _cached_suggestions(
+        self, endpoint: str, identifiers: list[str], key
+    ) -> Iterable[Suggestions]:
+        """
+        Enumerates the suggestions of product or mdf IDs, caching them per
+        ID.
+        """
+        path = f"{SERVICE_BASE_URL}/{endpoint}"
+        yield from cached_entities(
+            self._session.cache,
+            path,
+            identifiers,
+            Suggestions,
+            lambda ids: self._session.enumerate_results(
+                SuggestionsByProductResponse,
+                f"{path}/{','.join(ids)}",
+                use_cache=False,
+            ),
+            key,
+        )
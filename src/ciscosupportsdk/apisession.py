@@ -1,17 +1,73 @@
+import threading
+import time
+from concurrent.futures import TimeoutError
 from typing import Iterable, Type, TypeVar
+from urllib.parse import urlsplit
 
 from authlib.integrations.requests_client import OAuth2Session
+from authlib.oauth2.rfc6749 import OAuth2Token
 from pydantic import BaseModel, HttpUrl
 
+from ciscosupportsdk.cache import ResponseCache, cache_key
+from ciscosupportsdk.coalesce import Coalescer
+from ciscosupportsdk.connection import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    ConnectionStats,
+    PooledAdapter,
+)
 from ciscosupportsdk.models.common import ApiResponse, CamelCaseApi
+from ciscosupportsdk.pagination import Page, paginate
+from ciscosupportsdk.ratelimit import RateLimiter, parse_retry_after
+from ciscosupportsdk.retry import RetryPolicy, remaining
+from ciscosupportsdk.tokenstore import TokenStore, token_key
 
 ResponseType = TypeVar("ResponseType", bound=ApiResponse)
 
 OAUTH2_URL = "https://id.cisco.com/oauth2/default/v1/token"
 BASE_URL = "https://apix.cisco.com"
+# seconds before expiry a token is treated as expired
+TOKEN_LEEWAY = 60
+# seconds to wait after a failed background refresh before trying again
+REFRESH_RETRY_DELAY = 5.0
 
 
 class ApiError(Exception):
+    """
+    Raised when the API returns an error or a request cannot be completed.
+
+    Carries what is known about the failure, so throttling can be told
+    apart from hard failures.
+
+    Attributes:
+        status_code: HTTP status of the last response, None when no
+            response was received
+        attempts: requests sent, including retries
+        throttled: the last response was a 429
+        retry_after: seconds the server asked to wait, if it did
+        retryable: the failure was transient, and could succeed later
+    """
+
+    def __init__(
+        self,
+        message,
+        status_code: int = None,
+        attempts: int = 1,
+        throttled: bool = False,
+        retry_after: float = None,
+        retryable: bool = False,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.attempts = attempts
+        self.throttled = throttled
+        self.retry_after = retry_after
+        self.retryable = retryable
+
+
+class DeadlineExceededError(ApiError):
+    """Raised when a call runs out of time before it could succeed."""
+
     pass
 
 
@@ -22,37 +78,338 @@ class ApiSession(object):
         client_secret: str,
         base_url: str = BASE_URL,
         token: dict = {},
+        token_url: str = OAUTH2_URL,
+        page_workers: int = 0,
+        ordered_pages: bool = True,
+        prefetch_pages: int = 0,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        token_pool_maxsize: int = 1,
+        rate_limiter: RateLimiter = None,
+        throttle_retries: int = 3,
+        retry_policy: RetryPolicy = None,
+        timeout: float = None,
+        token_store: TokenStore = None,
+        refresh_ahead: float = None,
+        cache: ResponseCache = None,
+        coalesce: bool = True,
     ) -> None:
         """Instances created help manage your API Session.
 
         Args:
             client_id(basestring): your client id to access the API
+            client_secret(basestring): your client secret to access the API
+            base_url(basestring): root of the support API service
+            token_url(basestring): OAuth2 token endpoint
+            page_workers(int): when more than one, pages after the first
+                are fetched in parallel by this many threads
+            ordered_pages(bool): with page_workers, yield items in page
+                order rather than as pages arrive
+            prefetch_pages(int): number of pages fetched in the background
+                ahead of the page being consumed
+            pool_connections(int): number of per-host connection pools kept
+            pool_maxsize(int): connections kept open to the API host,
+                defaults to enough for page_workers and at least 10
+            pool_block(bool): wait for a pooled connection rather than
+                opening a throw away one when all of them are busy
+            keep_alive(bool): reuse connections across requests
+            token_pool_maxsize(int): connections kept open to the token
+                endpoint
+            rate_limiter(RateLimiter): paces requests per API family, can
+                be shared with other sessions
+            throttle_retries(int): times a request throttled with a 429 is
+                retried after waiting out its Retry-After
+            retry_policy(RetryPolicy): how server errors, connection resets
+                and timeouts are retried, and the deadline of each call
+            timeout(float): seconds to wait on the server for each request
+            token_store(TokenStore): shares the OAuth token with other
+                sessions and processes using the same client_id
+            refresh_ahead(float): seconds before expiry the token is
+                refreshed in the background, so requests are not held up
+                by the refresh
+            cache(ResponseCache): caches responses for the TTL of their API
+                family, can be shared with other sessions
+            coalesce(bool): threads making the same request at the same
+                time share a single request and its result
+
+        The OAuth token is fetched on the first request made through the
+        session, unless a still valid token is passed in.  Threads sharing
+        a session wait on a single refresh rather than each fetching a
+        token.
         """
+        self.base_url = base_url
+        self.token_url = token_url
+        self.page_workers = page_workers
+        self.ordered_pages = ordered_pages
+        self.prefetch_pages = prefetch_pages
+        self.rate_limiter = rate_limiter
+        self.throttle_retries = throttle_retries
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self.token_store = token_store
+        self._token_key = token_key(client_id, token_url)
+        self.refresh_ahead = refresh_ahead
+        self.cache = cache
+        self._inflight = Coalescer() if coalesce else None
+        self._token_lock = threading.Lock()
+        self._refresh_after = 0.0
         self.token = token
         self.client = OAuth2Session(client_id, client_secret, token=self.token)
-        self.token = self.client.fetch_token(
-            OAUTH2_URL, grant_type="client_credentials"
+
+        # size the pools and mount them for the API and token hosts
+        if pool_maxsize is None:
+            pool_maxsize = max(DEFAULT_POOL_MAXSIZE, page_workers)
+        self.client.mount(
+            self._origin(self.token_url),
+            PooledAdapter(
+                pool_connections, token_pool_maxsize, pool_block, keep_alive
+            ),
         )
-        print(self.token)
+        self.client.mount(
+            self._origin(self.base_url),
+            PooledAdapter(
+                pool_connections, pool_maxsize, pool_block, keep_alive
+            ),
+        )
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}/"
+
+    def connection_stats(self) -> dict[str, ConnectionStats]:
+        """
+        Connections created versus reused, for the ``api`` and the
+        ``token`` endpoints.
+
+        When both are served from the same host they share a pool, and
+        the same counts are reported for both.
+        """
+        urls = {"api": self.base_url, "token": self.token_url}
+        return {
+            name: self.client.get_adapter(self._origin(url)).stats()
+            for name, url in urls.items()
+        }
 
     def _check_token(self):
-        if self.client.token.is_expired:
-            self.token = self.client.fetch_token(
-                OAUTH2_URL, grant_type="client_credentials"
-            )
+        # the token is fetched on the first request, and again on expiry,
+        # the lock is only taken when a refresh is due
+        token = self.client.token
+        if not token or token.is_expired(TOKEN_LEEWAY):
+            with self._token_lock:
+                # another thread may have refreshed it while this one waited
+                token = self.client.token
+                if not token or token.is_expired(TOKEN_LEEWAY):
+                    self._refresh_token(TOKEN_LEEWAY)
+        elif self.refresh_ahead and token.is_expired(self.refresh_ahead):
+            self._refresh_in_background()
 
-    def _get(self, path: str, params: dict) -> str:
-        """Sends an HTTP get request to the service endpoint."""
-        request_url: HttpUrl = f"{BASE_URL}{path}"
-        # check and refresh the token if needed
-        self._check_token()
-        response = self.client.get(request_url, params=params)
-        if response.status_code == 200:
-            return response.json()
+    def _refresh_token(self, leeway: float) -> None:
+        """Fetches a token, or loads one valid for leeway from the store."""
+        if self.token_store is None:
+            self._fetch_token()
         else:
-            # TODO: handle rate limiting requests
-            msg: str = f"{response.status_code}: {response.content}"
-            raise ApiError(msg)
+            self._load_token(leeway)
+
+    def _fetch_token(self) -> None:
+        self.token = self.client.fetch_token(
+            self.token_url, grant_type="client_credentials"
+        )
+
+    def _load_token(self, leeway: float) -> None:
+        """Uses the stored token, or refreshes the stored token."""
+        store = self.token_store
+        with store.lock(self._token_key):
+            stored = store.load(self._token_key)
+            if stored:
+                token = OAuth2Token.from_dict(stored)
+                if not token.is_expired(leeway):
+                    self.client.token = token
+                    self.token = self.client.token
+                    return
+            self._fetch_token()
+            store.save(self._token_key, dict(self.token))
+
+    def _refresh_in_background(self) -> None:
+        # a refresh already under way, in the background or not, will do
+        if time.monotonic() < self._refresh_after:
+            return
+        if not self._token_lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(
+                target=self._background_refresh,
+                name="ciscosupportsdk-token",
+                daemon=True,
+            ).start()
+        except BaseException:
+            self._token_lock.release()
+            raise
+
+    def _background_refresh(self) -> None:
+        try:
+            token = self.client.token
+            if not token or token.is_expired(self.refresh_ahead):
+                self._refresh_token(self.refresh_ahead)
+        except Exception:
+            # the token is still valid, try again later, a request that
+            # finds it expired refreshes it and raises any error
+            self._refresh_after = time.monotonic() + REFRESH_RETRY_DELAY
+        finally:
+            self._token_lock.release()
+
+    def _get(
+        self,
+        path: str,
+        params: dict,
+        deadline: float = None,
+        use_cache: bool = True,
+    ) -> dict:
+        """
+        Gets a response from the cache, or from the service endpoint.
+
+        A request already in flight from another thread is not sent again,
+        its response is shared.  Callers caching the response themselves,
+        like :func:`ciscosupportsdk.cache.cached_entities`, pass use_cache
+        False so it is neither looked up nor stored under its URL.
+        """
+        key = cache_key(path, params)
+        ttl = (
+            self.cache.ttl(path)
+            if self.cache is not None and use_cache
+            else None
+        )
+        if ttl:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        def send() -> dict:
+            response = self._send(path, params, deadline)
+            if ttl:
+                self.cache.set(key, response, ttl)
+            return response
+
+        if self._inflight is None:
+            return send()
+        try:
+            return self._inflight.call(key, send, remaining(deadline))
+        except TimeoutError:
+            raise DeadlineExceededError(
+                "deadline exceeded waiting on a shared request",
+                retryable=True,
+            ) from None
+
+    def _send(self, path: str, params: dict, deadline: float = None) -> dict:
+        """
+        Sends an HTTP get request to the service endpoint.
+
+        Throttled requests are retried after their Retry-After, transient
+        failures as the retry policy allows, until the deadline (a
+        time.monotonic() value) passes.
+        """
+        request_url: HttpUrl = f"{self.base_url}{path}"
+        policy = self.retry_policy
+        if deadline is None:
+            deadline = policy.start_deadline()
+        failures = throttled = 0
+        while True:
+            attempts = failures + throttled + 1
+            # check and refresh the token if needed
+            self._check_token()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path)
+            try:
+                response = self.client.get(
+                    request_url,
+                    params=params,
+                    timeout=self._request_timeout(deadline, attempts),
+                )
+            except Exception as error:
+                if not policy.is_retryable_error(error):
+                    raise
+                failures += 1
+                if not policy.can_retry("GET", failures):
+                    raise ApiError(
+                        f"{type(error).__name__}: {error}",
+                        attempts=attempts,
+                        retryable=True,
+                    ) from error
+                self._wait(policy.backoff(failures), deadline, attempts)
+                continue
+
+            status_code = response.status_code
+            if status_code == 200:
+                return response.json()
+            msg: str = f"{status_code}: {response.content}"
+            if status_code == 429:
+                retry_after = parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+                if throttled >= self.throttle_retries:
+                    raise ApiError(
+                        msg,
+                        status_code,
+                        attempts,
+                        throttled=True,
+                        retry_after=retry_after,
+                        retryable=True,
+                    )
+                throttled += 1
+                self._throttled(path, retry_after, deadline, attempts)
+                continue
+            if policy.is_retryable_status(status_code):
+                failures += 1
+                if policy.can_retry("GET", failures):
+                    self._wait(policy.backoff(failures), deadline, attempts)
+                    continue
+                raise ApiError(msg, status_code, attempts, retryable=True)
+            raise ApiError(msg, status_code, attempts)
+
+    def _request_timeout(self, deadline: float, attempts: int) -> float:
+        """The timeout for a request, never running past the deadline."""
+        left = remaining(deadline)
+        if left is None:
+            return self.timeout
+        if left <= 0:
+            raise DeadlineExceededError(
+                "deadline exceeded", attempts=attempts - 1, retryable=True
+            )
+        return left if self.timeout is None else min(self.timeout, left)
+
+    def _wait(self, seconds: float, deadline: float, attempts: int) -> None:
+        """Sleeps before a retry, unless that would pass the deadline."""
+        left = remaining(deadline)
+        if left is not None and seconds >= left:
+            raise DeadlineExceededError(
+                "deadline exceeded before the next retry",
+                attempts=attempts,
+                retryable=True,
+            )
+        time.sleep(seconds)
+
+    def _throttled(
+        self, path: str, retry_after: float, deadline: float, attempts: int
+    ) -> None:
+        """Waits out a 429, holding back the rest of the API family too."""
+        if self.rate_limiter is None or self.rate_limiter.bucket(path) is None:
+            # nothing paces this family, so wait here
+            self._wait(retry_after, deadline, attempts)
+            return
+        left = remaining(deadline)
+        if left is not None and retry_after >= left:
+            raise DeadlineExceededError(
+                "deadline exceeded while throttled",
+                429,
+                attempts,
+                throttled=True,
+                retry_after=retry_after,
+                retryable=True,
+            )
+        # the next acquire for this family waits until retry_after
+        self.rate_limiter.throttled(path, retry_after)
 
     def get_result(
         self,
@@ -76,34 +433,65 @@ class ApiSession(object):
         query_params: dict = {},
         page_index: int = 1,
         paging: bool = True,
+        max_workers: int = None,
+        ordered: bool = None,
+        prefetch: int = None,
+        use_cache: bool = True,
     ) -> Iterable[BaseModel]:
         """
         Used when an API response returns a list of objects.
 
         This method is a generator in support pagination of
-        potentially large amounts of data to process.
+        potentially large amounts of data to process.  Pass max_workers
+        (or set page_workers on the session) to fetch the remaining pages
+        in parallel once the first page reports the last page index, or
+        prefetch (prefetch_pages) to fetch pages in the background while
+        the current one is consumed.  The retry policy deadline covers
+        every page of the enumeration.  Pass use_cache False to skip the
+        session's response cache.
         """
+        deadline = self.retry_policy.start_deadline()
+        yield from paginate(
+            lambda index: self.get_page(
+                response_type,
+                path,
+                query_params,
+                index,
+                paging,
+                deadline,
+                use_cache,
+            ),
+            page_index,
+            self.page_workers if max_workers is None else max_workers,
+            self.ordered_pages if ordered is None else ordered,
+            self.prefetch_pages if prefetch is None else prefetch,
+        )
+
+    def get_page(
+        self,
+        response_type: Type[ResponseType],
+        path: str,
+        query_params: dict = {},
+        page_index: int = 1,
+        paging: bool = True,
+        deadline: float = None,
+        use_cache: bool = True,
+    ) -> Page:
+        """Fetches and parses a single page of a list response."""
+        query_params = {**query_params}
         if issubclass(response_type, CamelCaseApi):
             query_params["pageIndex"] = page_index
         else:
             query_params["page_index"] = page_index
 
-        # get the response, return the items
-        json = self._get(path, query_params)
+        json = self._get(path, query_params, deadline, use_cache)
         if "APIError" in json:  # houston, we have a problem!
             raise ApiError(json)
 
         response = response_type(**json)
-        for item in response.items:
-            yield item
-
-        # handle pagination, if needed
-        if hasattr(response, "pagination_response_record"):
-            pages = response.pagination_response_record
-            if pages is not None:
-                # if there are more pages, iterate through them as well
-                if pages.page_index < pages.last_index:
-                    page_index += 1
-                    yield from self.enumerate_results(
-                        response_type, path, query_params, page_index
-                    )
+        if not paging:
+            return Page(response.items)
+        return Page.from_record(
+            response.items,
+            getattr(response, "pagination_response_record", None),
+        )
@@ -0,0 +1,189 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import (
+    Callable,
+    Generic,
+    Iterable,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+DEFAULT_BULK_WORKERS = 4
+
+
+class BulkResult(NamedTuple, Generic[ModelType]):
+    """
+    The records found for one input of a bulk lookup.
+
+    When the request for the input's chunk failed, records is empty and
+    error is what it failed with.
+    """
+
+    identifier: str
+    records: list[ModelType]
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def unique(
+    identifiers: Iterable[str], normalize: Callable[[str], str] = None
+) -> Iterable[str]:
+    """Yields each identifier once, normalized, skipping blank ones."""
+    seen = set()
+    for identifier in identifiers:
+        if normalize is not None:
+            identifier = normalize(identifier)
+        if identifier and identifier not in seen:
+            seen.add(identifier)
+            yield identifier
+
+
+def chunked(items: Iterable[ItemType], size: int) -> Iterable[list]:
+    """Yields lists of up to size items."""
+    items = iter(items)
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+
+def date_windows(
+    start: datetime, end: datetime, size: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """
+    Splits the range from start to end into windows of at most size.
+
+    Each window starts where the one before it ends, so a record dated
+    on a boundary may be returned by both windows.
+    """
+    if end < start:
+        raise ValueError(f"range ends ({end}) before it starts ({start})")
+    windows = []
+    while True:
+        window_end = min(start + size, end)
+        windows.append((start, window_end))
+        if window_end >= end:
+            return windows
+        start = window_end
+
+
+def split_dates(start: date, end: date, parts: int) -> list[tuple[date, date]]:
+    """
+    Splits the inclusive range from start to end into up to parts ranges
+    of whole days that do not overlap.
+    """
+    if end < start:
+        raise ValueError(f"range ends ({end}) before it starts ({start})")
+    days = (end - start).days + 1
+    parts = max(1, min(parts, days))
+    return [
+        (
+            start + timedelta(days=days * n // parts),
+            start + timedelta(days=days * (n + 1) // parts - 1),
+        )
+        for n in range(parts)
+    ]
+
+
+def run_ahead(
+    func: Callable[[ItemType], ResultType],
+    items: Iterable[ItemType],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    ordered: bool = False,
+) -> Iterable[ResultType]:
+    """
+    Yields func applied to each item, running up to max_workers at once.
+
+    Items are taken from the iterable only as workers free up, so a huge
+    input is never read ahead into memory.  Results are yielded as they
+    complete, or in the order of the items when ordered.  Closing the
+    generator cancels the calls that have not started.
+    """
+    if max_workers <= 1:
+        yield from map(func, items)
+        return
+
+    items = iter(items)
+    pool = ThreadPoolExecutor(max_workers, "ciscosupportsdk-bulk")
+
+    def submit(count: int) -> list:
+        return [pool.submit(func, item) for item in islice(items, count)]
+
+    # keep a few calls queued so workers never wait on the consumer
+    depth = max_workers * 2
+    try:
+        if ordered:
+            pending = deque(submit(depth))
+            while pending:
+                result = pending.popleft().result()
+                pending.extend(submit(1))
+                yield result
+        else:
+            pending = set(submit(depth))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.update(submit(len(done)))
+                for future in done:
+                    yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def bulk_lookup(
+    identifiers: Iterable[str],
+    fetch: Callable[[list[str]], Iterable[ModelType]],
+    key: Callable[[ModelType], str],
+    chunk_size: int,
+    max_workers: int = DEFAULT_BULK_WORKERS,
+    ordered: bool = False,
+    normalize: Callable[[str], str] = None,
+) -> Iterable[BulkResult[ModelType]]:
+    """
+    Looks up any number of identifiers on an endpoint taking a few at a
+    time.
+
+    Identifiers are normalized and deduplicated, then fetched in chunks
+    of chunk_size, max_workers chunks at a time.  A result is yielded for
+    every identifier, keyed back to it, as its chunk completes or in
+    input order when ordered.  A chunk that fails yields its error for
+    each of its identifiers, the other chunks carry on.
+
+    Args:
+        identifiers: the identifiers to look up
+        fetch: fetches the records of a chunk of identifiers
+        key: returns the identifier a record belongs to
+        chunk_size: most identifiers fetch takes at once
+        max_workers: chunks fetched at the same time
+        ordered: yield results in the order of the identifiers
+        normalize: applied to identifiers, and the keys of records, before
+            they are compared
+    """
+
+    def lookup(chunk: list[str]) -> list[BulkResult[ModelType]]:
+        found: dict[str, list[ModelType]] = {}
+        try:
+            for record in fetch(chunk):
+                record_key = key(record)
+                if normalize is not None and record_key:
+                    record_key = normalize(record_key)
+                found.setdefault(record_key, []).append(record)
+        except Exception as error:
+            return [BulkResult(i, [], error) for i in chunk]
+        results = [BulkResult(i, found.pop(i, [])) for i in chunk]
+        # records the service keyed differently than asked
+        results.extend(BulkResult(k, r) for k, r in found.items())
+        return results
+
+    chunks = chunked(unique(identifiers, normalize), chunk_size)
+    for results in run_ahead(lookup, chunks, max_workers, ordered):
+        yield from results
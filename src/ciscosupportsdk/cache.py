@@ -0,0 +1,426 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, NamedTuple, Optional, Type, TypeVar
+from urllib.parse import urlencode
+
+from pydantic import BaseModel
+
+from ciscosupportsdk.coalesce import Coalescer
+from ciscosupportsdk.services import api_family
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# seconds responses are cached for, keyed by API family, families that
+# are not listed (cases and returns) are not cached
+DEFAULT_TTLS = {
+    "eox": 24 * 60 * 60,
+    "product": 7 * 24 * 60 * 60,
+    "suggestion": 24 * 60 * 60,
+    "sn2info": 60 * 60,
+    "bug": 60 * 60,
+    "asd": 24 * 60 * 60,
+}
+# seconds identifiers without data (unknown, or not covered) are remembered
+# for, shorter than their family's TTL as data may be added for them
+DEFAULT_NEGATIVE_TTLS = {
+    "eox": 60 * 60,
+    "sn2info": 15 * 60,
+}
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# responses that report a failure of the whole request are not cached
+ERROR_KEYS = ("APIError", "EOXError")
+
+
+def cache_key(path: str, params: dict) -> str:
+    """
+    The key a response is cached under.
+
+    Query parameters are sorted and those without a value dropped, so the
+    same request always maps to the same key.
+    """
+    query = sorted(
+        (name, str(value))
+        for name, value in (params or {}).items()
+        if value is not None
+    )
+    return f"{path}?{urlencode(query)}" if query else path
+
+
+class CacheStats(NamedTuple):
+    """
+    Counts of cache lookups that were served, missed and evicted.
+
+    Negative hits are the hits that served a "no data" answer, they are
+    counted in hits too.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    negative_hits: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(*(a + b for a, b in zip(self, other)))
+
+
+class ResponseCache(object):
+    """
+    Keeps API responses for a time to live set per API family.
+
+    The session looks a request up by :func:`cache_key` before sending it
+    and stores successful responses.  Subclass it to cache elsewhere,
+    implementing :meth:`_load`, :meth:`_store` and :meth:`clear`.
+
+    Args:
+        ttls: seconds to cache responses for, keyed by API family, merged
+            over :data:`DEFAULT_TTLS`.  A TTL of 0 or None turns caching
+            off for the family.
+        negative_ttls: seconds to remember identifiers without data for,
+            keyed by API family, merged over :data:`DEFAULT_NEGATIVE_TTLS`
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, Optional[float]] = None,
+        negative_ttls: dict[str, Optional[float]] = None,
+    ) -> None:
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.negative_ttls = {**DEFAULT_NEGATIVE_TTLS, **(negative_ttls or {})}
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+        # identifiers being fetched by cached_entities()
+        self._inflight = Coalescer()
+
+    def ttl(self, path: str) -> Optional[float]:
+        """Seconds to cache a response to path for, None to not cache it."""
+        return self.ttls.get(api_family(path)) or None
+
+    def negative_ttl(self, path: str) -> Optional[float]:
+        """Seconds to remember an identifier without data, None to not."""
+        return self.negative_ttls.get(api_family(path)) or None
+
+    def get(self, key: str) -> Optional[dict]:
+        """A cached, unexpired response, None on a miss."""
+        payload = self._load(key)
+        self._count(CacheStats(hits=1) if payload else CacheStats(misses=1))
+        return json.loads(payload) if payload else None
+
+    def set(self, key: str, response: dict, ttl: float) -> None:
+        """Caches a response for ttl seconds, unless it reports an error."""
+        if any(name in response for name in ERROR_KEYS):
+            return
+        self._store(key, json.dumps(response), time.time() + ttl)
+
+    def stats(self) -> CacheStats:
+        """Hits, misses and evictions since the cache was created."""
+        with self._stats_lock:
+            return self._stats
+
+    def clear(self) -> None:
+        """Removes every cached response."""
+        raise NotImplementedError
+
+    def _count(self, stats: CacheStats) -> None:
+        with self._stats_lock:
+            self._stats += stats
+
+    def _load(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def _store(self, key: str, payload: str, expires_at: float) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """
+    A least recently used cache held in memory, bounded by size.
+
+    Responses are kept serialized, so their size is known and no caller
+    can change a cached response.  When the cache is full the least
+    recently used responses are evicted.
+
+    Args:
+        max_bytes: most bytes of serialized responses to keep
+        ttls: seconds to cache responses for, keyed by API family
+        negative_ttls: seconds to remember identifiers without data for,
+            keyed by API family
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: dict[str, Optional[float]] = None,
+        negative_ttls: dict[str, Optional[float]] = None,
+    ) -> None:
+        super().__init__(ttls, negative_ttls)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                self._count(CacheStats(evictions=1))
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _store(self, key: str, payload: str, expires_at: float) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        evicted = 0
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires_at, payload)
+            self.size += len(payload)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+        if evicted:
+            self._count(CacheStats(evictions=evicted))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+def sqlite_connection(
+    local: threading.local, path: str, timeout: float, schema: str
+) -> sqlite3.Connection:
+    """
+    The calling thread's connection to a SQLite database in WAL mode,
+    kept on local.  The database and its directory are created when
+    missing, and schema run on every new connection.
+    """
+    # connections cannot be shared between threads
+    db = getattr(local, "db", None)
+    if db is None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(path, timeout=timeout)
+        db.execute("PRAGMA journal_mode=WAL")
+        with db:
+            db.execute(schema)
+        local.db = db
+    return db
+
+
+class SqliteCache(ResponseCache):
+    """
+    A cache kept in a SQLite database, shared by every process using it.
+
+    Expired responses are removed when they are looked up, or all at once
+    by :meth:`purge`.  Statistics count this process's lookups only.
+
+    Args:
+        path: the database file, created when missing
+        ttls: seconds to cache responses for, keyed by API family
+        negative_ttls: seconds to remember identifiers without data for,
+            keyed by API family
+        timeout: seconds to wait for another process holding a lock
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: dict[str, Optional[float]] = None,
+        negative_ttls: dict[str, Optional[float]] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        super().__init__(ttls, negative_ttls)
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite_connection(
+            self._local,
+            self.path,
+            self.timeout,
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires_at REAL, payload TEXT)",
+        )
+
+    def _load(self, key: str) -> Optional[str]:
+        db = self._connect()
+        row = db.execute(
+            "SELECT expires_at, payload FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[0] <= time.time():
+            with db:
+                db.execute(
+                    "DELETE FROM responses WHERE key = ? AND expires_at = ?",
+                    (key, row[0]),
+                )
+            self._count(CacheStats(evictions=1))
+            return None
+        return row[1]
+
+    def _store(self, key: str, payload: str, expires_at: float) -> None:
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, expires_at, payload),
+            )
+
+    def purge(self) -> int:
+        """Removes expired responses, returns how many were removed."""
+        with self._connect() as db:
+            removed = db.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+        self._count(CacheStats(evictions=removed))
+        return removed
+
+    def clear(self) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM responses")
+
+
+def entity_key(path: str, identifier: str) -> str:
+    """The key the records of a single identifier are cached under."""
+    return f"entity:{path}/{identifier}"
+
+
+def cached_entities(
+    cache: Optional[ResponseCache],
+    path: str,
+    identifiers: list[str],
+    model: Type[ModelType],
+    fetch: Callable[[list[str]], Iterable[ModelType]],
+    key: Callable[[ModelType], str],
+    negative: Callable[[ModelType], bool] = None,
+) -> Iterable[ModelType]:
+    """
+    Yields the records of a batch of identifiers, fetching only those
+    that are not cached.
+
+    Batch endpoints join their identifiers into the request path, so a
+    response cached for one batch is of no use to a batch that differs by
+    a single identifier.  Here the records of each identifier are cached
+    on their own, under the batch path (without identifiers) and the
+    identifier, for the TTL of the path's API family.
+
+    Identifiers without data, those no record came back for or whose
+    records are all ``negative``, are remembered for the family's shorter
+    negative TTL, so asking for them again costs no request.
+
+    Records are yielded in the order of the identifiers passed, those of
+    identifiers that repeat are yielded once.  Identifiers another thread
+    is already fetching are not fetched again, their records are shared.
+    Without a cache, or with caching off for the family, the batch is
+    fetched as is, less repeated identifiers.
+
+    Args:
+        cache: where records are cached, None to not cache
+        path: the batch endpoint path, without the identifiers
+        identifiers: the batch of identifiers
+        model: the type of the records
+        fetch: called with the uncached identifiers, fetches their records
+        key: returns the identifier a record belongs to
+        negative: returns whether a record is a "no data" answer, like an
+            error record or a device without coverage
+    """
+    ttl = cache.ttl(path) if cache is not None else None
+    if not ttl:
+        yield from fetch(list(dict.fromkeys(identifiers)))
+        return
+
+    found: dict[str, list[ModelType]] = {}
+    missing = []
+    for identifier in dict.fromkeys(identifiers):
+        cached = cache.get(entity_key(path, identifier))
+        if cached is None:
+            missing.append(identifier)
+        else:
+            found[identifier] = [model.parse_obj(i) for i in cached["items"]]
+            if cached.get("negative"):
+                cache._count(CacheStats(negative_hits=1))
+
+    claimed = []
+    waiting = {}
+    for identifier in missing:
+        future, leader = cache._inflight.claim(entity_key(path, identifier))
+        if leader:
+            claimed.append(identifier)
+        else:
+            waiting[identifier] = future
+
+    unmatched = []
+    error = None
+    try:
+        fetched: dict[str, list[ModelType]] = {}
+        if claimed:
+            for record in fetch(claimed):
+                fetched.setdefault(key(record), []).append(record)
+        for identifier in claimed:
+            found[identifier] = fetched.pop(identifier, [])
+        # records the service keyed differently than asked, not cached
+        unmatched = [r for records in fetched.values() for r in records]
+        for identifier in claimed:
+            records = found[identifier]
+            if not records and unmatched:
+                # an unmatched record may be this identifier's, spelled
+                # differently, so its absence is not remembered
+                continue
+            empty = not records or (
+                negative is not None and all(map(negative, records))
+            )
+            expires = cache.negative_ttl(path) if empty else ttl
+            if not expires:
+                continue
+            cache.set(
+                entity_key(path, identifier),
+                {
+                    "items": [
+                        json.loads(record.json(by_alias=True))
+                        for record in records
+                    ],
+                    "negative": empty,
+                },
+                expires,
+            )
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        for identifier in claimed:
+            cache._inflight.resolve(
+                entity_key(path, identifier), found.get(identifier), error
+            )
+
+    for identifier, future in waiting.items():
+        found[identifier] = future.result()
+
+    for identifier in dict.fromkeys(identifiers):
+        yield from found.get(identifier, [])
+    yield from unmatched
@@ -0,0 +1,62 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Hashable, TypeVar
+
+ResultType = TypeVar("ResultType")
+
+
+class Coalescer(object):
+    """
+    Shares one call between the threads that make it at the same time.
+
+    The first thread to :meth:`claim` a key makes the call and
+    :meth:`resolve`\\ s it, threads claiming the same key meanwhile wait
+    for that result, or error, instead of making the call again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def claim(self, key: Hashable) -> tuple[Future, bool]:
+        """
+        The future of the call for key, and whether the caller is the one
+        to make the call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def resolve(
+        self, key: Hashable, result=None, error: BaseException = None
+    ) -> None:
+        """Hands the result, or error, of a claimed call to its waiters."""
+        with self._lock:
+            future = self._calls.pop(key)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def call(
+        self,
+        key: Hashable,
+        func: Callable[[], ResultType],
+        timeout: float = None,
+    ) -> ResultType:
+        """Makes the call for key, or waits up to timeout for its result."""
+        future, leader = self.claim(key)
+        if not leader:
+            return future.result(timeout)
+        try:
+            result = func()
+        except BaseException as error:
+            self.resolve(key, error=error)
+            raise
+        self.resolve(key, result)
+        return result
@@ -0,0 +1,90 @@
+import socket
+import threading
+import weakref
+from typing import NamedTuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class ConnectionStats(NamedTuple):
+    """Counts of connections opened versus reused by a connection pool."""
+
+    requests: int = 0
+    created: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests that were sent over an already open connection."""
+        return self.requests - self.created
+
+    def __add__(self, other: "ConnectionStats") -> "ConnectionStats":
+        return ConnectionStats(
+            self.requests + other.requests, self.created + other.created
+        )
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    A requests transport adapter with a sized, reusable connection pool.
+
+    Keeps count of the requests sent and of the distinct sockets they were
+    sent over, so TLS handshakes can be checked to be amortized across
+    requests.
+
+    Args:
+        pool_connections: number of per-host pools to keep
+        pool_maxsize: connections kept open per host
+        pool_block: wait for a free connection instead of opening a
+            throw away one when all pooled connections are busy
+        keep_alive: reuse connections between requests, and enable TCP
+            keep-alive on idle pooled sockets
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> None:
+        self.keep_alive = keep_alive
+        self._stats = ConnectionStats()
+        self._stats_lock = threading.Lock()
+        self._sockets = weakref.WeakSet()
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **kwargs):
+        if self.keep_alive:
+            kwargs.setdefault(
+                "socket_options",
+                HTTPConnection.default_socket_options
+                + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+            )
+        super().init_poolmanager(connections, maxsize, block, **kwargs)
+
+    def add_headers(self, request, **kwargs):
+        if not self.keep_alive:
+            request.headers["Connection"] = "close"
+
+    def build_response(self, req, resp):
+        # a socket not seen before means a new connection (and handshake)
+        sock = getattr(getattr(resp, "connection", None), "sock", None)
+        with self._stats_lock:
+            created = sock is not None and sock not in self._sockets
+            if created:
+                self._sockets.add(sock)
+            self._stats += ConnectionStats(1, int(created))
+        return super().build_response(req, resp)
+
+    def stats(self) -> ConnectionStats:
+        """Connections created and requests sent through this adapter."""
+        with self._stats_lock:
+            return self._stats
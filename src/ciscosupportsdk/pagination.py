@@ -0,0 +1,130 @@
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import Callable, Iterable, NamedTuple, Optional
+
+
+class Page(NamedTuple):
+    """A single page of results and where it sits in the result set."""
+
+    items: list
+    page_index: int = 1
+    last_index: int = 1
+    total_records: Optional[int] = None
+
+    @classmethod
+    def from_record(cls, items: Iterable, record) -> "Page":
+        """
+        Builds a page from the items and pagination record of a response.
+
+        Works with both the common and the EoX ``PaginationResponseRecord``,
+        a missing record means the response is not paged.
+        """
+        if record is None:
+            return cls(list(items))
+        return cls(
+            list(items),
+            record.page_index,
+            record.last_index,
+            record.total_records,
+        )
+
+    def next_index(self) -> Optional[int]:
+        """The index of the page after this one, None on the last page."""
+        if self.page_index < self.last_index:
+            return self.page_index + 1
+        return None
+
+
+def paginate(
+    fetch_page: Callable[[int], Page],
+    page_index: int = 1,
+    max_workers: int = 0,
+    ordered: bool = True,
+    prefetch: int = 0,
+) -> Iterable:
+    """
+    Yields every item of a paged result set.
+
+    Pages are fetched one after another in a loop, so the cost of each
+    item stays the same no matter how many pages deep the result set is.
+
+    When ``max_workers`` is more than one, the first page is fetched on
+    its own to learn the last page index, the remaining pages are then
+    fetched by a pool of that many threads.  A ``prefetch`` depth keeps
+    that many pages fetched and parsed in the background while the
+    consumer works through the current one.  Closing the generator
+    cancels any page that has not been requested yet.
+
+    Args:
+        fetch_page: called with a page index, returns that Page
+        page_index: the first page to fetch
+        max_workers: number of pages to fetch in parallel
+        ordered: when fetching in parallel, yield items in page order
+            rather than as pages arrive
+        prefetch: number of pages to keep in flight ahead of the
+            consumer, defaults to twice max_workers
+    """
+    if max_workers > 1 or prefetch > 0:
+        page = fetch_page(page_index)
+        if page.next_index() is None:
+            yield from page.items
+        else:
+            max_workers = max(max_workers, 1)
+            yield from _paginate_ahead(
+                fetch_page,
+                page,
+                max_workers,
+                prefetch or max_workers * 2,
+                ordered,
+            )
+        return
+
+    while page_index is not None:
+        page = fetch_page(page_index)
+        yield from page.items
+        page_index = page.next_index()
+
+
+def _paginate_ahead(
+    fetch_page: Callable[[int], Page],
+    first: Page,
+    max_workers: int,
+    depth: int,
+    ordered: bool,
+) -> Iterable:
+    # only ``depth`` pages are ever in flight, so a huge result set is not
+    # buffered in memory ahead of the consumer
+    page_indexes = iter(range(first.next_index(), first.last_index + 1))
+    pool = ThreadPoolExecutor(max_workers, "ciscosupportsdk-page")
+
+    def submit(count: int) -> list[Future]:
+        return [
+            pool.submit(fetch_page, index)
+            for index in islice(page_indexes, count)
+        ]
+
+    try:
+        if ordered:
+            pending = deque(submit(depth))
+            yield from first.items
+            while pending:
+                page = pending.popleft().result()
+                pending.extend(submit(1))
+                yield from page.items
+        else:
+            pending = set(submit(depth))
+            yield from first.items
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.update(submit(len(done)))
+                for future in done:
+                    yield from future.result().items
+    finally:
+        # an early exit or a failed page cancels what has not started
+        pool.shutdown(wait=False, cancel_futures=True)
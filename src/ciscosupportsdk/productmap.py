@@ -0,0 +1,232 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Generic, Iterable, Optional, Type
+
+from ciscosupportsdk.api.productinformation import (
+    MAX_PRODUCT_IDS,
+    ProductInformationApi,
+)
+from ciscosupportsdk.bulk import DEFAULT_BULK_WORKERS, bulk_lookup, unique
+from ciscosupportsdk.cache import ModelType, sqlite_connection
+from ciscosupportsdk.models.productinformation import (
+    ProductInformationRecord,
+    ProductMDFRecord,
+)
+
+DEFAULT_PRODUCT_MAP = os.path.join(
+    os.path.expanduser("~"), ".cache", "ciscosupportsdk", "products.db"
+)
+# seconds before an entry is looked up again, product data rarely changes
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+# seconds before a product ID without records is looked up again
+DEFAULT_NEGATIVE_MAX_AGE = 24 * 60 * 60
+
+
+class ProductTable(Generic[ModelType]):
+    """
+    The records of one kind of product lookup, by product ID.
+
+    Rows are read from the database the first time the table is used,
+    after that lookups of known product IDs are dictionary lookups.
+    Product IDs that are missing, or older than their map's max_age (its
+    negative_max_age for those without records), are fetched in batches,
+    several batches at a time, and written back.  Should a fetch fail,
+    stale records are returned rather than nothing, only product IDs
+    without any record raise the error.
+
+    Args:
+        product_map: the map the table belongs to
+        kind: the name of the table's rows in the database
+        model: the type of the records
+        fetch: fetches the records of a batch of product IDs
+    """
+
+    def __init__(
+        self,
+        product_map: "ProductMap",
+        kind: str,
+        model: Type[ModelType],
+        fetch: Callable[[list[str]], Iterable[ModelType]],
+    ) -> None:
+        self._map = product_map
+        self.kind = kind
+        self.model = model
+        self._fetch = fetch
+        self._entries: Optional[dict[str, tuple[float, list]]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._loaded())
+
+    def get(self, product_id: str) -> list[ModelType]:
+        """The records of a product ID, empty for an unknown one."""
+        return self.lookup([product_id]).get(product_id.strip(), [])
+
+    def lookup(self, product_ids: Iterable[str]) -> dict[str, list[ModelType]]:
+        """The records of each product ID, in the order given."""
+        product_ids = list(unique(product_ids, str.strip))
+        entries = self._loaded()
+        stale = [i for i in product_ids if self._is_stale(entries.get(i))]
+        if stale:
+            self._update(stale)
+        return {i: self._records(entries.get(i)) for i in product_ids}
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Fetches the stale records again, or every record when forced, and
+        returns the number of product IDs looked up.
+        """
+        entries = self._loaded()
+        product_ids = [
+            i for i, e in list(entries.items()) if force or self._is_stale(e)
+        ]
+        if product_ids:
+            self._update(product_ids)
+        return len(product_ids)
+
+    def _is_stale(self, entry: Optional[tuple[float, list]]) -> bool:
+        if entry is None:
+            return True
+        if entry[1]:
+            max_age = self._map.max_age
+        else:
+            max_age = self._map.negative_max_age
+        return max_age is not None and entry[0] + max_age <= time.time()
+
+    def _records(self, entry: Optional[tuple[float, list]]) -> list:
+        if entry is None:
+            return []
+        return list(entry[1])
+
+    def _loaded(self) -> dict[str, tuple[float, list]]:
+        with self._lock:
+            if self._entries is None:
+                rows = self._map._connect().execute(
+                    "SELECT product_id, fetched_at, records FROM products "
+                    "WHERE kind = ?",
+                    (self.kind,),
+                )
+                self._entries = {
+                    product_id: (
+                        fetched_at,
+                        [self.model.parse_obj(r) for r in json.loads(records)],
+                    )
+                    for product_id, fetched_at, records in rows
+                }
+            return self._entries
+
+    def _update(self, product_ids: list[str]) -> None:
+        results = list(
+            bulk_lookup(
+                product_ids,
+                lambda chunk: list(self._fetch(chunk)),
+                lambda record: record.product_id,
+                MAX_PRODUCT_IDS,
+                self._map.max_workers,
+                normalize=str.strip,
+            )
+        )
+        requested = set(product_ids)
+        unmatched = any(
+            result.records and result.identifier not in requested
+            for result in results
+        )
+        rows = []
+        error = None
+        entries = self._loaded()
+        for result in results:
+            if result.error is not None:
+                if result.identifier not in entries:
+                    error = result.error
+                continue
+            if not result.records and unmatched:
+                # an unmatched record may be this product ID's, spelled
+                # differently, so its absence is not remembered
+                continue
+            now = time.time()
+            entries[result.identifier] = (now, result.records)
+            records = [
+                json.loads(record.json(by_alias=True))
+                for record in result.records
+            ]
+            rows.append(
+                (self.kind, result.identifier, now, json.dumps(records))
+            )
+        with self._map._connect() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?)", rows
+            )
+        if error is not None:
+            raise error
+
+
+class ProductMap(object):
+    """
+    A persistent map of product IDs to their MDF and product information
+    records.
+
+    Product data practically never changes, so rather than asking the
+    product information API again for every lookup, the records are kept
+    in a SQLite database shared by every process using it.  Lookups only
+    cost a request for product IDs not seen before, or whose records are
+    older than max_age.  Product IDs the API has no records for are
+    remembered too, but only for the shorter negative_max_age, as they
+    may be too new to be known yet.
+    ::
+
+        products = ProductMap(api.product_information)
+        mdf = products.mdf.lookup(["ASR-903", "C9300-48P"])
+
+    Args:
+        api: the product information API to fetch records with
+        path: the database file, created when missing
+        max_age: seconds after which records are fetched again, None to
+            keep them until :meth:`ProductTable.refresh` is forced
+        negative_max_age: seconds after which product IDs without records
+            are looked up again, None to keep them like records
+        max_workers: requests sent at the same time
+        timeout: seconds to wait for another process holding a lock
+    """
+
+    def __init__(
+        self,
+        api: ProductInformationApi,
+        path: str = DEFAULT_PRODUCT_MAP,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+        negative_max_age: Optional[float] = DEFAULT_NEGATIVE_MAX_AGE,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        timeout: float = 30.0,
+    ) -> None:
+        self.path = path
+        self.max_age = max_age
+        self.negative_max_age = negative_max_age
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._local = threading.local()
+        self.mdf: ProductTable[ProductMDFRecord] = ProductTable(
+            self, "mdf", ProductMDFRecord, api.get_mdf_by_product_id
+        )
+        self.info: ProductTable[ProductInformationRecord] = ProductTable(
+            self, "info", ProductInformationRecord, api.get_info_by_product_id
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite_connection(
+            self._local,
+            self.path,
+            self.timeout,
+            "CREATE TABLE IF NOT EXISTS products ("
+            "kind TEXT, product_id TEXT, fetched_at REAL, "
+            "records TEXT, PRIMARY KEY (kind, product_id))",
+        )
+
+    def clear(self) -> None:
+        """Forgets every record."""
+        with self._connect() as db:
+            db.execute("DELETE FROM products")
+        for table in (self.mdf, self.info):
+            with table._lock:
+                table._entries = None
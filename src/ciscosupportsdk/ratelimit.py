@@ -0,0 +1,145 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from ciscosupportsdk.services import api_family
+
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def parse_retry_after(
+    value: Optional[str], default: float = DEFAULT_RETRY_AFTER
+) -> float:
+    """
+    Converts a Retry-After header to seconds to wait.
+
+    The header is either a number of seconds or an HTTP date.
+    """
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket(object):
+    """
+    A thread safe token bucket.
+
+    Tokens are added at ``rate`` per second up to ``burst``.  Taking a
+    token when none are left reserves a future one, the caller waits
+    until it is due, so concurrent callers are paced in turn rather than
+    all retrying at once.
+
+    Args:
+        rate: tokens added per second
+        burst: most tokens that can be saved up, defaults to one
+            second worth of tokens
+    """
+
+    def __init__(self, rate: float, burst: float = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, not {rate}")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Takes tokens and returns the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                elapsed = now - self._updated
+                self._tokens = min(
+                    self.burst, self._tokens + elapsed * self.rate
+                )
+                self._updated = now
+            self._tokens -= tokens
+            wait = self._updated - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return max(0.0, wait)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Blocks until tokens are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hands out no tokens for the next number of seconds."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._updated:
+                self._updated = until
+                # nothing saved up while paused, or a burst would follow
+                self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter(object):
+    """
+    Paces requests per API family.
+
+    Families are the API names in :data:`ciscosupportsdk.services.API_FAMILIES`
+    (bug, case, eox, sn2info, product, suggestion, rma).  One limiter can be
+    shared by any number of sessions and threads in a process.
+
+    Args:
+        rates: requests per second, keyed by API family
+        default_rate: requests per second for families not in rates, None
+            leaves them unlimited
+        burst: requests that may be sent back to back, defaults to one
+            second worth of requests
+    """
+
+    def __init__(
+        self,
+        rates: dict[str, float] = None,
+        default_rate: float = None,
+        burst: float = None,
+    ) -> None:
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        self.burst = burst
+        self._buckets: dict[Optional[str], Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, path: str) -> Optional[TokenBucket]:
+        """The bucket for the API family of a request path, if limited."""
+        family = api_family(path)
+        with self._lock:
+            if family not in self._buckets:
+                rate = self.rates.get(family, self.default_rate)
+                self._buckets[family] = (
+                    TokenBucket(rate, self.burst) if rate else None
+                )
+            return self._buckets[family]
+
+    def reserve(self, path: str) -> float:
+        """Takes a request slot and returns the seconds to wait for it."""
+        bucket = self.bucket(path)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, path: str) -> None:
+        """Blocks until a request to path may be sent."""
+        bucket = self.bucket(path)
+        if bucket is not None:
+            bucket.acquire()
+
+    def throttled(self, path: str, retry_after: float) -> None:
+        """Holds back every request to the family until retry_after."""
+        bucket = self.bucket(path)
+        if bucket is not None:
+            bucket.pause(retry_after)
@@ -0,0 +1,87 @@
+import random
+import time
+from typing import Optional
+
+from requests.exceptions import ConnectionError, Timeout
+
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy(object):
+    """
+    Decides when a failed request is retried and how long to wait first.
+
+    Server errors, connection resets and timeouts are retried with an
+    exponential backoff, ``backoff_factor * 2 ** (attempt - 1)`` seconds
+    capped at ``max_backoff``.  With jitter the wait is a random amount up
+    to that backoff, so clients that failed together do not retry together.
+    Only idempotent methods are retried.
+
+    The ``deadline`` bounds the whole call, including every retry and,
+    for paged results, every page of the enumeration.
+
+    Args:
+        max_attempts: tries per request, including the first one
+        backoff_factor: seconds to wait before the first retry
+        max_backoff: most seconds to wait between tries
+        jitter: randomize the wait
+        retry_statuses: HTTP status codes that are retried
+        retry_methods: HTTP methods that may be retried
+        deadline: seconds a call may take overall, None for no limit
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: frozenset[int] = RETRY_STATUSES,
+        retry_methods: frozenset[str] = IDEMPOTENT_METHODS,
+        deadline: float = None,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(retry_methods)
+        self.deadline = deadline
+
+    @classmethod
+    def never(cls) -> "RetryPolicy":
+        """A policy that makes a single attempt."""
+        return cls(max_attempts=1)
+
+    def start_deadline(self) -> Optional[float]:
+        """The time.monotonic() a call starting now must finish by."""
+        if self.deadline is None:
+            return None
+        return time.monotonic() + self.deadline
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait after the given (1 based) failed attempt."""
+        backoff = min(
+            self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)
+        )
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        return (
+            attempt < self.max_attempts
+            and method.upper() in self.retry_methods
+        )
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        return isinstance(error, (ConnectionError, Timeout))
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a deadline, None when there is no deadline."""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
@@ -0,0 +1,22 @@
+from typing import Optional
+
+# path prefixes of each support API, keyed to a short family name used to
+# configure per API behavior like rate limits
+API_FAMILIES = {
+    "/bug/": "bug",
+    "/case/": "case",
+    "/supporttools/eox/": "eox",
+    "/sn2info/": "sn2info",
+    "/product/": "product",
+    "/software/suggestion/": "suggestion",
+    "/return/": "rma",
+    "/software/": "asd",
+}
+
+
+def api_family(path: str) -> Optional[str]:
+    """Returns the API family a request path belongs to, if known."""
+    for prefix, family in API_FAMILIES.items():
+        if path.startswith(prefix):
+            return family
+    return None
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: nocover
+    fcntl = None
+    import msvcrt
+
+DEFAULT_TOKEN_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "ciscosupportsdk", "tokens"
+)
+
+
+def token_key(client_id: str, token_url: str) -> str:
+    """The key a client's token is stored under, without the client_id."""
+    return hashlib.sha256(f"{token_url}\n{client_id}".encode()).hexdigest()
+
+
+class TokenStore(object):
+    """
+    Keeps OAuth tokens so they can be shared rather than fetched again.
+
+    A session holds :meth:`lock` while it loads a token and, when none is
+    stored or the stored one is near expiry, fetches and saves a new one.
+    So only one holder of the lock refreshes a token at a time.
+
+    Subclass it to keep tokens elsewhere, implementing :meth:`load` and
+    :meth:`save`, and :meth:`lock` when the store is shared beyond a
+    single process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Held while a token is loaded, refreshed and saved."""
+        with self._lock:
+            yield
+
+    def load(self, key: str) -> Optional[dict]:
+        """The stored token, None when there is none."""
+        raise NotImplementedError
+
+    def save(self, key: str, token: dict) -> None:
+        """Stores a token."""
+        raise NotImplementedError
+
+
+class MemoryTokenStore(TokenStore):
+    """Shares tokens between the sessions of a single process."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._tokens: dict[str, dict] = {}
+
+    def load(self, key: str) -> Optional[dict]:
+        token = self._tokens.get(key)
+        return dict(token) if token is not None else None
+
+    def save(self, key: str, token: dict) -> None:
+        self._tokens[key] = dict(token)
+
+
+class FileTokenStore(TokenStore):
+    """
+    Shares tokens between processes through files in a directory.
+
+    Each token is a JSON file readable only by its owner, written
+    atomically, and refreshed under an exclusive file lock so processes
+    that start together make a single request to the token endpoint.
+
+    Args:
+        directory: where tokens are kept, defaults to
+            ``~/.cache/ciscosupportsdk/tokens``
+    """
+
+    def __init__(self, directory: str = DEFAULT_TOKEN_DIR) -> None:
+        super().__init__()
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        # the thread lock covers platforms where file locks are per process
+        with self._lock, open(self._path(key) + ".lock", "a+b") as fh:
+            _lock_file(fh)
+            try:
+                yield
+            finally:
+                _unlock_file(fh)
+
+    def load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key)) as fh:
+                token = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        return token if isinstance(token, dict) else None
+
+    def save(self, key: str, token: dict) -> None:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(token, fh)
+            os.chmod(temp, 0o600)
+            os.replace(temp, self._path(key))
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+
+def _lock_file(fh) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        return
+    fh.seek(0)  # pragma: nocover
+    while True:  # pragma: nocover
+        try:
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+            return
+        except OSError:
+            time.sleep(0.05)
+
+
+def _unlock_file(fh) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: nocover
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,208 @@
+import asyncio
+import time
+
+import pytest
+from mockserver import MockSupportServer
+
+pytest.importorskip("httpx")
+
+from ciscosupportsdk.aio import AsyncCiscoSupportAPI  # noqa: E402
+from ciscosupportsdk.api.eox import EoxError  # noqa: E402
+from ciscosupportsdk.apisession import ApiError  # noqa: E402
+from ciscosupportsdk.models.bug import Bug  # noqa: E402
+from ciscosupportsdk.models.eox import EoxRecord  # noqa: E402
+from ciscosupportsdk.ratelimit import RateLimiter  # noqa: E402
+
+BUG = {
+    "id": "1",
+    "behavior_changed": "",
+    "bug_id": "CSCvx00001",
+    "headline": "a bug",
+    "severity": "3",
+    "status": "O",
+    "last_modified_date": "2022-01-01",
+    "product": "Cisco IOS",
+    "known_affected_releases": "15.2(4)M",
+    "known_fixed_releases": "",
+    "support_case_count": "0",
+}
+
+
+def eox_page(page_index: int, last_index: int, pid: str) -> dict:
+    date = {"value": "2022-01-01", "dateFormat": "YYYY-MM-DD"}
+    return {
+        "PaginationResponseRecord": {
+            "PageIndex": page_index,
+            "LastIndex": last_index,
+            "TotalRecords": last_index,
+            "PageRecords": 1,
+        },
+        "EOXRecord": [
+            {
+                "EOLProductID": pid,
+                "ProductIDDescription": "",
+                "ProductBulletinNumber": "",
+                "LinkToProductBulletinURL": "",
+                "EOXExternalAnnouncementDate": date,
+                "EndOfSaleDate": date,
+                "EndOfSWMaintenanceReleases": date,
+                "EndOfRoutineFailureAnalysisDate": date,
+                "EndOfServiceContractRenewal": date,
+                "LastDateOfSupport": date,
+                "EndOfSvcAttachDate": date,
+                "UpdatedTimeStamp": date,
+                "EOXMigrationDetails": {
+                    "PIDActiveFlag": "Y",
+                    "MigrationInformation": "",
+                    "MigrationOption": "",
+                    "MigrationProductId": "",
+                    "MigrationProductName": "",
+                    "MigrationStrategy": "",
+                    "MigrationProductInfoURL": "",
+                },
+                "EOXInputType": "ShowEOXByPids",
+                "EOXInputValue": pid,
+            }
+        ],
+    }
+
+
+def bug_page(page_index: int, last_index: int) -> dict:
+    return {
+        "pagination_response_record": {
+            "title": "bugs",
+            "page_index": page_index,
+            "last_index": last_index,
+            "total_records": last_index,
+            "page_records": 1,
+            "self_link": "",
+        },
+        "bugs": [{**BUG, "bug_id": f"CSC{page_index:08d}"}],
+    }
+
+
+@pytest.fixture
+def server():
+    with MockSupportServer() as server:
+        yield server
+
+
+def make_api(server: MockSupportServer, **kwargs) -> AsyncCiscoSupportAPI:
+    return AsyncCiscoSupportAPI(
+        "DUMMY",
+        "DUMMY",
+        base_url=server.base_url,
+        token_url=server.token_url,
+        **kwargs,
+    )
+
+
+class TestAsyncApi:
+    def test_get_bug_details(self, server):
+        server.json("/bug/v2.0/bugs/bug_ids/", {"bugs": [BUG]})
+
+        async def run():
+            async with make_api(server) as api:
+                return [b async for b in api.bug.get_bug_details(["A"])]
+
+        bugs = asyncio.run(run())
+        assert isinstance(bugs[0], Bug)
+        assert server.token_requests == 1
+
+    def test_pagination(self, server):
+        server.route(
+            "/bug/v2.0/bugs/keyword/",
+            lambda path, query: (200, bug_page(int(query["page_index"]), 3)),
+        )
+
+        async def run():
+            async with make_api(server) as api:
+                return [b async for b in api.bug.get_bugs_by_keyword("x")]
+
+        bugs = asyncio.run(run())
+        assert [b.bug_id for b in bugs] == [
+            "CSC00000001",
+            "CSC00000002",
+            "CSC00000003",
+        ]
+
+    def test_eox_pagination(self, server):
+        def handler(path, query):
+            page_index = int(path.split("/")[6])
+            return 200, eox_page(page_index, 2, f"PID-{page_index}")
+
+        server.route("/supporttools/eox/rest/5/EOXByProductID/", handler)
+
+        async def run():
+            async with make_api(server) as api:
+                return [r async for r in api.eox.get_by_product_ids(["PID-*"])]
+
+        records = asyncio.run(run())
+        assert all(isinstance(r, EoxRecord) for r in records)
+        assert [r.eol_product_id for r in records] == ["PID-1", "PID-2"]
+
+    def test_concurrent_requests_share_token(self, server):
+        server.json("/bug/v2.0/bugs/bug_ids/", {"bugs": [BUG]})
+
+        async def run():
+            async with make_api(server) as api:
+
+                async def lookup(bug_id):
+                    return [b async for b in api.bug.get_bug_details([bug_id])]
+
+                return await asyncio.gather(
+                    *(lookup(str(i)) for i in range(20))
+                )
+
+        assert len(asyncio.run(run())) == 20
+        assert server.token_requests == 1
+        assert len(server.requests) == 20
+
+    def test_throttled_family_without_bucket(self, server):
+        calls = []
+
+        def handler(path, query):
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                return 429, {"message": "slow down"}, {"Retry-After": "0.2"}
+            return 200, {"bugs": [BUG]}
+
+        server.route("/bug/", handler)
+
+        async def run():
+            limiter = RateLimiter({"eox": 5})
+            async with make_api(server, rate_limiter=limiter) as api:
+                return [b async for b in api.bug.get_bug_details(["x"])]
+
+        asyncio.run(run())
+        assert calls[1] - calls[0] >= 0.2
+
+    def test_api_error(self, server):
+        server.json("/case/v3/cases/details/", {"message": "no"}, 500)
+
+        async def run():
+            async with make_api(server) as api:
+                await api.case.get_case_details("1")
+
+        with pytest.raises(ApiError):
+            asyncio.run(run())
+
+    def test_eox_error(self, server):
+        server.json(
+            "/supporttools/eox/rest/5/EOXBySerialNumber/",
+            {"EOXError": {"ErrorID": "SSA_ERR_026"}},
+        )
+
+        async def run():
+            async with make_api(server) as api:
+                async for _ in api.eox.get_by_serial_number(["nope"]):
+                    pass
+
+        with pytest.raises(EoxError):
+            asyncio.run(run())
+
+    def test_check_size(self, server):
+        api = make_api(server)
+        with pytest.raises(ValueError):
+            api.bug.get_bug_details(["1", "2", "3", "4", "5", "6"])
+        asyncio.run(api.close())
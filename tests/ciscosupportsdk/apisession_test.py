@@ -1,8 +1,12 @@
+import threading
+import time
+
 import pytest
 from authlib.integrations.base_client.errors import OAuthError
 from fixtures import *  # noqa
+from mockserver import MockSupportServer
 
-from ciscosupportsdk.api import ApiSession
+from ciscosupportsdk.api import ApiSession, CiscoSupportAPI
 from ciscosupportsdk.apisession import ApiError
 
 
@@ -31,3 +35,110 @@ class TestApiSession:
                 "(CallManager)/fixed_in_releases",
                 params={},
             )
+
+
+class TestLazyStartup:
+    def test_token_fetched_on_first_request(self):
+        with MockSupportServer() as server:
+            server.json("/bug/", {"bugs": []})
+            session = ApiSession(
+                "DUMMY",
+                "DUMMY",
+                base_url=server.base_url,
+                token_url=server.token_url,
+            )
+            assert server.token_requests == 0
+            session._get("/bug/v2.0/bugs/keyword/x", {})
+            session._get("/bug/v2.0/bugs/keyword/x", {})
+            assert server.token_requests == 1
+
+    def test_expired_token_is_refreshed(self):
+        with MockSupportServer() as server:
+            server.json("/bug/", {"bugs": []})
+            session = ApiSession(
+                "DUMMY",
+                "DUMMY",
+                base_url=server.base_url,
+                token_url=server.token_url,
+                token={"access_token": "old", "expires_at": 1},
+            )
+            session._get("/bug/v2.0/bugs/keyword/x", {})
+            assert server.token_requests == 1
+
+    def test_apis_created_on_first_access(self):
+        api = CiscoSupportAPI("DUMMY", "DUMMY")
+        assert "eox" not in vars(api)
+        assert api.eox is api.eox
+        assert api.service_order_return is api.rma
+        assert api.eox._session is api._session
+
+
+class TestTokenRefresh:
+    PATH = "/bug/v2.0/bugs/keyword/x"
+
+    def call_in_threads(self, session: ApiSession, count: int) -> None:
+        threads = [
+            threading.Thread(target=session._get, args=(self.PATH, {}))
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_single_flight(self):
+        with MockSupportServer() as server:
+            server.json("/bug/", {"bugs": []})
+            server.token_delay = 0.2
+            session = ApiSession(
+                "DUMMY",
+                "DUMMY",
+                base_url=server.base_url,
+                token_url=server.token_url,
+                token={"access_token": "old", "expires_at": 1},
+                coalesce=False,
+            )
+            self.call_in_threads(session, 16)
+            assert server.token_requests == 1
+            assert len(server.requests) == 16
+
+    def test_refresh_ahead(self):
+        with MockSupportServer() as server:
+            server.json("/bug/", {"bugs": []})
+            server.token_delay = 0.5
+            expires_at = int(time.time()) + 120
+            session = ApiSession(
+                "DUMMY",
+                "DUMMY",
+                base_url=server.base_url,
+                token_url=server.token_url,
+                token={"access_token": "old", "expires_at": expires_at},
+                refresh_ahead=300,
+            )
+            start = time.monotonic()
+            self.call_in_threads(session, 8)
+            # requests went ahead with the old token
+            assert time.monotonic() - start < 0.5
+            with session._token_lock:
+                assert server.token_requests == 1
+                assert session.client.token["expires_at"] > expires_at
+
+    def test_failed_refresh_ahead(self):
+        with MockSupportServer() as server:
+            server.json("/bug/", {"bugs": []})
+            session = ApiSession(
+                "DUMMY",
+                "DUMMY",
+                base_url=server.base_url,
+                token_url="http://127.0.0.1:1/token",
+                token={
+                    "access_token": "old",
+                    "expires_at": int(time.time()) + 120,
+                },
+                refresh_ahead=300,
+            )
+            session._get(self.PATH, {})
+            with session._token_lock:
+                assert session._refresh_after > time.monotonic()
+            session._get(self.PATH, {})
+            assert session.client.token["access_token"] == "old"
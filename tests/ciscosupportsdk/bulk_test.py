@@ -0,0 +1,629 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from mockserver import MockSupportServer, eox_page, eox_record
+
+from ciscosupportsdk.api import CiscoSupportAPI
+from ciscosupportsdk.api.softwaresuggestion import CompatibleQuery
+from ciscosupportsdk.apisession import ApiError
+from ciscosupportsdk.bulk import (
+    BulkResult,
+    bulk_lookup,
+    chunked,
+    date_windows,
+    run_ahead,
+)
+from ciscosupportsdk.cache import MemoryCache
+from ciscosupportsdk.models.case import Case
+from ciscosupportsdk.models.eox import OSType, SoftwareRelease
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_date_windows():
+    start = datetime(2023, 1, 1)
+    windows = date_windows(start, datetime(2023, 7, 1), timedelta(days=90))
+    assert windows == [
+        (start, datetime(2023, 4, 1)),
+        (datetime(2023, 4, 1), datetime(2023, 6, 30)),
+        (datetime(2023, 6, 30), datetime(2023, 7, 1)),
+    ]
+    assert date_windows(start, start, timedelta(days=1)) == [(start, start)]
+    with pytest.raises(ValueError):
+        date_windows(start, start - timedelta(days=1), timedelta(days=1))
+
+
+class TestRunAhead:
+    def test_ordered(self):
+        def slow(n):
+            time.sleep(0.01 * (5 - n))
+            return n
+
+        assert list(run_ahead(slow, range(5), 4, ordered=True)) == [
+            0,
+            1,
+            2,
+            3,
+            4,
+        ]
+        assert sorted(run_ahead(slow, range(5), 4)) == [0, 1, 2, 3, 4]
+
+    def test_bounded(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def work(n):
+            with lock:
+                running.append(n)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(n)
+            return n
+
+        assert len(list(run_ahead(work, range(20), 3))) == 20
+        assert max(peak) <= 3
+
+    def test_lazy_input(self):
+        taken = []
+
+        def items():
+            for n in range(1000):
+                taken.append(n)
+                yield n
+
+        results = run_ahead(lambda n: n, items(), 2)
+        next(results)
+        results.close()
+        assert len(taken) < 10
+
+
+class TestBulkLookup:
+    def test_keyed_results(self):
+        def fetch(chunk):
+            return [{"id": i} for i in chunk if i != "C"]
+
+        results = list(
+            bulk_lookup(
+                [" a", "B", "A", "c", ""],
+                fetch,
+                lambda record: record["id"],
+                2,
+                ordered=True,
+                normalize=lambda s: s.strip().upper(),
+            )
+        )
+        assert results == [
+            BulkResult("A", [{"id": "A"}]),
+            BulkResult("B", [{"id": "B"}]),
+            BulkResult("C", []),
+        ]
+
+    def test_failed_chunk(self):
+        def fetch(chunk):
+            if "B" in chunk:
+                raise ValueError("oops")
+            return [{"id": i} for i in chunk]
+
+        results = {
+            result.identifier: result
+            for result in bulk_lookup(
+                "ABCD", fetch, lambda record: record["id"], 2
+            )
+        }
+        assert results["C"].ok and results["D"].ok
+        assert not results["A"].ok
+        assert isinstance(results["B"].error, ValueError)
+
+
+class TestBulkSerialNumbers:
+    @pytest.fixture
+    def server(self):
+        def coverage(path, query):
+            serials = path.rsplit("/", 1)[1].split(",")
+            if "FAIL" in serials:
+                return 400, {"message": "bad request"}
+            return 200, {
+                "serial_numbers": [
+                    {
+                        "sr_no": serial,
+                        "is_covered": True,
+                        "coverage_end_date": "",
+                        "sr_no_owner": True,
+                    }
+                    for serial in serials
+                ]
+            }
+
+        with MockSupportServer() as server:
+            server.route("/sn2info/", coverage)
+            yield server
+
+    def test_bulk_coverage_status(self, server):
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+        serials = [f"sn{n}" for n in range(200)] + ["SN1", "FAIL"]
+        results = list(
+            api.serial_information.bulk_coverage_owner_status(
+                serials, ordered=True
+            )
+        )
+        assert [r.identifier for r in results] == [
+            f"SN{n}" for n in range(200)
+        ] + ["FAIL"]
+        assert all(r.ok for r in results[:150])
+        assert results[0].records[0].is_owner
+        # the last chunk failed, the rest went through
+        assert all(not r.ok for r in results[150:])
+        assert len(server.requests) == 3
+
+
+class TestBulkEox:
+    @pytest.fixture
+    def server(self):
+        def by_pid(path, query):
+            pids = path.rsplit("/", 1)[1].split(",")
+            return 200, eox_page([eox_record(pid, pid) for pid in pids])
+
+        def by_release(path, query):
+            # every release matches the same two products, over two pages
+            page_index = int(path.split("/")[6])
+            inputs = [
+                f"{name}={value}"
+                for name, value in query.items()
+                if name.startswith("input")
+            ]
+            records = [
+                eox_record(pid, value)
+                for value in inputs
+                for pid in (f"PID-{page_index}", "PID-2")
+            ]
+            return 200, eox_page(records, page_index, 2)
+
+        with MockSupportServer() as server:
+            server.route("/supporttools/eox/rest/5/EOXByProductID/", by_pid)
+            server.route(
+                "/supporttools/eox/rest/5/EOXBySWReleaseString/", by_release
+            )
+            yield server
+
+    def make_api(self, server) -> CiscoSupportAPI:
+        return CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+
+    def test_bulk_by_product_ids(self, server):
+        pids = [f"PID-{n}" for n in range(45)] + ["PID-1 ", "15216-OADM1-35="]
+        results = list(
+            self.make_api(server).eox.bulk_by_product_ids(pids, ordered=True)
+        )
+        assert [r.identifier for r in results] == [
+            f"PID-{n}" for n in range(45)
+        ] + ["15216-OADM1-35="]
+        assert all(len(r.records) == 1 for r in results)
+        assert results[-1].records[0].eol_product_id == "15216-OADM1-35="
+        assert len(server.requests) == 3
+
+    def test_bulk_by_software_releases(self, server):
+        releases = [
+            SoftwareRelease(os=OSType.IOS, version=f"12.{n}")
+            for n in range(25)
+        ]
+        results = list(
+            self.make_api(server).eox.bulk_by_software_releases(
+                releases, ordered=True
+            )
+        )
+        assert [r.identifier for r in results] == [
+            f"12.{n},IOS" for n in range(25)
+        ]
+        # PID-2 came back on both pages, it is kept once
+        assert [
+            [record.eol_product_id for record in r.records] for r in results
+        ] == [["PID-1", "PID-2"]] * 25
+        assert len(server.requests) == 4
+
+
+def bugs(path, query):
+    time.sleep(0.01)
+    bug_ids = path.rsplit("/", 1)[1].split(",")
+    if "CSCfail" in bug_ids:
+        return 400, {"message": "bad request"}
+    return 200, {
+        "bugs": [
+            {
+                "id": bug_id,
+                "behavior_changed": "",
+                "bug_id": bug_id,
+                "headline": "",
+                "severity": "3",
+                "status": "O",
+                "last_modified_date": "",
+                "product": "",
+                "known_affected_releases": "",
+                "known_fixed_releases": "",
+                "support_case_count": "0",
+            }
+            for bug_id in bug_ids
+        ]
+    }
+
+
+class TestBulkBugDetails:
+    @pytest.fixture
+    def server(self):
+        with MockSupportServer() as server:
+            server.route("/bug/", bugs)
+            yield server
+
+    def make_api(self, server, **kwargs) -> CiscoSupportAPI:
+        return CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+            **kwargs,
+        )
+
+    def test_ordered(self, server):
+        bug_ids = [f"CSC{n:05}" for n in range(23)]
+        api = self.make_api(server)
+        found = api.bug.bulk_bug_details(bug_ids + bug_ids[:3], ordered=True)
+        assert [bug.bug_id for bug in found] == bug_ids
+        assert len(server.requests) == 5
+
+    def test_cached(self, server):
+        api = self.make_api(server, cache=MemoryCache())
+        list(api.bug.bulk_bug_details([f"CSC{n}" for n in range(10)]))
+        found = api.bug.bulk_bug_details([f"CSC{n}" for n in range(5, 15)])
+        assert sorted(bug.bug_id for bug in found) == sorted(
+            f"CSC{n}" for n in range(5, 15)
+        )
+        # only the 5 new IDs were requested, in one request
+        assert len(server.requests) == 3
+
+    def test_failure(self, server):
+        api = self.make_api(server)
+        with pytest.raises(ApiError):
+            list(api.bug.bulk_bug_details(["CSC1", "CSCfail"], ordered=True))
+
+
+def bug(bug_id: str, affected: str) -> dict:
+    return {
+        "id": bug_id,
+        "behavior_changed": "",
+        "bug_id": bug_id,
+        "headline": "",
+        "severity": "3",
+        "status": "O",
+        "last_modified_date": "",
+        "product": "",
+        "known_affected_releases": affected,
+        "known_fixed_releases": "",
+        "support_case_count": "0",
+    }
+
+
+class TestFleetBugs:
+    @pytest.fixture
+    def server(self):
+        def product_bugs(path, query):
+            parts = path.split("/")
+            base_pid, releases = parts[6], parts[8].split(",")
+            if base_pid == "FAIL":
+                return 400, {"message": "bad request"}
+            found = [
+                # the API lists releases without zero padding
+                bug(f"CSC-{base_pid}-{release}", release.replace("(0", "("))
+                for release in releases
+            ]
+            # a bug that lists none of the requested releases
+            found.append(bug(f"CSC-{base_pid}", "99.9"))
+            return 200, {"bugs": found}
+
+        with MockSupportServer() as server:
+            server.route("/bug/", product_bugs)
+            yield server
+
+    def test_index(self, server):
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+        devices = {
+            "edge-1": ("A", "15.2(03)E"),
+            "edge-2": ("A", "15.2(03)E"),
+            "core-1": ("A", "16.1"),
+            "lab-1": ("FAIL", "1.0"),
+        }
+        devices.update({f"b-{n}": ("B", f"{n}.0") for n in range(80)})
+        fleet = api.bug.get_bugs_for_fleet(devices)
+
+        assert fleet.devices["CSC-A-15.2(03)E"] == ["edge-1", "edge-2"]
+        assert fleet.devices["CSC-A-16.1"] == ["core-1"]
+        assert fleet.devices["CSC-A"] == ["edge-1", "edge-2", "core-1"]
+        assert fleet.devices["CSC-B-79.0"] == ["b-79"]
+        assert len(fleet.devices["CSC-B"]) == 80
+        assert fleet.bugs["CSC-A-16.1"].known_affected_releases == "16.1"
+        assert list(fleet.errors) == [("FAIL", "1.0")]
+        # A once, B in two requests of up to 75 releases, and FAIL
+        assert len(server.requests) == 4
+
+    def test_pairs(self, server):
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+        fleet = api.bug.get_bugs_for_fleet([("A", "1.0"), ("A", "1.0")])
+        assert fleet.devices["CSC-A-1.0"] == [("A", "1.0")]
+        assert len(server.requests) == 1
+
+    def test_release_spellings(self, server):
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+        fleet = api.bug.get_bugs_for_fleet(
+            {"a": ("A", "15.2(03)E"), "b": ("A", "15.2(3)E")}
+        )
+        # one release, sent once, affecting both devices
+        assert fleet.devices["CSC-A-15.2(03)E"] == ["a", "b"]
+        assert server.requests[0][0].endswith("/15.2(03)E")
+
+
+class TestBulkCases:
+    @pytest.fixture
+    def server(self):
+        def cases(path, query):
+            ids = path.split("/")[-1].split(",")
+            assert len(ids) <= 10
+            start = datetime.fromisoformat(query["date_created_from"])
+            end = datetime.fromisoformat(query["date_created_to"])
+            assert end - start <= timedelta(days=90)
+            # a case per contract, and one every contract shares
+            found = [
+                {"case_id": f"{contract}-{start:%Y%m%d}", "status": "Open"}
+                for contract in ids
+            ]
+            found.append({"case_id": f"shared-{start:%Y%m%d}"})
+            found.append({"case_id": "everywhere"})
+            return 200, {"cases": found}
+
+        with MockSupportServer() as server:
+            server.route("/case/", cases)
+            yield server
+
+    def test_windows(self, server):
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+        contracts = [str(n) for n in range(12)]
+        found = list(
+            api.case.bulk_cases_by_contract_id(
+                contracts + ["0"],
+                "2023-01-01T00:00:00Z",
+                "2023-12-31T00:00:00Z",
+            )
+        )
+        case_ids = [case.case_id for case in found]
+        assert len(case_ids) == len(set(case_ids))
+        # 2 chunks of contracts by 5 windows of up to 90 days
+        assert len(server.requests) == 10
+        assert len(case_ids) == 12 * 5 + 5 + 1
+        assert "11-20231227" in case_ids
+
+    def test_date_range_needs_start(self, server):
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+        with pytest.raises(ValueError):
+            list(
+                api.case.bulk_cases_by_user_id(
+                    ["user"], date_created_to="2023-01-01T00:00:00Z"
+                )
+            )
+
+    def test_details(self):
+        def details(path, query):
+            case_id = path.split("/")[-1]
+            if case_id == "fail":
+                return 404, {"message": "not found"}
+            return 200, {"caseDetail": {"case_id": case_id, "title": "t"}}
+
+        with MockSupportServer() as server:
+            server.route("/case/v3/cases/details/", details)
+            api = CiscoSupportAPI(
+                "DUMMY",
+                "DUMMY",
+                base_url=server.base_url,
+                token_url=server.token_url,
+            )
+            cases = [
+                "1",
+                Case(case_id="2", updated_date="2023-01-02T00:00:00Z"),
+                Case(case_id="3", updated_date="2023-02-01T00:00:00Z"),
+                "fail",
+                "1",
+            ]
+            last_updated = {
+                "2": "2023-01-02T00:00:00Z",
+                "3": "2023-01-03T00:00:00Z",
+            }
+            results = list(
+                api.case.bulk_case_details(cases, last_updated, ordered=True)
+            )
+            # case 2 has not changed since it was last fetched
+            assert [r.identifier for r in results] == ["1", "3", "fail"]
+            assert results[1].records[0].title == "t"
+            assert results[2].error is not None
+            assert len(server.requests) == 3
+
+
+def suggestions(path, query):
+    parts = path.split("/")
+    kind, ids = parts[-2], parts[-1].split(",")
+    if "FAIL" in ids:
+        return 500, {"message": "failed"}
+    products = [
+        {
+            "id": str(n),
+            "product": {
+                "basePID": i if kind == "productIds" else f"PID-{i}",
+                "mdfId": i if kind == "mdfIds" else f"MDF-{i}",
+                "productName": "",
+                "softwareType": "IOS XE Software",
+            },
+            "suggestions": [],
+        }
+        for n, i in enumerate(ids)
+    ]
+    return 200, {
+        "paginationResponseRecord": {
+            "title": "",
+            "pageIndex": 1,
+            "lastIndex": 1,
+            "totalRecords": len(products),
+            "pageRecords": len(products),
+            "selfLink": "",
+        },
+        "productList": products,
+        "status": "Success",
+        "errorDetailsResponse": None,
+    }
+
+
+class TestFleetSuggestions:
+    @pytest.fixture
+    def server(self):
+        with MockSupportServer() as server:
+            server.route("/software/suggestion/", suggestions)
+            yield server
+
+    def make_api(self, server, **kwargs) -> CiscoSupportAPI:
+        return CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+            **kwargs,
+        )
+
+    def test_fleet(self, server):
+        api = self.make_api(server, cache=MemoryCache())
+        devices = {f"device-{n}": f"PID-{n % 12}" for n in range(200)}
+        fleet = api.suggestion.get_suggestions_for_fleet(devices)
+        assert len(fleet.suggestions) == 12
+        assert len(fleet.devices) == 200
+        assert fleet.devices["device-13"][0].product.base_pid == "PID-1"
+        # 12 distinct PIDs, 10 per request
+        assert len(server.requests) == 2
+
+        fleet = api.suggestion.get_suggestions_for_fleet(
+            ["PID-1", "PID-12", "PID-13"]
+        )
+        assert fleet.devices["PID-13"][0].product.base_pid == "PID-13"
+        # only the PIDs not cached were requested
+        assert len(server.requests) == 3
+
+    def test_fleet_by_mdf_id(self, server):
+        api = self.make_api(server)
+        devices = {f"device-{n}": f"MDF-{n}" for n in range(10)}
+        # a failed request fails the IDs it carried, only
+        devices.update({"a": "MDF-1", "b": "FAIL"})
+        fleet = api.suggestion.get_suggestions_for_fleet_by_mdf_id(
+            devices, images=True
+        )
+        assert fleet.devices["a"][0].product.mdf_id == "MDF-1"
+        assert len(fleet.devices) == 11
+        assert list(fleet.errors) == ["FAIL"]
+        assert server.requests[0][0].split("/")[-3] == "software"
+
+    def test_compatible_for_fleet(self, server):
+        def compatible(path, query):
+            identifier = path.split("/")[-1]
+            if identifier == "FAIL":
+                return 400, {"message": "bad request"}
+            current = query.get("currentRelease")
+            release = {
+                "id": "1",
+                "isSuggested": True,
+                "releaseFormat1": f"{identifier}-{current}",
+                "releaseFormat2": "",
+                "releaseDate": "",
+                "majorRelease": "",
+                "releaseTrain": "",
+                "releaseLifeCycle": "",
+                "relDispName": "",
+                "trainDispName": "",
+                "images": None,
+                "errorDetailsResponse": None,
+            }
+            return 200, {
+                "paginationResponseRecord": {
+                    "title": "",
+                    "pageIndex": 1,
+                    "lastIndex": 1,
+                    "totalRecords": 1,
+                    "pageRecords": 1,
+                    "selfLink": "",
+                },
+                "suggestions": [release],
+                "status": "Success",
+                "errorDetailsResponse": None,
+            }
+
+        server.route(
+            "/software/suggestion/v2/suggestions/compatible/", compatible
+        )
+        api = self.make_api(server, cache=MemoryCache())
+        devices = {
+            f"device-{n}": (
+                "ASR-903",
+                None,
+                f" 17.{n % 2} ",
+                ["B", "A"] if n % 3 else ["A", "B", "A"],
+            )
+            for n in range(100)
+        }
+        devices["lab"] = ("FAIL",)
+        fleet = api.suggestion.get_compatible_for_fleet(devices)
+        assert len(fleet.devices) == 100
+        assert fleet.devices["device-3"][0].release_format1 == "ASR-903-17.1"
+        assert CompatibleQuery("ASR-903", None, "17.0", ("A", "B")) in (
+            fleet.releases
+        )
+        assert list(fleet.errors) == [CompatibleQuery("FAIL")]
+        # two distinct queries, and the failed one
+        assert len(server.requests) == 3
+
+        # a single lookup in another form is answered from the cache
+        found = api.suggestion.get_compatible_by_product_id(
+            "ASR-903", current_release="17.1", supported_features=["B", "A"]
+        )
+        assert [r.release_format1 for r in found] == ["ASR-903-17.1"]
+        assert len(server.requests) == 3
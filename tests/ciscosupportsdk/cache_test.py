@@ -0,0 +1,335 @@
+import threading
+import time
+
+import pytest
+from mockserver import MockSupportServer, eox_page, eox_record
+
+from ciscosupportsdk.api import CiscoSupportAPI
+from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.cache import (
+    CacheStats,
+    MemoryCache,
+    SqliteCache,
+    cache_key,
+    cached_entities,
+)
+from ciscosupportsdk.models.serialnumbertoinformation import CoverageStatus
+
+EOX_PATH = "/supporttools/eox/rest/5/EOXByProductID/1/WS-C3850-24P-E"
+CASE_PATH = "/case/v3/cases/details/case_id/1"
+
+
+def test_cache_key():
+    assert cache_key("/a", {"b": 1, "a": "x y", "c": None}) == "/a?a=x+y&b=1"
+    assert cache_key("/a", {}) == "/a"
+
+
+class TestMemoryCache:
+    def test_hit_and_miss(self):
+        cache = MemoryCache()
+        assert cache.get("a") is None
+        cache.set("a", {"value": 1}, 60)
+        assert cache.get("a") == {"value": 1}
+        assert cache.stats() == CacheStats(hits=1, misses=1)
+        assert cache.stats().hit_ratio == 0.5
+
+    def test_cached_copy(self):
+        cache = MemoryCache()
+        cache.set("a", {"value": 1}, 60)
+        cache.get("a")["value"] = 2
+        assert cache.get("a") == {"value": 1}
+
+    def test_expiry(self):
+        cache = MemoryCache()
+        cache.set("a", {"value": 1}, 0.01)
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert cache.stats().evictions == 1
+        assert len(cache) == 0
+
+    def test_size_eviction(self):
+        cache = MemoryCache(max_bytes=50)
+        cache.set("a", {"value": "a" * 10}, 60)
+        cache.set("b", {"value": "b" * 10}, 60)
+        cache.get("a")
+        cache.set("c", {"value": "c" * 10}, 60)
+        # b was the least recently used
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats().evictions == 1
+        assert cache.size <= 50
+
+    def test_errors_not_cached(self):
+        cache = MemoryCache()
+        cache.set("a", {"APIError": "oops"}, 60)
+        cache.set("b", {"EOXError": {"ErrorID": "1"}}, 60)
+        assert len(cache) == 0
+
+    def test_ttls(self):
+        cache = MemoryCache(ttls={"eox": 5, "bug": 0, "case": 10})
+        assert cache.ttl(EOX_PATH) == 5
+        assert cache.ttl("/bug/v2.0/bugs/keyword/x") is None
+        assert cache.ttl(CASE_PATH) == 10
+        assert MemoryCache().ttl(CASE_PATH) is None
+
+
+class TestSqliteCache:
+    def test_shared(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        SqliteCache(path).set("a", {"value": 1}, 60)
+        cache = SqliteCache(path)
+        assert cache.get("a") == {"value": 1}
+        assert cache.stats() == CacheStats(hits=1)
+
+    def test_expiry(self, tmp_path):
+        cache = SqliteCache(str(tmp_path / "cache.db"))
+        cache.set("a", {"value": 1}, 0.01)
+        cache.set("b", {"value": 1}, 0.01)
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert cache.purge() == 1
+        assert cache.stats().evictions == 2
+
+    def test_threads(self, tmp_path):
+        cache = SqliteCache(str(tmp_path / "cache.db"))
+
+        def work(n):
+            cache.set(str(n), {"value": n}, 60)
+            assert cache.get(str(n)) == {"value": n}
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert cache.stats().hits == 8
+
+
+def test_cached_entities_mismatched_key():
+    fetched = []
+
+    def fetch(ids):
+        fetched.append(ids)
+        # the service answers for the serial upper-cased
+        return [
+            CoverageStatus(
+                sr_no=i.upper(), is_covered=True, coverage_end_date=""
+            )
+            for i in ids
+        ]
+
+    cache = MemoryCache()
+    for _ in range(2):
+        records = cached_entities(
+            cache,
+            "/sn2info/v2/coverage/status/serial_numbers",
+            ["fhk123"],
+            CoverageStatus,
+            fetch,
+            lambda record: record.serial_number,
+        )
+        assert [r.serial_number for r in records] == ["FHK123"]
+    # the identifier was not remembered as having no data
+    assert len(fetched) == 2
+
+
+class TestSessionCache:
+    @pytest.fixture
+    def server(self):
+        with MockSupportServer() as server:
+            server.json("/supporttools/", {"EOXRecord": []})
+            server.json("/case/", {"RESPONSE": {}})
+            yield server
+
+    def make_session(self, server, cache) -> ApiSession:
+        return ApiSession(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+            cache=cache,
+        )
+
+    def test_cached(self, server):
+        cache = MemoryCache()
+        session = self.make_session(server, cache)
+        for _ in range(3):
+            assert session._get(EOX_PATH, {"responseencoding": "json"}) == {
+                "EOXRecord": []
+            }
+        assert len(server.requests) == 1
+        assert cache.stats() == CacheStats(hits=2, misses=1)
+
+    def test_shared_between_sessions(self, server):
+        cache = MemoryCache()
+        self.make_session(server, cache)._get(EOX_PATH, {})
+        self.make_session(server, cache)._get(EOX_PATH, {})
+        assert len(server.requests) == 1
+
+    def test_uncached_family(self, server):
+        session = self.make_session(server, MemoryCache())
+        session._get(CASE_PATH, {})
+        session._get(CASE_PATH, {})
+        assert len(server.requests) == 2
+
+
+def coverage(path, query):
+    serials = path.rsplit("/", 1)[1].split(",")
+    return 200, {
+        "serial_numbers": [
+            {
+                "sr_no": serial,
+                "is_covered": serial != "UNCOVERED",
+                "coverage_end_date": "",
+            }
+            for serial in serials
+            # an unknown serial has no record
+            if serial != "UNKNOWN"
+        ]
+    }
+
+
+def eox_records(path, query):
+    records = [
+        (
+            eox_record(pid, pid)
+            if pid != "UNKNOWN"
+            else eox_record("", pid, EOXError={"ErrorID": "SSA_ERR_026"})
+        )
+        for pid in path.rsplit("/", 1)[1].split(",")
+    ]
+    return 200, eox_page(records)
+
+
+def case_summaries(path, query):
+    # the service's order, not the one the IDs were given in
+    case_ids = sorted(path.rsplit("/", 1)[1].split(","), reverse=True)
+    return 200, {
+        "cases": [{"case_id": case_id} for case_id in case_ids],
+        "count": len(case_ids),
+    }
+
+
+class TestEntityCache:
+    @pytest.fixture
+    def server(self):
+        with MockSupportServer() as server:
+            server.route("/sn2info/", coverage)
+            server.route("/supporttools/", eox_records)
+            server.route("/case/", case_summaries)
+            yield server
+
+    def make_api(self, server, cache=None) -> CiscoSupportAPI:
+        return CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+            cache=MemoryCache() if cache is None else cache,
+        )
+
+    def test_fetches_misses_only(self, server):
+        api = self.make_api(server)
+        list(api.serial_information.get_coverage_status(["A", "B"]))
+        statuses = api.serial_information.get_coverage_status(["C", "B", "A"])
+        assert [s.serial_number for s in statuses] == ["C", "B", "A"]
+        assert [path.rsplit("/", 1)[1] for path, _ in server.requests] == [
+            "A,B",
+            "C",
+        ]
+
+    def test_all_cached(self, server):
+        api = self.make_api(server)
+        list(api.serial_information.get_coverage_status(["A", "B"]))
+        list(api.serial_information.get_coverage_status(["B", "A", "B"]))
+        assert len(server.requests) == 1
+
+    def test_missing_records_are_refetched(self, server):
+        api = self.make_api(server, MemoryCache(negative_ttls={"sn2info": 0}))
+        list(api.serial_information.get_coverage_status(["A", "UNKNOWN"]))
+        statuses = api.serial_information.get_coverage_status(["UNKNOWN", "A"])
+        assert [s.serial_number for s in statuses] == ["A"]
+        assert server.requests[-1][0].endswith("/UNKNOWN")
+
+    def test_negative_cache(self, server):
+        cache = MemoryCache()
+        api = self.make_api(server, cache)
+        for _ in range(3):
+            statuses = api.serial_information.get_coverage_status(
+                ["UNKNOWN", "UNCOVERED", "A"]
+            )
+            assert [s.serial_number for s in statuses] == ["UNCOVERED", "A"]
+        assert len(server.requests) == 1
+        assert cache.stats().negative_hits == 4
+
+    def test_negative_ttl(self, server):
+        cache = MemoryCache(negative_ttls={"sn2info": 0.05})
+        api = self.make_api(server, cache)
+        list(api.serial_information.get_coverage_status(["UNKNOWN", "A"]))
+        time.sleep(0.1)
+        list(api.serial_information.get_coverage_status(["UNKNOWN", "A"]))
+        assert [path.rsplit("/", 1)[1] for path, _ in server.requests] == [
+            "UNKNOWN,A",
+            "UNKNOWN",
+        ]
+
+    def test_negative_ttl_same_batch(self, server):
+        # the batch response is not also cached under its URL, for the
+        # family's full TTL
+        cache = MemoryCache(negative_ttls={"eox": 0.05, "sn2info": 0.05})
+        api = self.make_api(server, cache)
+        for _ in range(2):
+            list(api.eox.get_by_product_ids(["UNKNOWN"]))
+            list(api.serial_information.get_coverage_status(["UNKNOWN"]))
+            time.sleep(0.2)
+        assert len(server.requests) == 4
+
+    def test_eox_error_records(self, server):
+        cache = MemoryCache(negative_ttls={"eox": 0.05})
+        api = self.make_api(server, cache)
+        records = list(api.eox.get_by_product_ids(["UNKNOWN", "PID-1"]))
+        assert records[0].eox_error.error_id == "SSA_ERR_026"
+        list(api.eox.get_by_product_ids(["UNKNOWN", "PID-1"]))
+        assert len(server.requests) == 1
+        time.sleep(0.1)
+        list(api.eox.get_by_product_ids(["UNKNOWN", "PID-1"]))
+        assert server.requests[-1][0].endswith("/UNKNOWN")
+
+    def test_records_round_trip(self, server, tmp_path):
+        cache = SqliteCache(str(tmp_path / "cache.db"))
+        api = self.make_api(server, cache)
+        fetched = list(api.eox.get_by_product_ids(["PID-1", "PID-2"]))
+        cached = list(
+            self.make_api(server, cache).eox.get_by_product_ids(
+                ["PID-2", "PID-1"]
+            )
+        )
+        assert cached == fetched[::-1]
+        assert len(server.requests) == 1
+
+    def test_sorted_case_summaries(self, server):
+        api = self.make_api(server, MemoryCache(ttls={"case": 60}))
+        for _ in range(2):
+            cases = api.case.get_case_summary(["1", "2"], sort_by=None)
+            assert [c.case_id for c in cases] == ["1", "2"]
+        assert len(server.requests) == 1
+        # a sorted lookup keeps the service's order
+        cases = api.case.get_case_summary(["1", "2"])
+        assert [c.case_id for c in cases] == ["2", "1"]
+        assert server.requests[-1][1]["sort_by"] == "UPDATED_DATE"
+
+    def test_without_cache(self, server):
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+        list(api.serial_information.get_coverage_status(["B", "A", "B"]))
+        list(api.serial_information.get_coverage_status(["B", "A", "B"]))
+        # repeated identifiers are not sent
+        assert [path.rsplit("/", 1)[1] for path, _ in server.requests] == [
+            "B,A",
+            "B,A",
+        ]
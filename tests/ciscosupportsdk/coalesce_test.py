@@ -0,0 +1,162 @@
+import threading
+import time
+
+import pytest
+from mockserver import MockSupportServer
+
+from ciscosupportsdk.api import CiscoSupportAPI
+from ciscosupportsdk.apisession import ApiSession, DeadlineExceededError
+from ciscosupportsdk.cache import MemoryCache
+from ciscosupportsdk.coalesce import Coalescer
+
+PATH = "/bug/v2.0/bugs/keyword/x"
+
+
+def run_threads(*targets) -> list:
+    results = [None] * len(targets)
+
+    def run(index, target):
+        try:
+            results[index] = target()
+        except Exception as error:
+            results[index] = error
+
+    threads = [
+        threading.Thread(target=run, args=(index, target))
+        for index, target in enumerate(targets)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def slow(body: dict, delay: float = 0.2):
+    def handler(path, query):
+        time.sleep(delay)
+        return 200, body
+
+    return handler
+
+
+@pytest.fixture
+def server():
+    with MockSupportServer() as server:
+        yield server
+
+
+def make_session(server, **kwargs) -> ApiSession:
+    return ApiSession(
+        "DUMMY",
+        "DUMMY",
+        base_url=server.base_url,
+        token_url=server.token_url,
+        **kwargs,
+    )
+
+
+class TestCoalescer:
+    def test_shared_result(self):
+        coalescer = Coalescer()
+        calls = []
+
+        def call():
+            calls.append(1)
+            time.sleep(0.1)
+            return object()
+
+        results = run_threads(*[lambda: coalescer.call("k", call)] * 4)
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert coalescer.shared == 3
+
+    def test_shared_error(self):
+        coalescer = Coalescer()
+
+        def call():
+            time.sleep(0.1)
+            raise ValueError("oops")
+
+        results = run_threads(*[lambda: coalescer.call("k", call)] * 3)
+        assert all(isinstance(result, ValueError) for result in results)
+        # nothing is left in flight
+        assert coalescer.call("k", lambda: 1) == 1
+
+
+class TestSessionCoalescing:
+    def test_identical_requests(self, server):
+        server.route("/bug/", slow({"bugs": []}))
+        session = make_session(server)
+        session._check_token()
+        results = run_threads(*[lambda: session._get(PATH, {"a": 1})] * 8)
+        assert results == [{"bugs": []}] * 8
+        assert len(server.requests) == 1
+
+    def test_different_params(self, server):
+        server.route("/bug/", slow({"bugs": []}))
+        session = make_session(server)
+        session._check_token()
+        run_threads(
+            lambda: session._get(PATH, {"a": 1}),
+            lambda: session._get(PATH, {"a": 2}),
+        )
+        assert len(server.requests) == 2
+
+    def test_disabled(self, server):
+        server.route("/bug/", slow({"bugs": []}))
+        session = make_session(server, coalesce=False)
+        session._check_token()
+        run_threads(*[lambda: session._get(PATH, {})] * 4)
+        assert len(server.requests) == 4
+
+    def test_waiter_deadline(self, server):
+        server.route("/bug/", slow({"bugs": []}, 0.5))
+        session = make_session(server)
+        session._check_token()
+
+        def waiter():
+            time.sleep(0.1)
+            return session._get(PATH, {}, time.monotonic() + 0.1)
+
+        results = run_threads(lambda: session._get(PATH, {}), waiter)
+        assert results[0] == {"bugs": []}
+        assert isinstance(results[1], DeadlineExceededError)
+
+
+class TestBatchDedupe:
+    def test_overlapping_batches(self, server):
+        def coverage(path, query):
+            time.sleep(0.2)
+            serials = path.rsplit("/", 1)[1].split(",")
+            return 200, {
+                "serial_numbers": [
+                    {"sr_no": s, "is_covered": True, "coverage_end_date": ""}
+                    for s in serials
+                ]
+            }
+
+        server.route("/sn2info/", coverage)
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+            cache=MemoryCache(),
+        )
+        api._session._check_token()
+        sn2info = api.serial_information
+
+        def batch(serials):
+            return lambda: [
+                s.serial_number for s in sn2info.get_coverage_status(serials)
+            ]
+
+        results = run_threads(batch(["A", "B"]), batch(["B", "C"]))
+        assert results == [["A", "B"], ["B", "C"]]
+        requested = [
+            serial
+            for path, _ in server.requests
+            for serial in path.rsplit("/", 1)[1].split(",")
+        ]
+        assert sorted(requested) == ["A", "B", "C"]
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mockserver import MockSupportServer
+
+from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.connection import ConnectionStats
+
+
+@pytest.fixture
+def server():
+    with MockSupportServer() as server:
+        server.json("/bug/", {"bugs": []})
+        yield server
+
+
+def make_session(server: MockSupportServer, **kwargs) -> ApiSession:
+    return ApiSession(
+        "DUMMY",
+        "DUMMY",
+        base_url=server.base_url,
+        token_url=server.token_url,
+        **kwargs,
+    )
+
+
+class TestConnectionPooling:
+    def test_connections_are_reused(self, server):
+        session = make_session(server)
+        for _ in range(5):
+            session._get("/bug/v2.0/bugs/keyword/x", {})
+        stats = session.connection_stats()["api"]
+        assert stats.created == 1
+        assert stats.reused == stats.requests - 1
+        assert stats.requests >= 6  # token request plus five gets
+
+    def test_keep_alive_disabled(self, server):
+        session = make_session(server, keep_alive=False)
+        for _ in range(3):
+            session._get("/bug/v2.0/bugs/keyword/x", {})
+        stats = session.connection_stats()["api"]
+        assert stats.reused == 0
+        assert stats.created == stats.requests
+
+    def test_pool_is_sized_for_workers(self, server):
+        session = make_session(server, page_workers=16)
+        adapter = session.client.get_adapter(server.base_url + "/")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
+
+    def test_blocking_pool_caps_connections(self, server):
+        session = make_session(server, pool_maxsize=2, pool_block=True)
+        with ThreadPoolExecutor(8) as pool:
+            list(
+                pool.map(
+                    lambda _: session._get("/bug/v2.0/bugs/keyword/x", {}),
+                    range(40),
+                )
+            )
+        assert session.connection_stats()["api"].created <= 2
+
+    def test_stats_add(self):
+        total = ConnectionStats(3, 1) + ConnectionStats(2, 2)
+        assert total == ConnectionStats(5, 3)
+        assert total.reused == 2
@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+TOKEN_PATH = "/oauth2/default/v1/token"
+
+# handler(path, query) -> (status, body) or (status, body, headers)
+Route = Callable[[str, dict], tuple]
+
+
+def eox_record(pid: str, input_value: str, **fields) -> dict:
+    """An EoX record, as returned by the EoX API."""
+    date = {"value": "", "dateFormat": "YYYY-MM-DD"}
+    return {
+        "EOLProductID": pid,
+        "ProductIDDescription": "",
+        "ProductBulletinNumber": "",
+        "LinkToProductBulletinURL": "",
+        "EOXExternalAnnouncementDate": date,
+        "EndOfSaleDate": date,
+        "EndOfSWMaintenanceReleases": date,
+        "EndOfRoutineFailureAnalysisDate": date,
+        "EndOfServiceContractRenewal": date,
+        "LastDateOfSupport": date,
+        "EndOfSvcAttachDate": date,
+        "UpdatedTimeStamp": date,
+        "EOXMigrationDetails": {
+            "PIDActiveFlag": "Y",
+            "MigrationInformation": "",
+            "MigrationOption": "",
+            "MigrationProductId": "",
+            "MigrationProductName": "",
+            "MigrationStrategy": "",
+            "MigrationProductInfoURL": "",
+        },
+        "EOXInputType": "",
+        "EOXInputValue": input_value,
+        **fields,
+    }
+
+
+def eox_page(records: list, page_index: int = 1, last_index: int = 1) -> dict:
+    """A page of an EoX response."""
+    return {
+        "PaginationResponseRecord": {
+            "PageIndex": page_index,
+            "LastIndex": last_index,
+            "TotalRecords": len(records),
+            "PageRecords": len(records),
+        },
+        "EOXRecord": records,
+    }
+
+
+class MockSupportServer(object):
+    """A local stand in for apix.cisco.com and id.cisco.com.
+
+    Routes are matched on the longest registered path prefix, every
+    request received is kept in ``requests`` as ``(path, query)``.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, Route] = {}
+        self.requests: list[tuple[str, dict]] = []
+        self.token_requests = 0
+        # seconds the token endpoint takes to answer
+        self.token_delay = 0.0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def token_url(self) -> str:
+        return f"{self.base_url}{TOKEN_PATH}"
+
+    def route(self, prefix: str, handler: Route) -> None:
+        self.routes[prefix] = handler
+
+    def json(self, prefix: str, body: dict, status: int = 200) -> None:
+        self.route(prefix, lambda path, query: (status, body))
+
+    def _handle(self, path: str, query: dict) -> tuple:
+        if path == TOKEN_PATH:
+            with self._lock:
+                self.token_requests += 1
+            time.sleep(self.token_delay)
+            return (
+                200,
+                {
+                    "access_token": "DUMMY",
+                    "token_type": "Bearer",
+                    "expires_in": 3600,
+                },
+            )
+        with self._lock:
+            self.requests.append((path, query))
+        for prefix in sorted(self.routes, key=len, reverse=True):
+            if path.startswith(prefix):
+                return self.routes[prefix](path, query)
+        return 404, {"message": f"no route for {path}"}
+
+    def __enter__(self) -> "MockSupportServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self):
+                url = urlsplit(self.path)
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                result = server._handle(url.path, query)
+                status, body = result[:2]
+                headers = result[2] if len(result) > 2 else {}
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._reply()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                self._reply()
+
+            def log_message(self, *args):
+                pass
+
+            def handle(self):
+                # clients that timed out and hung up are not an error
+                try:
+                    super().handle()
+                except ConnectionError:
+                    pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        # keep-alive connections must not hold up shutdown
+        self._server.daemon_threads = True
+        self._server.block_on_close = False
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        ).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,403 @@
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+import yaml
+from mockserver import MockSupportServer, eox_page, eox_record
+
+from ciscosupportsdk.api.eox import EoxApi
+from ciscosupportsdk.api.serviceorderreturn import (
+    ServiceOrderReturnApi,
+    latest_rma_date,
+)
+from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.bulk import split_dates
+from ciscosupportsdk.models.bug import ListOfBugs
+from ciscosupportsdk.pagination import Page, paginate
+
+
+def stack_depth() -> int:
+    depth, frame = 0, sys._getframe()
+    while frame is not None:
+        depth, frame = depth + 1, frame.f_back
+    return depth
+
+
+def bug_page(page_index: int, last_index: int) -> dict:
+    return {
+        "pagination_response_record": {
+            "title": "bugs",
+            "page_index": page_index,
+            "last_index": last_index,
+            "total_records": last_index,
+            "page_records": 1,
+            "self_link": "",
+        },
+        "bugs": [
+            {
+                "id": str(page_index),
+                "behavior_changed": "",
+                "bug_id": f"CSC{page_index:08d}",
+                "headline": "",
+                "severity": "3",
+                "status": "O",
+                "last_modified_date": "",
+                "product": "",
+                "known_affected_releases": "",
+                "known_fixed_releases": "",
+                "support_case_count": "0",
+            }
+        ],
+    }
+
+
+def rma_users_page(page_index: int, last_index: int) -> dict:
+    return {
+        "OrderList": {
+            "APIPagination": {
+                "title": "",
+                "pageIndex": page_index,
+                "lastIndex": last_index,
+                "totalRecords": last_index,
+                "pageRecords": 1,
+                "selfLink": "",
+            },
+            "users": [
+                {
+                    "userId": f"user{page_index}",
+                    "returnCount": "0",
+                    "returns": [],
+                }
+            ],
+        }
+    }
+
+
+def rma_record(rma_no: int, order_date: date) -> dict:
+    # the recorded RMA, renumbered and redated
+    cassette = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "cassettes",
+        "rma_test",
+        "TestRmaApi.test_rma_details.yaml",
+    )
+    with open(cassette) as f:
+        interactions = yaml.safe_load(f)["interactions"]
+    body = interactions[-1]["response"]["body"]["string"]
+    record = json.loads(body)["returns"]["RmaRecord"][0]
+    return {**record, "rmaNo": rma_no, "orderDate": order_date.isoformat()}
+
+
+def rma_history_page(path: str, query: dict) -> tuple:
+    # an RMA per day of the range, and one ordered in every range, ten
+    # RMAs a page
+    start = date.fromisoformat(query["fromDate"])
+    end = date.fromisoformat(query["toDate"])
+    assert (end - start).days < 30
+    template = rma_record(0, start)
+    rmas = [{**template, "rmaNo": 1}]
+    day = start
+    while day <= end:
+        rmas.append(
+            {**template, "rmaNo": day.toordinal(), "orderDate": str(day)}
+        )
+        day += timedelta(days=1)
+    page_index = int(query["pageIndex"])
+    first = (page_index - 1) * 10
+    return 200, {
+        "OrderList": {
+            "APIPagination": {
+                "title": "",
+                "pageIndex": page_index,
+                "lastIndex": (len(rmas) + 9) // 10,
+                "totalRecords": len(rmas),
+                "pageRecords": 10,
+                "selfLink": "",
+            },
+            "users": [
+                {
+                    "userId": "me",
+                    "returnCount": str(len(rmas)),
+                    "returns": rmas[first : first + 10],  # noqa: E203
+                }
+            ],
+        }
+    }
+
+
+def eox_dates_page(path: str, query: dict) -> tuple:
+    # a product per day of the range, and one matching every range, two
+    # records a page
+    parts = path.split("/")
+    page_index = int(parts[6])
+    start, end = date.fromisoformat(parts[7]), date.fromisoformat(parts[8])
+    records = [eox_record("SHARED", "")]
+    day = start
+    while day <= end:
+        records.append(eox_record(f"P-{day:%Y%m%d}", ""))
+        day += timedelta(days=1)
+    last_index = (len(records) + 1) // 2
+    first = (page_index - 1) * 2
+    page = records[first : first + 2]  # noqa: E203
+    return 200, eox_page(page, page_index, last_index)
+
+
+@pytest.fixture
+def server():
+    with MockSupportServer() as server:
+        yield server
+
+
+def make_session(server: MockSupportServer) -> ApiSession:
+    return ApiSession(
+        "DUMMY",
+        "DUMMY",
+        base_url=server.base_url,
+        token_url=server.token_url,
+    )
+
+
+class TestPaginate:
+    def test_stack_depth_is_constant(self):
+        depths = []
+
+        def fetch_page(page_index: int) -> Page:
+            depths.append(stack_depth())
+            return Page([page_index], page_index, 2000)
+
+        # more pages than the recursion limit allows frames
+        items = list(paginate(fetch_page))
+        assert items == list(range(1, 2001))
+        assert len(set(depths)) == 1
+
+    def test_unpaged_response(self):
+        calls = []
+
+        def fetch_page(page_index: int) -> Page:
+            calls.append(page_index)
+            return Page.from_record([1, 2], None)
+
+        assert list(paginate(fetch_page)) == [1, 2]
+        assert calls == [1]
+
+    def test_parallel_ordered(self):
+        lock = threading.Lock()
+        running, peak = [0], [0]
+
+        def fetch_page(page_index: int) -> Page:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            # later pages come back first
+            time.sleep(0.001 * (40 - page_index))
+            with lock:
+                running[0] -= 1
+            return Page([page_index], page_index, 40)
+
+        items = list(paginate(fetch_page, max_workers=4))
+        assert items == list(range(1, 41))
+        assert 1 < peak[0] <= 4
+
+    def test_parallel_unordered(self):
+        def fetch_page(page_index: int) -> Page:
+            time.sleep(0.001 * (20 - page_index))
+            return Page([page_index], page_index, 20)
+
+        items = list(paginate(fetch_page, max_workers=4, ordered=False))
+        assert sorted(items) == list(range(1, 21))
+
+    def test_parallel_close_cancels_pages(self):
+        fetched = []
+
+        def fetch_page(page_index: int) -> Page:
+            fetched.append(page_index)
+            time.sleep(0.01)
+            return Page([page_index], page_index, 500)
+
+        items = paginate(fetch_page, max_workers=2)
+        assert [next(items) for _ in range(3)] == [1, 2, 3]
+        items.close()
+        time.sleep(0.05)
+        assert len(fetched) < 20
+
+    def test_parallel_error(self):
+        def fetch_page(page_index: int) -> Page:
+            if page_index == 3:
+                raise ValueError("page 3")
+            return Page([page_index], page_index, 10)
+
+        with pytest.raises(ValueError):
+            list(paginate(fetch_page, max_workers=3))
+
+    def test_prefetch_next_page(self):
+        fetched = []
+
+        def fetch_page(page_index: int) -> Page:
+            fetched.append(page_index)
+            return Page([page_index, page_index], page_index, 10)
+
+        items = paginate(fetch_page, prefetch=1)
+        assert next(items) == 1
+        # page 2 is fetched while page 1 is being consumed, no further
+        time.sleep(0.05)
+        assert fetched == [1, 2]
+        assert next(items) == 1
+        assert next(items) == 2
+        time.sleep(0.05)
+        assert fetched == [1, 2, 3]
+        items.close()
+        time.sleep(0.05)
+        assert fetched == [1, 2, 3]
+
+    def test_prefetch_all_pages(self):
+        def fetch_page(page_index: int) -> Page:
+            return Page([page_index], page_index, 25)
+
+        items = list(paginate(fetch_page, prefetch=3))
+        assert items == list(range(1, 26))
+
+    def test_enumerate_results(self, server):
+        server.route(
+            "/bug/v2.0/bugs/keyword/",
+            lambda path, query: (200, bug_page(int(query["page_index"]), 5)),
+        )
+        session = make_session(server)
+        params = {"status": "O"}
+        bugs = list(
+            session.enumerate_results(
+                ListOfBugs, "/bug/v2.0/bugs/keyword/x", params
+            )
+        )
+        assert [b.id for b in bugs] == ["1", "2", "3", "4", "5"]
+        # the callers query parameters are left alone
+        assert params == {"status": "O"}
+
+    def test_enumerate_results_parallel(self, server):
+        server.route(
+            "/bug/v2.0/bugs/keyword/",
+            lambda path, query: (200, bug_page(int(query["page_index"]), 9)),
+        )
+        session = make_session(server)
+        bugs = session.enumerate_results(
+            ListOfBugs, "/bug/v2.0/bugs/keyword/x", max_workers=3
+        )
+        assert [b.id for b in bugs] == [str(i) for i in range(1, 10)]
+
+    def test_enumerate_results_prefetch(self, server):
+        server.route(
+            "/bug/v2.0/bugs/keyword/",
+            lambda path, query: (200, bug_page(int(query["page_index"]), 4)),
+        )
+        session = make_session(server)
+        session.prefetch_pages = 1
+        bugs = session.enumerate_results(
+            ListOfBugs, "/bug/v2.0/bugs/keyword/x"
+        )
+        assert [b.id for b in bugs] == ["1", "2", "3", "4"]
+
+    def test_rma_by_user_pages(self, server):
+        server.route(
+            "/return/v1.0/returns/users/user_ids/",
+            lambda path, query: (
+                200,
+                rma_users_page(int(query["pageIndex"]), 3),
+            ),
+        )
+        session = make_session(server)
+        users = list(
+            ServiceOrderReturnApi(session).get_rma_details_by_user_id("me")
+        )
+        assert [u.user_id for u in users] == ["user1", "user2", "user3"]
+        assert len(server.requests) == 3
+
+    def test_eox_by_date_windows(self, server):
+        server.route("/supporttools/eox/", eox_dates_page)
+        eox = EoxApi(make_session(server))
+        records = list(
+            eox.get_by_dates(
+                "2023-01-01",
+                date(2023, 1, 31),
+                [],
+                max_workers=2,
+                window_pages=3,
+            )
+        )
+        products = sorted(r.eol_product_id for r in records)
+        assert products == sorted(
+            ["SHARED"] + [f"P-202301{day:02}" for day in range(1, 32)]
+        )
+        # both 15 day windows were split, no window ran past 3 pages
+        assert max(int(path.split("/")[6]) for path, _ in server.requests) <= 3
+
+    def test_eox_by_date_windows_bounded(self, server):
+        server.route("/supporttools/eox/", eox_dates_page)
+        eox = EoxApi(make_session(server))
+        records = eox.get_by_dates(
+            "2023-01-01",
+            "2023-12-31",
+            [],
+            max_workers=2,
+            window_pages=200,
+        )
+        assert len([next(records) for _ in range(5)]) == 5
+        time.sleep(0.5)
+        # 184 pages to the year, at most 4 are fetched ahead
+        assert len(server.requests) <= 8
+        records.close()
+
+    def test_rma_history(self, server):
+        server.route("/return/v1.0/returns/users/", rma_history_page)
+        rma = ServiceOrderReturnApi(make_session(server))
+        start, end = date(2023, 1, 1), date(2023, 3, 31)
+        rmas = list(rma.get_rma_history("me", start, end, page_workers=2))
+        days = [start + timedelta(days=n) for n in range(90)]
+        assert [r.rma_no for r in rmas] == [1] + [d.toordinal() for d in days]
+        assert latest_rma_date(rmas) == end
+        # three 30 day windows of 4 pages each
+        assert len(server.requests) == 12
+
+        server.requests.clear()
+        rmas = list(rma.get_rma_history("me", start, end, since=end))
+        assert [r.rma_no for r in rmas] == [1, end.toordinal()]
+        assert len(server.requests) == 1
+
+    def test_rma_history_since_long_gap(self, server):
+        server.route("/return/v1.0/returns/users/", rma_history_page)
+        rma = ServiceOrderReturnApi(make_session(server))
+        end = date(2023, 3, 31)
+        since = end - timedelta(days=45)
+        rmas = list(rma.get_rma_history("me", to_date=end, since=since))
+        days = [since + timedelta(days=n) for n in range(46)]
+        # the whole gap is pulled, not just the last 30 days
+        assert [r.rma_no for r in rmas] == [1] + [d.toordinal() for d in days]
+
+
+def test_split_dates():
+    start = date(2023, 1, 1)
+    assert split_dates(start, date(2023, 1, 10), 3) == [
+        (date(2023, 1, 1), date(2023, 1, 3)),
+        (date(2023, 1, 4), date(2023, 1, 6)),
+        (date(2023, 1, 7), date(2023, 1, 10)),
+    ]
+    assert split_dates(start, start, 4) == [(start, start)]
+
+
+def test_pagination_benchmark_runs(capsys):
+    path = os.path.join(
+        os.path.dirname(__file__),
+        os.pardir,
+        os.pardir,
+        "benchmarks",
+        "pagination_benchmark.py",
+    )
+    spec = importlib.util.spec_from_file_location("pagination_benchmark", path)
+    benchmark = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(benchmark)
+    benchmark.run(3, 2)
+    assert "pages: 3, records: 6" in capsys.readouterr().out
@@ -0,0 +1,155 @@
+import os
+import time
+
+import pytest
+from mockserver import MockSupportServer
+
+from ciscosupportsdk.api import CiscoSupportAPI
+from ciscosupportsdk.apisession import ApiError
+from ciscosupportsdk.productmap import ProductMap
+
+
+def products(path, query):
+    parts = path.split("/")
+    kind, product_ids = parts[4], parts[5].split(",")
+    assert len(product_ids) <= 5
+    if "FAIL" in product_ids:
+        return 400, {"message": "bad request"}
+    if kind == "product_ids_mdf":
+        found = [
+            {
+                "id": str(n),
+                "product_id": pid,
+                "product_name": pid,
+                "product_name_mdf": f"mdf-{pid}",
+                "product_series": "",
+                "product_series_mdf": "",
+            }
+            for n, pid in enumerate(product_ids)
+            if pid != "UNKNOWN"
+        ]
+    else:
+        found = [
+            {
+                "id": str(n),
+                "product_id": pid,
+                "product_name": pid,
+                "product_type": "",
+                "product_series": "",
+                "product_category": "",
+                "product_subcategory": "",
+                "release_date": "",
+                "orderable_status": "",
+                "dimensions": {
+                    "dimensions_format": "",
+                    "dimensions_value": "",
+                },
+                "weight": "",
+                "form_factor": "",
+                "product_support_page": "",
+                "visio_stencil_url": "",
+                "rich_media_urls": {
+                    "large_image_url": "",
+                    "small_image_url": "",
+                },
+            }
+            for n, pid in enumerate(product_ids)
+        ]
+    return 200, {"product_list": found}
+
+
+class TestProductMap:
+    @pytest.fixture
+    def server(self):
+        with MockSupportServer() as server:
+            server.route("/product/", products)
+            yield server
+
+    def make_map(self, server, path, **kwargs) -> ProductMap:
+        api = CiscoSupportAPI(
+            "DUMMY",
+            "DUMMY",
+            base_url=server.base_url,
+            token_url=server.token_url,
+        )
+        return ProductMap(api.product_information, path, **kwargs)
+
+    def test_lookup(self, server, tmp_path):
+        path = str(tmp_path / "products.db")
+        products = self.make_map(server, path)
+        pids = [f"PID-{n}" for n in range(12)] + ["UNKNOWN", "PID-0 "]
+        found = products.mdf.lookup(pids)
+        assert list(found) == pids[:-1]
+        assert found["PID-11"][0].product_name_mdf == "mdf-PID-11"
+        assert found["UNKNOWN"] == []
+        # 13 product IDs, 5 per request
+        assert len(server.requests) == 3
+
+        # known product IDs, unknown ones included, cost no request
+        assert products.mdf.get("UNKNOWN") == []
+        assert products.mdf.get("PID-3")[0].product_id == "PID-3"
+        assert len(server.requests) == 3
+
+        # the records persist for the next process
+        reloaded = self.make_map(server, path)
+        assert len(reloaded.mdf) == 13
+        assert reloaded.mdf.get("PID-5")[0].product_name_mdf == "mdf-PID-5"
+        assert len(reloaded.info) == 0
+        assert reloaded.info.get("PID-5")[0].product_name == "PID-5"
+        assert len(server.requests) == 4
+
+    def test_lazy_load(self, server, tmp_path):
+        path = str(tmp_path / "products.db")
+        self.make_map(server, path)
+        assert not os.path.exists(path)
+
+    def test_stale(self, server, tmp_path):
+        path = str(tmp_path / "products.db")
+        products = self.make_map(server, path, max_age=0.5)
+        products.mdf.lookup(["A", "B"])
+        assert products.mdf.refresh() == 0
+        time.sleep(0.6)
+        assert products.mdf.refresh() == 2
+        assert len(server.requests) == 2
+        products.mdf.get("A")
+        assert products.mdf.refresh(force=True) == 2
+        assert len(server.requests) == 3
+
+    def test_negative_max_age(self, server, tmp_path):
+        path = str(tmp_path / "products.db")
+        products = self.make_map(server, path, negative_max_age=0.5)
+        products.mdf.lookup(["A", "UNKNOWN"])
+        assert products.mdf.refresh() == 0
+        time.sleep(0.6)
+        # only the product ID without records is looked up again
+        assert products.mdf.refresh() == 1
+        assert server.requests[-1][0].endswith("/UNKNOWN")
+
+    def test_stale_if_error(self, server, tmp_path):
+        path = str(tmp_path / "products.db")
+        products = self.make_map(server, path, max_age=0.5)
+        products.mdf.lookup(["FAI"])
+        time.sleep(0.6)
+        server.route("/product/", lambda path, query: (400, {}))
+        # stale records are served when they cannot be fetched again
+        assert products.mdf.get("FAI")[0].product_id == "FAI"
+        with pytest.raises(ApiError):
+            products.mdf.get("NEW")
+
+    def test_mismatched_key(self, server, tmp_path):
+        path = str(tmp_path / "products.db")
+
+        def upper_cased(path, query):
+            head, product_ids = path.rsplit("/", 1)
+            return products(f"{head}/{product_ids.upper()}", query)
+
+        server.route("/product/", upper_cased)
+        products_map = self.make_map(server, path)
+        assert products_map.mdf.get("c9300-48p") == []
+        # the record came back as C9300-48P, the absence of c9300-48p is
+        # not remembered
+        assert products_map.mdf.get("C9300-48P")[0].product_id == "C9300-48P"
+        reloaded = self.make_map(server, path)
+        assert len(reloaded.mdf) == 1
+        reloaded.mdf.get("c9300-48p")
+        assert len(server.requests) == 2
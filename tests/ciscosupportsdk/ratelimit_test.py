@@ -0,0 +1,139 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+import pytest
+from mockserver import MockSupportServer
+
+from ciscosupportsdk.apisession import ApiError, ApiSession
+from ciscosupportsdk.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+from ciscosupportsdk.services import api_family
+
+
+@pytest.fixture
+def server():
+    with MockSupportServer() as server:
+        yield server
+
+
+def make_session(server: MockSupportServer, **kwargs) -> ApiSession:
+    return ApiSession(
+        "DUMMY",
+        "DUMMY",
+        base_url=server.base_url,
+        token_url=server.token_url,
+        **kwargs,
+    )
+
+
+def throttle_first(count: int, retry_after: str = "0.1"):
+    calls = []
+
+    def handler(path, query):
+        calls.append(time.monotonic())
+        if len(calls) <= count:
+            return 429, {"message": "slow down"}, {"Retry-After": retry_after}
+        return 200, {"bugs": []}
+
+    return handler, calls
+
+
+class TestTokenBucket:
+    def test_paces_requests(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        # the first token is saved up, the other ten are paced
+        assert time.monotonic() - start >= 0.18
+
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, burst=5)
+        assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+        assert bucket.reserve() > 0.9
+
+    def test_pause(self):
+        bucket = TokenBucket(rate=1000, burst=10)
+        bucket.pause(0.2)
+        assert bucket.reserve() >= 0.19
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=100, burst=1)
+        start = time.monotonic()
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(lambda _: bucket.acquire(), range(21)))
+        assert time.monotonic() - start >= 0.19
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class TestRateLimiter:
+    def test_api_family(self):
+        assert api_family("/bug/v2.0/bugs/keyword/x") == "bug"
+        assert api_family("/supporttools/eox/rest/5/EOXByDates") == "eox"
+        assert api_family("/software/suggestion/v2/suggestions") == (
+            "suggestion"
+        )
+        assert api_family("/unknown") is None
+
+    def test_per_family_rates(self):
+        limiter = RateLimiter({"eox": 1}, burst=1)
+        assert limiter.reserve("/supporttools/eox/rest/5/x") == 0.0
+        assert limiter.reserve("/supporttools/eox/rest/5/x") > 0.9
+        # other families are not limited
+        assert limiter.bucket("/bug/v2.0/bugs") is None
+        assert limiter.reserve("/bug/v2.0/bugs") == 0.0
+
+    def test_default_rate(self):
+        limiter = RateLimiter(default_rate=10)
+        assert limiter.bucket("/case/v3/cases").rate == 10
+        assert limiter.bucket("/bug/v2.0") is not limiter.bucket("/case/v3")
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) == 1.0
+        assert parse_retry_after("garbage") == 1.0
+        later = formatdate(time.time() + 30, usegmt=True)
+        assert 25 < parse_retry_after(later) <= 30
+
+
+class TestThrottling:
+    def test_retry_after_429(self, server):
+        handler, calls = throttle_first(2)
+        server.route("/bug/", handler)
+        session = make_session(server)
+        assert session._get("/bug/v2.0/bugs/keyword/x", {}) == {"bugs": []}
+        assert len(calls) == 3
+        assert calls[1] - calls[0] >= 0.1
+
+    def test_limiter_holds_family_back(self, server):
+        handler, calls = throttle_first(1, "0.2")
+        server.route("/bug/", handler)
+        limiter = RateLimiter(default_rate=1000)
+        session = make_session(server, rate_limiter=limiter)
+        session._get("/bug/v2.0/bugs/keyword/x", {})
+        assert calls[1] - calls[0] >= 0.2
+        # bursting is over after a throttle, requests are paced again
+        assert limiter.bucket("/bug/").reserve() < 0.01
+
+    def test_family_without_bucket_waits(self, server):
+        handler, calls = throttle_first(1, "0.2")
+        server.route("/bug/", handler)
+        # the limiter paces EoX only, a bug 429 is waited out here
+        session = make_session(server, rate_limiter=RateLimiter({"eox": 5}))
+        session._get("/bug/v2.0/bugs/keyword/x", {})
+        assert calls[1] - calls[0] >= 0.2
+
+    def test_gives_up(self, server):
+        handler, calls = throttle_first(10, "0")
+        server.route("/bug/", handler)
+        session = make_session(server, throttle_retries=2)
+        with pytest.raises(ApiError):
+            session._get("/bug/v2.0/bugs/keyword/x", {})
+        assert len(calls) == 3
@@ -0,0 +1,168 @@
+import socket
+import time
+
+import pytest
+from mockserver import MockSupportServer
+
+from ciscosupportsdk.apisession import (
+    ApiError,
+    ApiSession,
+    DeadlineExceededError,
+)
+from ciscosupportsdk.models.bug import ListOfBugs
+from ciscosupportsdk.retry import RetryPolicy
+
+PATH = "/bug/v2.0/bugs/keyword/x"
+
+
+@pytest.fixture
+def server():
+    with MockSupportServer() as server:
+        yield server
+
+
+def make_session(server: MockSupportServer, **kwargs) -> ApiSession:
+    kwargs.setdefault("base_url", server.base_url)
+    return ApiSession("DUMMY", "DUMMY", token_url=server.token_url, **kwargs)
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("backoff_factor", 0.01)
+    return RetryPolicy(**kwargs)
+
+
+def failing(statuses: list):
+    """Answers with each status in turn, then with a 200."""
+    calls = []
+
+    def handler(path, query):
+        calls.append(path)
+        if len(calls) <= len(statuses):
+            return statuses[len(calls) - 1], {"message": "oops"}
+        return 200, {"bugs": []}
+
+    return handler, calls
+
+
+def closed_port() -> str:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return f"http://127.0.0.1:{port}"
+
+
+class TestRetryPolicy:
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+        assert [policy.backoff(n) for n in range(1, 5)] == [0.5, 1, 2, 3]
+
+    def test_jitter(self):
+        policy = RetryPolicy(backoff_factor=1, jitter=True)
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(50))
+
+    def test_idempotent_methods(self):
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.can_retry("get", 1)
+        assert not policy.can_retry("POST", 1)
+        assert not policy.can_retry("GET", 3)
+
+
+class TestRetries:
+    def test_recovers_from_server_errors(self, server):
+        handler, calls = failing([503, 502])
+        server.route("/bug/", handler)
+        session = make_session(server, retry_policy=fast_policy())
+        assert session._get(PATH, {}) == {"bugs": []}
+        assert len(calls) == 3
+
+    def test_gives_up(self, server):
+        handler, calls = failing([503] * 5)
+        server.route("/bug/", handler)
+        session = make_session(server, retry_policy=fast_policy())
+        with pytest.raises(ApiError) as error:
+            session._get(PATH, {})
+        assert error.value.status_code == 503
+        assert error.value.attempts == 3
+        assert error.value.retryable
+        assert not error.value.throttled
+        assert len(calls) == 3
+
+    def test_hard_failure_is_not_retried(self, server):
+        handler, calls = failing([400])
+        server.route("/bug/", handler)
+        session = make_session(server, retry_policy=fast_policy())
+        with pytest.raises(ApiError) as error:
+            session._get(PATH, {})
+        assert error.value.status_code == 400
+        assert error.value.attempts == 1
+        assert not error.value.retryable
+        assert len(calls) == 1
+
+    def test_throttled_error(self, server):
+        server.route("/bug/", lambda p, q: (429, {}, {"Retry-After": "0"}))
+        session = make_session(server, throttle_retries=1)
+        with pytest.raises(ApiError) as error:
+            session._get(PATH, {})
+        assert error.value.throttled
+        assert error.value.retry_after == 0
+        assert error.value.attempts == 2
+
+    def test_connection_errors(self, server):
+        session = make_session(
+            server, base_url=closed_port(), retry_policy=fast_policy()
+        )
+        with pytest.raises(ApiError) as error:
+            session._get(PATH, {})
+        assert error.value.status_code is None
+        assert error.value.attempts == 3
+        assert error.value.retryable
+
+    def test_read_timeout(self, server):
+        calls = []
+
+        def slow(path, query):
+            calls.append(path)
+            if len(calls) == 1:
+                time.sleep(0.5)
+            return 200, {"bugs": []}
+
+        server.route("/bug/", slow)
+        session = make_session(server, retry_policy=fast_policy(), timeout=0.1)
+        assert session._get(PATH, {}) == {"bugs": []}
+        assert len(calls) == 2
+
+    def test_deadline(self, server):
+        handler, calls = failing([503] * 10)
+        server.route("/bug/", handler)
+        policy = RetryPolicy(
+            max_attempts=10, backoff_factor=0.1, jitter=False, deadline=0.25
+        )
+        session = make_session(server, retry_policy=policy)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            session._get(PATH, {})
+        assert time.monotonic() - start < 0.25
+        assert len(calls) == 2
+
+    def test_deadline_covers_enumeration(self, server):
+        def page(path, query):
+            time.sleep(0.1)
+            index = int(query["page_index"])
+            return 200, {
+                "pagination_response_record": {
+                    "title": "",
+                    "page_index": index,
+                    "last_index": 10,
+                    "total_records": 0,
+                    "page_records": 0,
+                    "self_link": "",
+                },
+                "bugs": [],
+            }
+
+        server.route("/bug/", page)
+        session = make_session(server, retry_policy=fast_policy(deadline=0.35))
+        with pytest.raises(DeadlineExceededError):
+            list(session.enumerate_results(ListOfBugs, PATH))
+        assert len(server.requests) < 5
@@ -0,0 +1,116 @@
+import multiprocessing
+import os
+import stat
+import sys
+import time
+
+import pytest
+from mockserver import MockSupportServer
+
+from ciscosupportsdk.apisession import ApiSession
+from ciscosupportsdk.tokenstore import (
+    FileTokenStore,
+    MemoryTokenStore,
+    token_key,
+)
+
+PATH = "/bug/v2.0/bugs/keyword/x"
+
+
+@pytest.fixture
+def server():
+    with MockSupportServer() as server:
+        server.json("/bug/", {"bugs": []})
+        yield server
+
+
+def make_session(server, store) -> ApiSession:
+    return ApiSession(
+        "DUMMY",
+        "DUMMY",
+        base_url=server.base_url,
+        token_url=server.token_url,
+        token_store=store,
+    )
+
+
+def call_api(base_url: str, token_url: str, directory: str) -> None:
+    session = ApiSession(
+        "DUMMY",
+        "DUMMY",
+        base_url=base_url,
+        token_url=token_url,
+        token_store=FileTokenStore(directory),
+    )
+    session._get(PATH, {})
+
+
+class TestFileTokenStore:
+    def test_round_trip(self, tmp_path):
+        store = FileTokenStore(str(tmp_path))
+        assert store.load("key") is None
+        store.save("key", {"access_token": "a", "expires_at": 1})
+        assert store.load("key") == {"access_token": "a", "expires_at": 1}
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="posix modes")
+    def test_owner_only(self, tmp_path):
+        store = FileTokenStore(str(tmp_path))
+        store.save("key", {"access_token": "a"})
+        mode = os.stat(tmp_path / "key.json").st_mode
+        assert stat.S_IMODE(mode) == 0o600
+
+    def test_corrupt_file(self, tmp_path):
+        (tmp_path / "key.json").write_text("{not json")
+        assert FileTokenStore(str(tmp_path)).load("key") is None
+
+    def test_key_hides_client_id(self):
+        key = token_key("my-client-id", "https://id.example.com/token")
+        assert "my-client-id" not in key
+        assert key != token_key("other", "https://id.example.com/token")
+
+
+class TestSharedToken:
+    def test_sessions_share_a_token(self, server, tmp_path):
+        store = FileTokenStore(str(tmp_path))
+        for _ in range(3):
+            make_session(server, store)._get(PATH, {})
+        assert server.token_requests == 1
+
+    def test_memory_store(self, server):
+        store = MemoryTokenStore()
+        first = make_session(server, store)
+        second = make_session(server, store)
+        first._get(PATH, {})
+        second._get(PATH, {})
+        assert server.token_requests == 1
+        assert first.token["access_token"] == second.token["access_token"]
+
+    def test_expired_token_is_replaced(self, server, tmp_path):
+        store = FileTokenStore(str(tmp_path))
+        key = token_key("DUMMY", server.token_url)
+        store.save(key, {"access_token": "old", "expires_at": 1})
+        make_session(server, store)._get(PATH, {})
+        assert server.token_requests == 1
+        assert store.load(key)["expires_at"] > time.time()
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="needs fork",
+    )
+    def test_processes_share_a_token(self, server, tmp_path):
+        server.token_delay = 0.2
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(
+                target=call_api,
+                args=(server.base_url, server.token_url, str(tmp_path)),
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+        assert [worker.exitcode for worker in workers] == [0] * 4
+        assert server.token_requests == 1
+        assert len(server.requests) == 4